@@ -0,0 +1,116 @@
+from __future__ import annotations
+import base64
+import binascii
+import json
+from datetime import datetime
+from django.db.models import IntegerField, Q, Value
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.utils.urls import replace_query_param
+from .models import Course, Test
+from .serializers import TestSerializer
+from .values import ValuesSerializer
+
+# 시험/수업 통합 목록 (/api/activities)
+# - 두 테이블을 UNION ALL로 합쳐 한 번의 쿼리로 정렬된 페이지를 조회 (페이지 크기 + 1개로 다음 페이지 여부 확인)
+# - 키셋(cursor) 페이지네이션: 정렬 키, 종류(kind), id 순으로 정렬하고 마지막 항목 이후부터 조회
+#   종류는 쿼리마다 상수이므로 커서 조건을 각 테이블의 (정렬 키, id) 범위 조건으로 바꿔 인덱스 사용 (OFFSET 없음)
+
+# 종류 순서 = 정렬 시 동순위 구분 값
+ACTIVITY_TYPES = (("test", Test), ("course", Course))
+ORDERINGS = ("-created_at", "created_at", "-popularity", "popularity")
+DEFAULT_ORDERING = "-created_at"
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# 시험/수업의 목록 필드가 같으므로 시험 직렬화기 필드 정의로 두 테이블의 행을 변환
+catalog_values = ValuesSerializer.for_serializer(TestSerializer)
+
+
+def encode_cursor(ordering: str, row: dict, key: str) -> str:
+    value = row[key]
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([ordering, value, row["kind"], row["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, ordering: str, key: str) -> tuple:
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        cursor_ordering, value, kind, pk = json.loads(payload)
+        if key == "created_at":
+            value = datetime.fromisoformat(value)
+        if cursor_ordering != ordering or not isinstance(kind, int) or not isinstance(pk, int):
+            raise ValueError
+        if key == "popularity" and not isinstance(value, int):
+            raise ValueError
+    except (ValueError, TypeError, binascii.Error):
+        raise NotFound("Invalid cursor")
+    return value, kind, pk
+
+
+def after_cursor(kind: int, key: str, descending: bool, cursor: tuple) -> Q:
+    """정렬 순서상 커서 이후의 행 조건 (kind 종류 테이블 기준)"""
+    value, cursor_kind, cursor_id = cursor
+    op = "lt" if descending else "gt"
+    if kind == cursor_kind:
+        # (key, id) < (value, cursor_id): 앞의 key 범위 조건으로 (key, id) 인덱스 범위 탐색
+        return Q(**{f"{key}__{op}e": value}) & (Q(**{f"{key}__{op}": value}) | Q(**{f"id__{op}": cursor_id}))
+    # 같은 키 값이면 종류 순서로 앞뒤가 정해짐
+    kind_after = kind < cursor_kind if descending else kind > cursor_kind
+    return Q(**{f"{key}__{op}e" if kind_after else f"{key}__{op}": value})
+
+
+def get_page_size(request) -> int:
+    try:
+        page_size = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return DEFAULT_PAGE_SIZE
+    return min(max(page_size, 1), MAX_PAGE_SIZE)
+
+
+def get_activities_page(request) -> dict:
+    """
+    ?ordering= (-created_at|created_at|-popularity|popularity), ?type=test|course, ?status=available, ?cursor=
+    응답: {"next": 다음 페이지 URL 또는 null, "results": [...]}
+    """
+    ordering = request.query_params.get("ordering", DEFAULT_ORDERING)
+    if ordering not in ORDERINGS:
+        raise ValidationError({"ordering": f"{', '.join(ORDERINGS)} 중 하나여야 합니다."})
+    activity_type = request.query_params.get("type")
+    if activity_type and activity_type not in dict(ACTIVITY_TYPES):
+        raise ValidationError({"type": "test 또는 course만 사용할 수 있습니다."})
+    descending = ordering.startswith("-")
+    key = ordering.lstrip("-")
+    token = request.query_params.get("cursor")
+    cursor = decode_cursor(token, ordering, key) if token else None
+    page_size = get_page_size(request)
+
+    columns = list(dict.fromkeys([*catalog_values.columns, key, "id"]))
+    branches = []
+    for kind, (name, model) in enumerate(ACTIVITY_TYPES):
+        if activity_type and activity_type != name:
+            continue
+        queryset = model.objects.all()
+        if request.query_params.get("status") == "available":
+            now = timezone.now()
+            queryset = queryset.filter(start_at__lte=now, end_at__gte=now)
+        if cursor is not None:
+            queryset = queryset.filter(after_cursor(kind, key, descending, cursor))
+        branches.append(queryset.values(*columns).annotate(kind=Value(kind, output_field=IntegerField())))
+
+    queryset = branches[0].union(*branches[1:], all=True) if len(branches) > 1 else branches[0]
+    sign = "-" if descending else ""
+    rows = list(queryset.order_by(f"{sign}{key}", f"{sign}kind", f"{sign}id")[:page_size + 1])
+
+    next_url = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_url = replace_query_param(
+            request.build_absolute_uri(), "cursor", encode_cursor(ordering, rows[-1], key)
+        )
+    results = catalog_values.to_representation(rows)
+    for item, row in zip(results, rows):
+        item["type"] = ACTIVITY_TYPES[row["kind"]][0]
+    return {"next": next_url, "results": results}
@@ -0,0 +1,142 @@
+from __future__ import annotations
+import functools
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.exceptions import (
+    APIException,
+    AuthenticationFailed,
+    MethodNotAllowed,
+    NotAuthenticated,
+)
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from config.pagination import AsyncPageNumberPagination
+from .exceptions import custom_exception_handler
+from .models import Course
+from .serializers import CourseSerializer, PaymentDetailSerializer
+from .values import sparse_values_serializer
+from .viewsets import CourseViewSet, PaymentDetailViewSet, RecommendCoursesViewSet, TestViewSet
+
+
+def render_response(data, status_code: int = status.HTTP_200_OK, headers: dict | None = None) -> HttpResponse:
+    """DRF 기본 렌더러로 직렬화하여 동기 엔드포인트와 동일한 응답 본문 생성"""
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    response = HttpResponse(renderer.render(data), status=status_code, content_type=renderer.media_type)
+    for key, value in (headers or {}).items():
+        response[key] = value
+    return response
+
+
+async def serialize_and_render(serialize, instances, paginator) -> HttpResponse:
+    """
+    직렬화/JSON 렌더링(CPU 작업)을 이벤트 루프 밖의 스레드에서 수행
+    - serialize: 페이지 항목을 응답 데이터로 변환하는 함수
+    """
+    def work():
+        return render_response(paginator.get_paginated_data(serialize(instances)))
+
+    return await sync_to_async(work, thread_sensitive=False)()
+
+
+def async_api_view(view_class, action: str):
+    """
+    DRF 뷰셋과 같은 인증/권한/요청 제한/예외 처리를 적용하는 비동기 GET 전용 뷰 데코레이터
+    - view_class: 인증/권한/요청 제한과 필터/정렬 설정을 공유할 동기 뷰셋 (action: 해당 뷰셋의 action 이름)
+    - 인증(캐시 미스 시 사용자 조회)/권한/요청 제한(캐시 I/O)은 이벤트 루프가 아닌 동기 스레드에서 수행
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(request, *args, **kwargs):
+            view = build_view(view_class, action, args, kwargs)
+            drf_request = view.request = Request(request, authenticators=view.get_authenticators())
+            try:
+                if request.method != "GET":
+                    raise MethodNotAllowed(request.method)
+                await sync_to_async(check_request)(view, drf_request)
+                return await func(drf_request, view, *args, **kwargs)
+            except APIException as exc:
+                if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+                    exc.auth_header = view.get_authenticate_header(drf_request)
+                response = custom_exception_handler(exc, {"request": drf_request, "view": view})
+                headers = {k: v for k, v in response.items() if k.lower() != "content-type"}
+                return render_response(response.data, response.status_code, headers)
+
+        wrapper.csrf_exempt = True
+        return wrapper
+    return decorator
+
+
+def build_view(view_class, action: str, args=(), kwargs=None):
+    """동기 뷰셋의 권한/요청 제한/get_queryset/filter_queryset을 재사용하기 위한 뷰 인스턴스 생성"""
+    view = view_class(format_kwarg=None, action=action, args=args, kwargs=kwargs or {})
+    view.headers = {}
+    return view
+
+
+def check_request(view, request) -> None:
+    """APIView.initial()과 같은 순서로 인증 -> 권한 -> 요청 제한 검사"""
+    view.perform_authentication(request)
+    view.check_permissions(request)
+    view.check_throttles(request)
+
+
+async def catalog_list(request, view):
+    values_serializer = sparse_values_serializer(view.get_serializer_class(), request)
+    extra_values = view.get_extra_values()
+    # 쿼리셋 구성 중 태그 사전 적재(DB)가 있을 수 있으므로 동기 스레드에서 수행
+    queryset = await sync_to_async(
+        lambda: values_serializer.values(view.filter_queryset(view.get_queryset())).annotate(**extra_values)
+    )()
+    paginator = AsyncPageNumberPagination()
+    page = await paginator.apaginate_queryset(queryset, request)
+    # 관계 필드(태그) 조회는 직렬화 스레드가 아닌 DB 스레드에서 수행
+    page = await sync_to_async(values_serializer.prefetch)(page)
+    extra = tuple(extra_values)
+    return await serialize_and_render(lambda rows: values_serializer.to_representation(rows, extra), page, paginator)
+
+
+# 시험 목록 (GET /api/async/tests/)
+@async_api_view(TestViewSet, "list")
+async def test_list(request, view):
+    return await catalog_list(request, view)
+
+
+# 수업 목록 (GET /api/async/courses/)
+@async_api_view(CourseViewSet, "list")
+async def course_list(request, view):
+    return await catalog_list(request, view)
+
+
+# 내 결제 내역 (GET /api/async/me/payments)
+@async_api_view(PaymentDetailViewSet, "me")
+async def my_payments(request, view):
+    queryset = view.get_my_payments_queryset(request).select_related("target_content_type")
+    paginator = AsyncPageNumberPagination()
+    payments = await paginator.apaginate_queryset(queryset, request)
+
+    # 신청(GenericForeignKey)을 유형별로 한 번에 조회 (동기 엔드포인트와 같은 방식)
+    registrations = {}
+    for content_type_id, registrations_qs in view.get_registration_querysets(payments):
+        registrations.update({(content_type_id, reg.id): reg async for reg in registrations_qs})
+    data = view.build_payment_details(payments, registrations)
+    return await serialize_and_render(
+        lambda rows: PaymentDetailSerializer(rows, many=True).data, data, paginator
+    )
+
+
+# 태그 기반 수업 추천 (GET /api/async/courses/recommend)
+@async_api_view(RecommendCoursesViewSet, "recommend")
+async def recommend_courses(request, view):
+    values_serializer = sparse_values_serializer(CourseSerializer, request)
+    tag_ids = [tag_id async for tag_id in view.get_taken_tag_ids_queryset(request.user)]
+    if tag_ids:
+        queryset = values_serializer.values(view.get_recommended_queryset(request.user, tag_ids))
+    else:
+        queryset = Course.objects.none()
+    paginator = AsyncPageNumberPagination()
+    page = await paginator.apaginate_queryset(queryset, request)
+    # 관계 필드(태그) 조회는 직렬화 스레드가 아닌 DB 스레드에서 수행
+    page = await sync_to_async(values_serializer.prefetch)(page)
+    return await serialize_and_render(values_serializer.to_representation, page, paginator)
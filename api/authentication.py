@@ -1,11 +1,103 @@
 from __future__ import annotations
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import timedelta, timezone
+from functools import lru_cache
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.throttling import SimpleRateThrottle
 from rest_framework_simplejwt.views import TokenViewBase
 from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
 
+from config.throttling import TokenBucketThrottle
+from .exceptions import LoginBusyException
+
+
+class PasswordCheckPool:
+    """
+    비밀번호 해시 검증(PBKDF2)을 전담하는 크기 제한 스레드 풀
+    - 실행 중 + 대기 중인 작업이 workers + queue_size를 넘으면 즉시 거절(back-pressure)
+    - hashlib의 PBKDF2는 GIL을 해제하므로 스레드로도 병렬 처리됨
+    - 해시 알고리즘/반복 횟수 변경으로 재해시가 필요하면 새 해시 계산도 같은 작업 안에서 수행
+    """
+
+    def __init__(self, workers: int, queue_size: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # gunicorn 워커 fork 이후에 스레드를 생성하도록 지연 생성
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password-check"
+                    )
+        return self._executor
+
+    @staticmethod
+    def _check(password: str, encoded: str) -> tuple[bool, str | None]:
+        rehashed = []
+        valid = check_password(password, encoded, lambda raw: rehashed.append(make_password(raw)))
+        return valid, rehashed[0] if rehashed else None
+
+    def check(self, password: str, encoded: str) -> tuple[bool, str | None]:
+        """(비밀번호 일치 여부, 갱신할 새 해시 또는 None) 반환"""
+        if not self._slots.acquire(blocking=False):
+            raise LoginBusyException()
+
+        try:
+            future = self._get_executor().submit(self._check, password, encoded)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise LoginBusyException()
+
+
+password_pool = PasswordCheckPool(
+    workers=settings.LOGIN_HASH_WORKERS,
+    queue_size=settings.LOGIN_HASH_QUEUE,
+    timeout=settings.LOGIN_HASH_TIMEOUT,
+)
+
+
+@lru_cache(maxsize=1)
+def dummy_password_hash() -> str:
+    """존재하지 않는 이메일에도 동일한 해시 비용을 쓰기 위한 더미 해시"""
+    return make_password("dummy-password-for-timing")
+
+
+class LoginIPRateThrottle(SimpleRateThrottle):
+    """IP 단위 로그인 시도 제한"""
+    scope = "login_ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginEmailRateThrottle(SimpleRateThrottle):
+    """이메일 단위 로그인 시도 제한 (여러 IP에서의 대입 공격 방지)"""
+    scope = "login_email"
+
+    def get_cache_key(self, request, view):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        if not email:
+            return None
+        ident = hashlib.sha256(str(email).strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
 
 class EmailTokenObtainPairSerializer(serializers.Serializer):
     email = serializers.EmailField()
@@ -15,14 +107,19 @@ class EmailTokenObtainPairSerializer(serializers.Serializer):
         email = attrs.get("email")
         password = attrs.get("password")
         User = get_user_model()
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
-            raise AuthenticationFailed("이메일 또는 비밀번호가 올바르지 않습니다.")
-        if not user.check_password(password):
+        user = User.objects.filter(email=email).first()
+
+        # 존재하지 않는 이메일도 더미 해시로 검증하여 응답 시간을 동일하게 유지
+        encoded = user.password if user is not None else dummy_password_hash()
+        valid, rehashed = password_pool.check(password, encoded)
+        if user is None or not valid:
             raise AuthenticationFailed("이메일 또는 비밀번호가 올바르지 않습니다.")
         if not user.is_active:
             raise AuthenticationFailed("비활성화된 사용자입니다.")
+        if rehashed:
+            # 해시 알고리즘/반복 횟수 변경 시 풀에서 계산한 새 해시 저장 (DB 쓰기만 요청 스레드에서 수행)
+            user.password = rehashed
+            user.save(update_fields=["password"])
         access_token = AccessToken.for_user(user)
 
         return {
@@ -32,3 +129,6 @@ class EmailTokenObtainPairSerializer(serializers.Serializer):
 
 class EmailTokenObtainPairView(TokenViewBase):
     serializer_class = EmailTokenObtainPairSerializer
+    throttle_classes = [LoginIPRateThrottle, LoginEmailRateThrottle, TokenBucketThrottle]
+    throttle_scope = "login"
+    throttle_cost = 3  # PBKDF2 검증 비용 반영
@@ -0,0 +1,251 @@
+from __future__ import annotations
+import gc
+import random
+import time
+from datetime import timedelta
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from .models import Course, CourseRegistration, Payment, RegistrationBase, Test, TestRegistration
+from .seeding import TAG_NAMES
+
+# 엔드포인트 벤치마크 (benchmark_endpoints 명령)
+# - APIClient로 프로세스 안에서 요청 (JWT 인증, 미들웨어, 렌더러를 포함한 전체 요청 경로)
+# - 요청마다 사용자를 바꿔 호출 (사용자별 요청 제한 버킷/캐시에 치우치지 않도록)
+# - 쓰기 시나리오의 요청 대상은 앞선 시나리오까지 반영된 DB에서 읽어 만듦
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+class BenchmarkContext:
+    def __init__(self, users: list, seed: int = 0):
+        self.users = users
+        self.rng = random.Random(seed)
+        self.clients = {}
+        self.test_ids = list(Test.objects.values_list("id", flat=True))
+        self.course_ids = list(Course.objects.values_list("id", flat=True))
+        self.test_pages = max(1, min(5, len(self.test_ids) // 20))  # 목록 앞쪽 페이지 (기본 페이지 크기 20)
+
+    def user(self, index: int):
+        return self.users[index % len(self.users)]
+
+    def client(self, user) -> APIClient:
+        client = self.clients.get(user.pk)
+        if client is None:
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+            self.clients[user.pk] = client
+        return client
+
+    def open_items(self, model, count: int) -> list[int]:
+        """신청 가능한(진행 중, 정원 없음) 벤치마크 전용 시험/수업 count개"""
+        now = timezone.now()
+        items = model.objects.bulk_create(
+            model(title=f"벤치마크 {model._meta.verbose_name} {i}", start_at=now - timedelta(days=1),
+                  end_at=now + timedelta(days=1), price=10000)
+            for i in range(count)
+        )
+        return [item.pk for item in items]
+
+    def per_user(self, count: int, build) -> list:
+        """사용자마다 요청 하나씩 (build(user)가 None이면 건너뜀, 최대 count개)"""
+        requests = []
+        for user in self.users:
+            if len(requests) >= count:
+                break
+            request = build(user)
+            if request is not None:
+                requests.append((user, *request))
+        return requests
+
+    def rotating(self, count: int, build) -> list:
+        """사용자를 돌아가며 count개 (build(i) -> (path, body))"""
+        return [(self.user(i), *build(i)) for i in range(count)]
+
+    def rounds(self, model, count: int) -> list[int]:
+        # 사용자당 같은 항목에 한 번만 신청할 수 있으므로 사용자 수만큼 요청할 때마다 새 항목 사용
+        return self.open_items(model, -(-count // len(self.users)))
+
+
+class Scenario:
+    def __init__(self, name: str, method: str, path: str, build):
+        self.name = name  # 결과 키 (URL name이 있으면 같은 이름, SQL_QUERY_BUDGETS 참고)
+        self.method = method
+        self.path = path  # 결과 표시용
+        self.build = build  # (ctx, count) -> [(user, path, body), ...]
+
+
+def combination_body(ctx: BenchmarkContext, size: int = 10) -> list[dict]:
+    base = timezone.now()
+    activities = []
+    for i in range(size):
+        start = base + timedelta(hours=ctx.rng.randint(0, 48))
+        activities.append({"id": i + 1, "name": f"activity {i}", "type": "course",
+                           "start_at": start.isoformat(), "end_at": (start + timedelta(hours=2)).isoformat()})
+    return activities
+
+
+def registration_ids(user) -> dict:
+    return {
+        "test_ids": list(TestRegistration.objects.filter(user=user).values_list("id", flat=True)),
+        "course_ids": list(CourseRegistration.objects.filter(user=user).values_list("id", flat=True)),
+    }
+
+
+def pending_course_payment(user):
+    registrations = CourseRegistration.objects.filter(user=user, status=RegistrationBase.STATUS_PENDING)
+    return (
+        Payment.objects
+        .filter(user=user, status=Payment.STATUS_PAID,
+                target_content_type=ContentType.objects.get_for_model(CourseRegistration),
+                target_object_id__in=registrations.values("id"))
+        .values_list("id", flat=True).first()
+    )
+
+
+def build_recommend(ctx, count):
+    # 수강(취소 제외)한 수업이 있는 사용자만 (없으면 태그 조회 후 바로 빈 목록을 반환해 추천 쿼리까지 가지 않음)
+    takers = set(CourseRegistration.objects.filter(user__in=ctx.users)
+                 .exclude(status=RegistrationBase.STATUS_CANCELED).values_list("user_id", flat=True))
+    users = [user for user in ctx.users if user.pk in takers] or ctx.users
+    return [(users[i % len(users)], "/api/courses/recommend", None) for i in range(count)]
+
+
+def build_apply(ctx, count):
+    tests = ctx.rounds(Test, count)
+    return ctx.rotating(count, lambda i: (f"/api/tests/{tests[i // len(ctx.users)]}/apply",
+                                          {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD}))
+
+
+def build_enroll(ctx, count):
+    courses = ctx.rounds(Course, count)
+    return ctx.rotating(count, lambda i: (f"/api/courses/{courses[i // len(ctx.users)]}/enroll",
+                                          {"amount": 10000, "payment_method": Payment.METHOD_BANK}))
+
+
+def build_bulk_registrations(ctx, count):
+    tests, courses = ctx.rounds(Test, count), ctx.rounds(Course, count)
+    return ctx.rotating(count, lambda i: ("/api/registrations", {"payment_method": Payment.METHOD_KAKAOPAY, "list": [
+        {"target_type": "test", "target_id": tests[i // len(ctx.users)], "amount": 10000},
+        {"target_type": "course", "target_id": courses[i // len(ctx.users)], "amount": 10000},
+    ]}))
+
+
+def build_complete_test(ctx, count):
+    def build(user):
+        pk = (TestRegistration.objects.filter(user=user, status=RegistrationBase.STATUS_PENDING)
+              .values_list("id", flat=True).first())
+        return None if pk is None else (f"/api/tests/{pk}/complete", None)
+    return ctx.per_user(count, build)
+
+
+def build_cancel_payment(ctx, count):
+    def build(user):
+        pk = pending_course_payment(user)
+        return None if pk is None else (f"/api/payments/{pk}/cancel", None)
+    return ctx.per_user(count, build)
+
+
+SCENARIOS = [
+    # 조회
+    Scenario("tests-list", "GET", "/api/tests/?page=N",
+             lambda ctx, count: ctx.rotating(count, lambda i: (f"/api/tests/?page={i % ctx.test_pages + 1}", None))),
+    Scenario("tests-search", "GET", "/api/tests/?search=...",
+             lambda ctx, count: ctx.rotating(count, lambda i: (
+                 f"/api/tests/?search=제목 {ctx.rng.choice(ctx.test_ids)}", None))),
+    Scenario("courses-list", "GET", "/api/courses/?tags=...&include=my_status",
+             lambda ctx, count: ctx.rotating(count, lambda i: (
+                 f"/api/courses/?tags={','.join(ctx.rng.sample(TAG_NAMES, 2))}&include=my_status", None))),
+    Scenario("courses-detail", "GET", "/api/courses/<id>/",
+             lambda ctx, count: ctx.rotating(count, lambda i: (f"/api/courses/{ctx.rng.choice(ctx.course_ids)}/",
+                                                               None))),
+    Scenario("activities", "GET", "/api/activities?ordering=-popularity",
+             lambda ctx, count: ctx.rotating(count, lambda i: ("/api/activities?ordering=-popularity", None))),
+    Scenario("me_payments", "GET", "/api/me/payments",
+             lambda ctx, count: ctx.rotating(count, lambda i: ("/api/me/payments", None))),
+    Scenario("recommend_course", "GET", "/api/courses/recommend", build_recommend),
+    Scenario("combination_recommend", "POST", "/api/combination/recommend (10 activities)",
+             lambda ctx, count: ctx.rotating(count, lambda i: ("/api/combination/recommend", combination_body(ctx)))),
+    # 쓰기 (순서대로 실행, 앞 시나리오의 결과를 사용)
+    Scenario("apply_test", "POST", "/api/tests/<id>/apply", build_apply),
+    Scenario("enroll_course", "POST", "/api/courses/<id>/enroll", build_enroll),
+    Scenario("bulk_registrations", "POST", "/api/registrations (test + course)", build_bulk_registrations),
+    Scenario("complete_test", "POST", "/api/tests/<registration_id>/complete", build_complete_test),
+    Scenario("cancel_payment", "POST", "/api/payments/<id>/cancel", build_cancel_payment),
+    Scenario("bulk_complete_registrations", "POST", "/api/registrations/complete (user's registrations)",
+             lambda ctx, count: ctx.per_user(count, lambda user: ("/api/registrations/complete",
+                                                                  registration_ids(user)))),
+    Scenario("bulk_cancel_payments", "POST", "/api/payments/cancel (user's payments)",
+             lambda ctx, count: ctx.per_user(count, lambda user: ("/api/payments/cancel", {"payment_ids": list(
+                 Payment.objects.filter(user=user).values_list("id", flat=True)[:100])}))),
+]
+
+
+def run_scenario(ctx: BenchmarkContext, scenario: Scenario, iterations: int, warmup: int) -> dict:
+    """처음 warmup개 요청은 기록하지 않고, 요청별 응답 시간(ms)과 SQL 수 집계"""
+    latencies, query_counts, errors, empty = [], [], 0, 0
+    executed = [0]
+
+    def count_queries(execute, sql, params, many, context):
+        executed[0] += 1
+        return execute(sql, params, many, context)
+
+    requests = scenario.build(ctx, iterations + warmup)
+    gc.collect()  # 앞 시나리오에서 쌓인 객체 정리 시간이 측정에 섞이지 않도록
+    for n, (user, path, body) in enumerate(requests):
+        client = ctx.client(user)
+        executed[0] = 0
+        with connection.execute_wrapper(count_queries):
+            started = time.perf_counter()
+            if scenario.method == "GET":
+                response = client.get(path)
+            else:
+                response = client.post(path, body, format="json")
+            elapsed = (time.perf_counter() - started) * 1000
+        if n < warmup:
+            continue
+        latencies.append(elapsed)
+        query_counts.append(executed[0])
+        errors += response.status_code >= 400
+        # 빈 목록 응답 수 (데이터가 실제 조회 경로까지 가지 않고 일찍 끝나는 시나리오 확인용)
+        data = getattr(response, "data", None)
+        empty += isinstance(data, dict) and data.get("results") == []
+
+    result = {"method": scenario.method, "path": scenario.path, "requests": len(latencies), "errors": errors,
+              "empty": empty}
+    if latencies:
+        result.update({
+            "mean_ms": round(sum(latencies) / len(latencies), 3),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "queries": max(query_counts),
+            "queries_mean": round(sum(query_counts) / len(query_counts), 2),
+        })
+    return result
+
+
+def find_regressions(baseline: dict, results: dict, *, metric: str = "p50", threshold: float = 0.25,
+                     min_delta_ms: float = 1.0) -> list[str]:
+    """
+    기준 결과 대비 회귀 목록
+    - 응답 시간: metric이 기준보다 threshold 비율 이상, min_delta_ms 이상 늘어난 경우 (작은 값의 흔들림 제외)
+    - SQL 수: 요청당 최대 SQL 수가 늘어난 경우
+    """
+    regressions = []
+    key = f"{metric}_ms"
+    for name, current in results["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(name)
+        if not base or key not in base or key not in current:
+            continue
+        before, after = base[key], current[key]
+        if after > before * (1 + threshold) and after - before >= min_delta_ms:
+            regressions.append(f"{name}: {metric} {before:.2f}ms -> {after:.2f}ms (+{(after / before - 1) * 100:.0f}%)")
+        if current["queries"] > base["queries"]:
+            regressions.append(f"{name}: queries {base['queries']} -> {current['queries']}")
+    return regressions
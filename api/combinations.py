@@ -0,0 +1,178 @@
+# 겹치지 않는 일정 조합 탐색
+# - 탐색 함수는 프로세스 풀 워커에서 실행되므로 Django에 의존하지 않는 순수 함수로 유지
+# - 액티비티는 (시작, 종료) 정수(마이크로초) 구간으로 전달하고 결과는 인덱스 튜플로 반환하여 프로세스 간 직렬화 비용 절감
+from __future__ import annotations
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def to_intervals(activities) -> list[tuple[int, int]]:
+    """start_at/end_at(aware datetime)을 정수 마이크로초 구간으로 변환 (비교 결과 동일)"""
+    return [
+        ((a["start_at"] - EPOCH) // MICROSECOND, (a["end_at"] - EPOCH) // MICROSECOND)
+        for a in activities
+    ]
+
+
+# 풀 워커가 제한 시각을 확인하는 간격 (조합 수), 제한 시각 이후 실행 중인 작업의 중단을 기다리는 시간(초)
+DEADLINE_CHECK_INTERVAL = 4096
+DEADLINE_GRACE = 1.0
+
+
+class SearchDeadlineExceeded(Exception):
+    """풀 워커에서 제한 시각(deadline)이 지나 탐색을 중단한 경우"""
+
+
+def search_subtree(intervals: list[tuple[int, int]], first: int,
+                   deadline: float | None = None) -> list[tuple[int, ...]]:
+    """
+    first번째 액티비티로 시작하는 모든 조합을 깊이 우선 순서로 반환
+    (intervals는 시작 시간 기준으로 정렬되어 있어야 함)
+    - deadline(time.time() 기준, 프로세스 간 공유)이 지나면 SearchDeadlineExceeded
+    """
+    results = []
+    current = [first]
+    n = len(intervals)
+
+    def extend(start_index):
+        results.append(tuple(current))
+        if deadline is not None and len(results) % DEADLINE_CHECK_INTERVAL == 0 and time.time() > deadline:
+            raise SearchDeadlineExceeded()
+        for i in range(start_index, n):
+            start, end = intervals[i]
+            # 현재 조합의 어떤 액티비티와도 겹치지 않는 경우에만 확장
+            for j in current:
+                if intervals[j][0] < end and start < intervals[j][1]:
+                    break
+            else:
+                current.append(i)
+                extend(i + 1)
+                current.pop()
+
+    extend(first + 1)
+    return results
+
+
+def search_all(intervals: list[tuple[int, int]]) -> list[tuple[int, ...]]:
+    """모든 조합을 첫 액티비티 인덱스 순서로 반환 (프로세스 분할 결과와 순서 동일)"""
+    results = []
+    for first in range(len(intervals)):
+        results.extend(search_subtree(intervals, first))
+    return results
+
+
+def _warm_up() -> int:
+    return 0
+
+
+class CombinationSearchTimeout(Exception):
+    pass
+
+
+class CombinationSearchBusy(Exception):
+    pass
+
+
+def _mp_context():
+    # 스레드가 있는 Django 프로세스를 fork하지 않도록 forkserver(미지원 플랫폼은 spawn)로 워커 생성
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+class CombinationSearchPool:
+    """
+    크기 제한 프로세스 풀에서 조합 탐색 실행
+    - 탐색 공간을 첫 액티비티 인덱스별로 분할하여 병렬 실행하고, 인덱스 순서대로 병합
+    - 탐색 전체에 하나의 제한 시간(timeout) 적용, 초과 시 이 요청의 대기 작업은 취소하고
+      실행 중인 작업은 워커가 제한 시각에 스스로 중단 (끝날 때까지 슬롯을 유지하여 새 탐색이 뒤에 쌓이지 않음)
+    - 워커가 비정상 종료된 경우(BrokenProcessPool)에만 풀 재생성
+    - 동시에 진행 중인 탐색이 max_pending을 넘으면 즉시 거절
+    """
+
+    def __init__(self, workers: int, timeout: float, max_pending: int):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """워커 프로세스를 미리 띄움 (gunicorn post_worker_init에서 호출, 그 외에는 첫 사용 시)"""
+        self._get_executor()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_mp_context())
+                for future in [executor.submit(_warm_up) for _ in range(self.workers)]:
+                    future.result()
+                self._executor = executor
+            return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+        # 깨진(또는 응답하지 않는) 풀만 교체 (남은 워커 정리는 executor가 수행)
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        if terminate:
+            for process in list((getattr(executor, "_processes", None) or {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def search(self, intervals: list[tuple[int, int]]) -> list[tuple[int, ...]]:
+        if not self._slots.acquire(blocking=False):
+            raise CombinationSearchBusy()
+        try:
+            executor = self._get_executor()
+            deadline = time.monotonic() + self.timeout
+            futures = []
+            results = []
+            try:
+                wall_deadline = time.time() + self.timeout
+                futures = [executor.submit(search_subtree, intervals, first, wall_deadline)
+                           for first in range(len(intervals))]
+                for future in futures:
+                    results.extend(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except (FutureTimeoutError, SearchDeadlineExceeded):
+                # 다른 요청의 작업이 실행 중일 수 있으므로 풀은 유지하고 이 요청의 대기 작업만 취소
+                for future in futures:
+                    future.cancel()
+                # 실행 중인 작업은 제한 시각 직후 중단되므로 기다린 뒤 슬롯 반환 (그래도 끝나지 않으면 워커 종료)
+                _, running = wait(futures, timeout=max(0.0, deadline - time.monotonic()) + DEADLINE_GRACE)
+                if running:
+                    self._recycle(executor, terminate=True)
+                raise CombinationSearchTimeout()
+            except BrokenProcessPool:
+                # 워커 프로세스가 비정상 종료된 경우 다음 요청을 위해 풀 재생성
+                self._recycle(executor)
+                raise CombinationSearchBusy()
+            return results
+        finally:
+            self._slots.release()
+
+
+def unique_combinations(activities, combinations: list[tuple[int, ...]]) -> list[tuple[int, ...]]:
+    """
+    같은 액티비티(모든 필드가 같은 항목) 구성의 조합 중복 제거 (첫 조합 유지, 순서 보존)
+    - 같은 액티비티가 없으면 인덱스 조합이 모두 다르므로 그대로 반환
+    """
+    canonical = {}
+    keys = [canonical.setdefault(tuple(sorted(a.items(), key=lambda item: item[0])), i)
+            for i, a in enumerate(activities)]
+    if len(canonical) == len(activities):
+        return combinations
+    seen = set()
+    unique = []
+    for combo in combinations:
+        key = tuple(sorted(keys[i] for i in combo))
+        if key not in seen:
+            seen.add(key)
+            unique.append(combo)
+    return unique
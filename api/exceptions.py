@@ -4,7 +4,7 @@ from rest_framework.response import Response
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.http import Http404
-from rest_framework.exceptions import APIException, PermissionDenied, NotFound
+from rest_framework.exceptions import APIException, PermissionDenied, NotFound, Throttled
 import logging
 
 logger = logging.getLogger(__name__)
@@ -31,6 +31,29 @@ class RegistrationException(APIException):
     default_code = "registration_error"
 
 
+class SoldOutException(RegistrationException):
+    """잔여석 없음 예외"""
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "잔여석이 없습니다."
+    default_code = "sold_out"
+
+
+class CombinationSearchException(APIException):
+    """조합 탐색 처리 불가 예외 (시간 초과/처리 용량 초과)"""
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "조합 탐색을 처리할 수 없습니다. 액티비티 수를 줄이거나 잠시 후 다시 시도해주세요."
+    default_code = "combination_search_unavailable"
+
+
+class LoginBusyException(Throttled):
+    """로그인 처리 용량 초과 예외 (비밀번호 검증 풀 포화)"""
+    default_detail = "로그인 요청이 많습니다. 잠시 후 다시 시도해주세요."
+    default_code = "login_busy"
+
+    def __init__(self, detail=None, code=None, wait=1):
+        super().__init__(wait=wait, detail=detail, code=code)
+
+
 def custom_exception_handler(exc, context):
     """전역 예외 처리 핸들러"""
     
@@ -43,35 +66,35 @@ def custom_exception_handler(exc, context):
     
     # Django 예외들을 DRF 예외로 변환
     if isinstance(exc, ValidationError):
-        logger.warning(f"ValidationError: {exc}")
+        logger.warning("ValidationError: %s", exc)
         return Response({
             'detail': '입력 데이터가 유효하지 않습니다.',
             'errors': exc.message_dict if hasattr(exc, 'message_dict') else str(exc)
         }, status=status.HTTP_400_BAD_REQUEST)
     
     elif isinstance(exc, IntegrityError):
-        logger.error(f"IntegrityError: {exc}")
+        logger.error("IntegrityError: %s", exc)
         return Response({
             'detail': '데이터 무결성 오류가 발생했습니다.',
             'code': 'integrity_error'
         }, status=status.HTTP_400_BAD_REQUEST)
     
     elif isinstance(exc, Http404):
-        logger.warning(f"Http404: {exc}")
+        logger.warning("Http404: %s", exc)
         return Response({
             'detail': '요청한 리소스를 찾을 수 없습니다.',
             'code': 'not_found'
         }, status=status.HTTP_404_NOT_FOUND)
     
     elif isinstance(exc, PermissionDenied):
-        logger.warning(f"PermissionDenied: {exc}")
+        logger.warning("PermissionDenied: %s", exc)
         return Response({
             'detail': '권한이 없습니다.',
             'code': 'permission_denied'
         }, status=status.HTTP_403_FORBIDDEN)
     
     # 예상치 못한 예외는 로그 기록 후 일반적인 오류 메시지 반환
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
+    logger.error("Unexpected error: %s", exc, exc_info=True)
     return Response({
         'detail': '서버 내부 오류가 발생했습니다.',
         'code': 'internal_server_error'
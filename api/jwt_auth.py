@@ -0,0 +1,113 @@
+from __future__ import annotations
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class TTLLRUCache:
+    """
+    크기 제한(LRU)과 만료시간(TTL)을 가진 프로세스 내 캐시
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_user_cache_settings = getattr(settings, "JWT_USER_CACHE", {})
+user_cache = TTLLRUCache(
+    max_size=_user_cache_settings.get("MAX_SIZE", 1024),
+    ttl=_user_cache_settings.get("TTL", 30),
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    서명 검증이 끝난 토큰의 사용자 조회 결과를 캐시하여 요청마다 발생하는 api_user SELECT를 줄이는 인증 클래스
+    - 캐시 키는 토큰의 사용자 식별 클레임(user_id)
+    - 사용자 저장/삭제 시(is_active 변경 포함) 해당 항목을 즉시 무효화
+    - QuerySet.update()/raw SQL은 시그널이 없으므로 비활성화/비밀번호 변경이 TTL 동안 반영되지 않음
+      (이 경우 invalidate_users()로 직접 무효화)
+    - 다른 워커 프로세스의 캐시는 TTL 이내에 만료됨
+    - CHECK_REVOKE_TOKEN 사용 시 캐시 적중에서도 토큰의 비밀번호 해시 클레임을 스냅샷의 해시와 비교
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        # 토큰 클레임은 문자열이므로 키를 문자열로 통일
+        cache_key = str(user_id)
+        cached = user_cache.get(cache_key)
+        if cached is None:
+            # 캐시 미스: 기본 구현으로 조회(비활성/비밀번호 변경 검사 포함)
+            user = super().get_user(validated_token)
+            user_cache.set(cache_key, (copy.copy(user), get_md5_hash_password(user.password)))
+            return user
+
+        snapshot, password_hash = cached
+        if jwt_settings.CHECK_USER_IS_ACTIVE and not snapshot.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if jwt_settings.CHECK_REVOKE_TOKEN and validated_token.get(jwt_settings.REVOKE_TOKEN_CLAIM) != password_hash:
+            raise AuthenticationFailed("The user's password has been changed.", code="password_changed")
+        # 요청 처리 중 변경이 캐시에 남지 않도록 복사본 반환
+        return copy.copy(snapshot)
+
+
+def invalidate_users(user_ids) -> None:
+    """시그널 없이 변경한 사용자(QuerySet.update() 등)의 캐시 제거 (현재 프로세스만, 다른 워커는 TTL 이내 만료)"""
+    for user_id in user_ids:
+        user_cache.pop(str(user_id))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """사용자 변경(is_active, 비밀번호 등) 시 캐시된 스냅샷 제거"""
+    invalidate_users([getattr(instance, jwt_settings.USER_ID_FIELD)])
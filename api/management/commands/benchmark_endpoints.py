@@ -0,0 +1,128 @@
+from __future__ import annotations
+import json
+import logging
+import platform
+from pathlib import Path
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from api.benchmarking import SCENARIOS, BenchmarkContext, find_regressions, run_scenario
+from api.models import User
+from api.seeding import SEED_USER_PREFIX, CatalogSeeder
+
+
+class Command(BaseCommand):
+    help = (
+        "주요 엔드포인트를 APIClient로 반복 호출해 p50/p95/p99 응답 시간과 SQL 수를 JSON으로 저장하고, "
+        "기준 결과(--baseline)보다 느려지면 실패"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tests", type=int, default=5000)
+        parser.add_argument("--courses", type=int, default=5000)
+        parser.add_argument("--tags", type=int, default=10)
+        parser.add_argument("--users", type=int, default=500)
+        parser.add_argument("--registrations", type=int, default=5, help="사용자당 신청 수")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--iterations", type=int, default=100, help="시나리오별 측정 요청 수")
+        parser.add_argument("--warmup", type=int, default=5, help="시나리오별로 측정하지 않는 첫 요청 수")
+        parser.add_argument("--only", action="append", choices=[s.name for s in SCENARIOS],
+                            help="실행할 시나리오 (여러 번 지정 가능, 기본: 전체)")
+        parser.add_argument(
+            "--output", default=str(Path(settings.BASE_DIR) / "logs" / "benchmarks" / "endpoints.json"),
+            help="결과 JSON 경로",
+        )
+        parser.add_argument("--baseline", help="비교할 기준 결과 JSON (이전 실행의 --output)")
+        parser.add_argument("--metric", choices=["p50", "p95", "p99"], default="p50",
+                            help="비교할 응답 시간 (p95/p99는 반복 수가 적으면 흔들림이 큼)")
+        parser.add_argument("--threshold", type=float, default=0.25, help="허용 증가 비율 (0.25: 25%%)")
+        parser.add_argument("--min-delta-ms", type=float, default=1.0, help="이보다 작은 증가는 회귀로 보지 않음")
+        parser.add_argument(
+            "--current-db", action="store_true",
+            help="테스트 DB를 만들지 않고 현재 DB 사용 (데이터가 추가/변경됨, --no-seed와 함께 기존 데이터로 측정)",
+        )
+        parser.add_argument("--keepdb", action="store_true", help="테스트 DB를 지우지 않고 다음 실행에서 재사용")
+        parser.add_argument("--no-seed", action="store_true", help="데이터를 생성하지 않고 기존 seed 사용자/데이터 사용")
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"기준 결과를 읽을 수 없습니다: {options['baseline']} ({e})")
+
+        # 요청별 로그는 측정 출력을 가리므로 WARNING 이상만 남김
+        api_logger = logging.getLogger("api")
+        log_level = api_logger.level
+        api_logger.setLevel(logging.WARNING)
+        try:
+            setup_test_environment()  # ALLOWED_HOSTS에 testserver 추가 등
+            test_environment = True
+        except RuntimeError:  # 테스트 실행 중 호출된 경우
+            test_environment = False
+        old_name = None
+        if not options["current_db"]:
+            old_name = connection.settings_dict["NAME"]
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False,
+                                               keepdb=options["keepdb"])
+        try:
+            results = self.run(options)
+        finally:
+            if old_name is not None:
+                connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            if test_environment:
+                teardown_test_environment()
+            api_logger.setLevel(log_level)
+
+        output = Path(options["output"])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+        self.stdout.write(f"결과: {output}")
+
+        failed = [f"{name}: {result['errors']}건 실패" for name, result in results["endpoints"].items()
+                  if result["errors"]]
+        if baseline is not None:
+            if baseline.get("meta", {}).get("vendor") != results["meta"]["vendor"]:
+                self.stderr.write("기준 결과와 DB 종류가 다릅니다. 비교 결과를 주의해서 해석하세요.")
+            failed += find_regressions(baseline, results, metric=options["metric"], threshold=options["threshold"],
+                                       min_delta_ms=options["min_delta_ms"])
+        if failed:
+            raise CommandError("벤치마크 실패:\n  " + "\n  ".join(failed))
+
+    def run(self, options) -> dict:
+        scale = {name: options[name] for name in ("tests", "courses", "tags", "users", "registrations", "seed")}
+        if not options["no_seed"] and not (options["keepdb"] and User.objects.exists()):
+            stats = CatalogSeeder(**scale).run()
+            self.stdout.write(f"데이터 생성: {sum(rows for rows, _ in stats.values())} rows")
+        users = list(User.objects.filter(username__regex=rf"^{SEED_USER_PREFIX}[0-9]+$").order_by("id"))
+        if not users:
+            raise CommandError("seed 사용자가 없습니다. seed_catalog로 데이터를 생성하거나 --no-seed 없이 실행하세요.")
+
+        ctx = BenchmarkContext(users, seed=options["seed"])
+        selected = [s for s in SCENARIOS if not options["only"] or s.name in options["only"]]
+        endpoints = {}
+        self.stdout.write(f"{'endpoint':<30}{'reqs':>6}{'err':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}")
+        for scenario in selected:
+            result = endpoints[scenario.name] = run_scenario(ctx, scenario, options["iterations"], options["warmup"])
+            if result["requests"]:
+                self.stdout.write(
+                    f"{scenario.name:<30}{result['requests']:>6}{result['errors']:>5}{result['p50_ms']:>9.2f}"
+                    f"{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}{result['queries']:>9}"
+                )
+        return {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "vendor": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "debug": settings.DEBUG,
+                "scale": scale,
+                "iterations": options["iterations"],
+                "warmup": options["warmup"],
+            },
+            "endpoints": endpoints,
+        }
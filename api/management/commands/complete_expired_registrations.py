@@ -0,0 +1,103 @@
+from __future__ import annotations
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from api.models import CourseRegistration, TestRegistration
+from api.services import complete_expired_chunk
+from config.metrics import record_auto_completed
+
+logger = logging.getLogger("api.jobs")
+
+# 종류 -> (신청 모델, 대상 필드)
+TARGETS = {
+    "test": (TestRegistration, "test"),
+    "course": (CourseRegistration, "course"),
+}
+
+
+class Command(BaseCommand):
+    help = "대상(시험/수업)의 end_at이 지난 대기(pending) 신청을 id 순 청크 단위로 완료 처리 (주기 실행용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--type", choices=sorted(TARGETS), action="append", dest="types",
+                            help="처리할 종류 (여러 번 지정 가능, 기본: 전체)")
+        parser.add_argument("--chunk-size", type=int, default=500, help="청크(트랜잭션) 하나에서 처리할 최대 신청 수")
+        parser.add_argument("--sleep", type=float, default=0.0, help="청크 사이 대기 시간(초), DB 부하 조절용")
+        parser.add_argument("--max-chunks", type=int, default=0, help="이번 실행에서 처리할 최대 청크 수 (0: 제한 없음)")
+        parser.add_argument(
+            "--checkpoint",
+            help="진행 위치(기준 시각, 종류별 마지막 id)를 저장할 JSON 파일. 중단 후 다시 실행하면 이어서 처리하고, "
+                 "전체 처리가 끝나면 삭제",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size는 1 이상이어야 합니다.")
+        types = options["types"] or list(TARGETS)
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+        state = self.load_checkpoint(checkpoint)
+        # 기준 시각은 실행(이어받은 경우 처음 실행) 시점으로 고정해 실행 중 새로 만료되는 신청으로 끝나지 않는 것을 방지
+        cutoff = datetime.fromisoformat(state["cutoff"]) if "cutoff" in state else timezone.now()
+        state["cutoff"] = cutoff.isoformat()
+
+        chunks = 0
+        totals = {}
+        started = time.monotonic()
+        for kind in types:
+            model, target_field = TARGETS[kind]
+            after_id = state.get(kind, 0)
+            if after_id is None:
+                continue  # 이전 실행에서 처리 완료
+            totals[kind] = 0
+            while not (options["max_chunks"] and chunks >= options["max_chunks"]):
+                with transaction.atomic():
+                    completed, last_id = complete_expired_chunk(model, target_field, cutoff, after_id,
+                                                                options["chunk_size"])
+                record_auto_completed(kind, completed)
+                state[kind] = last_id
+                self.save_checkpoint(checkpoint, state)
+                if last_id is None:
+                    break
+                chunks += 1
+                totals[kind] += completed
+                after_id = last_id
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{kind}: chunk {chunks} completed={completed} total={totals[kind]} last_id={last_id} "
+                    f"({sum(totals.values()) / elapsed if elapsed else 0:.0f} rows/s)"
+                )
+                logger.info("registrations auto-completed", extra={
+                    "job": "complete_expired_registrations", "kind": kind, "chunk": chunks,
+                    "completed": completed, "last_id": last_id,
+                })
+                if options["sleep"]:
+                    time.sleep(options["sleep"])
+
+        finished = all(state.get(kind, 0) is None for kind in types)
+        if checkpoint and finished and checkpoint.exists():
+            checkpoint.unlink()
+        summary = " ".join(f"{kind}={count}" for kind, count in totals.items())
+        self.stdout.write(
+            f"완료 처리 {summary or '없음'} (chunks={chunks}, cutoff={cutoff.isoformat()}, "
+            f"{time.monotonic() - started:.2f}s{'' if finished else ', 남은 대상 있음'})"
+        )
+
+    def load_checkpoint(self, path: Path | None) -> dict:
+        if path is None or not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text())
+        except ValueError as e:
+            raise CommandError(f"체크포인트 파일을 읽을 수 없습니다: {path} ({e})")
+
+    def save_checkpoint(self, path: Path | None, state: dict) -> None:
+        if path is None:
+            return
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(state))
+        tmp.replace(path)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from config.schema import SCHEMA_FILES, generate_schema
+
+
+class Command(BaseCommand):
+    help = "OpenAPI 스키마(swagger.json / swagger.yaml)를 미리 생성하여 SCHEMA_DIR에 저장"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output-dir", default=settings.SCHEMA_DIR)
+        parser.add_argument(
+            "--check", action="store_true",
+            help="파일을 쓰지 않고 저장된 스키마가 최신인지만 확인 (다르면 실패)",
+        )
+
+    def handle(self, *args, **options):
+        output_dir = Path(options["output_dir"])
+        stale = []
+        for format, (filename, _) in SCHEMA_FILES.items():
+            content = generate_schema(format)
+            path = output_dir / filename
+            if options["check"]:
+                if not path.exists() or path.read_bytes() != content:
+                    stale.append(str(path))
+                continue
+            output_dir.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+            self.stdout.write(f"{path} ({len(content)} bytes)")
+        if stale:
+            raise CommandError(f"스키마가 최신이 아닙니다: {', '.join(stale)}")
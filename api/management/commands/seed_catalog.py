@@ -0,0 +1,52 @@
+from __future__ import annotations
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from api.seeding import SEED_USER_PASSWORD, CatalogSeeder, clear_seeded_data, copy_supported
+
+
+class Command(BaseCommand):
+    help = "부하 테스트용 시험/수업/태그/사용자/신청/결제 데이터 생성 (같은 --seed면 같은 데이터, 모든 DB 지원)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tests", type=int, default=5000)
+        parser.add_argument("--courses", type=int, default=5000)
+        parser.add_argument("--tags", type=int, default=10)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--registrations", type=int, default=5, help="사용자당 신청 수 (신청마다 결제 1건)")
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="bulk_create/COPY 한 번에 기록할 행 수")
+        parser.add_argument(
+            "--method", choices=["auto", "bulk", "copy"], default="auto",
+            help="기록 방식 (auto: PostgreSQL + psycopg 3이면 COPY, 그 외 bulk_create)",
+        )
+        parser.add_argument("--clear", action="store_true",
+                            help="생성 전에 카탈로그/신청/결제 전체와 이전에 생성한 사용자 삭제")
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size는 1 이상이어야 합니다.")
+        if any(options[name] < 0 for name in ("tests", "courses", "tags", "users", "registrations")):
+            raise CommandError("생성할 개수는 0 이상이어야 합니다.")
+        if options["method"] == "copy" and not copy_supported():
+            raise CommandError("COPY는 PostgreSQL(psycopg 3)에서만 사용할 수 있습니다.")
+
+        started = time.perf_counter()
+        if options["clear"]:
+            clear_seeded_data()
+            self.stdout.write(f"기존 데이터 삭제 ({time.perf_counter() - started:.2f}s)")
+
+        seeder = CatalogSeeder(
+            tests=options["tests"], courses=options["courses"], tags=options["tags"], users=options["users"],
+            registrations=options["registrations"], seed=options["seed"], chunk_size=options["chunk_size"],
+            use_copy={"auto": None, "bulk": False, "copy": True}[options["method"]],
+        )
+        stats = seeder.run()
+        method = "COPY" if seeder.use_copy else "bulk_create"
+        for table, (rows, seconds) in stats.items():
+            self.stdout.write(f"{table:<28}{rows:>10} rows {seconds:>8.2f}s")
+        total = sum(rows for rows, _ in stats.values())
+        self.stdout.write(
+            f"{connection.vendor} ({method}): {total} rows in {time.perf_counter() - started:.2f}s, "
+            f"사용자 비밀번호: {SEED_USER_PASSWORD}"
+        )
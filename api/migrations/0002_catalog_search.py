@@ -0,0 +1,75 @@
+from django.db import migrations
+
+# 시험/수업 전문 검색 인덱스 (api/search.py)
+# - PostgreSQL: tsvector 식 GIN 인덱스 + title pg_trgm GIN 인덱스
+#   (운영 DB에 데이터가 많다면 CREATE INDEX CONCURRENTLY로 미리 생성 후 적용, IF NOT EXISTS로 건너뜀)
+# - SQLite: FTS5 external content 테이블 + 트리거 동기화
+
+SEARCH_TABLES = ("api_test", "api_course")
+
+
+def postgres_statements(table):
+    vector = (
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+    )
+    return [
+        f"CREATE INDEX IF NOT EXISTS {table}_search_idx ON {table} USING gin (({vector}))",
+        f"CREATE INDEX IF NOT EXISTS {table}_title_trgm_idx ON {table} USING gin (title gin_trgm_ops)",
+    ]
+
+
+def sqlite_statements(table, tokenizer):
+    fts = f"{table}_fts"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"title, description, content='{table}', content_rowid='id', tokenize='{tokenizer}')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF title, description ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); "
+        f"INSERT INTO {fts}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def create_search_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table in SEARCH_TABLES:
+            for sql in postgres_statements(table):
+                schema_editor.execute(sql)
+    elif connection.vendor == "sqlite":
+        import sqlite3
+
+        # trigram 토크나이저는 SQLite 3.34 이상 (한국어 부분 일치), 그 외에는 단어 단위
+        tokenizer = "trigram" if sqlite3.sqlite_version_info >= (3, 34) else "unicode61"
+        for table in SEARCH_TABLES:
+            for sql in sqlite_statements(table, tokenizer):
+                schema_editor.execute(sql)
+
+
+def drop_search_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    for table in SEARCH_TABLES:
+        if connection.vendor == "postgresql":
+            schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_idx")
+            schema_editor.execute(f"DROP INDEX IF EXISTS {table}_title_trgm_idx")
+        elif connection.vendor == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            schema_editor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
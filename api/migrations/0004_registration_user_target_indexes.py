@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_catalog_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courseregistration',
+            index=models.Index(fields=['user', 'course', 'status'], name='api_coursereg_user_course_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testregistration',
+            index=models.Index(fields=['user', 'test', 'status'], name='api_testreg_user_test_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_seat_capacity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courseregistration',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['id'], name='api_coursereg_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testregistration',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['id'], name='api_testreg_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:36
+
+import api.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_registration_pending_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseSearchIndex',
+            fields=[
+                ('course', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='api.course')),
+                ('document', api.search.SearchDocumentField(db_column='api_course_fts')),
+            ],
+            options={
+                'db_table': 'api_course_fts',
+                'abstract': False,
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TestSearchIndex',
+            fields=[
+                ('test', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='api.test')),
+                ('document', api.search.SearchDocumentField(db_column='api_test_fts')),
+            ],
+            options={
+                'db_table': 'api_test_fts',
+                'abstract': False,
+                'managed': False,
+            },
+        ),
+    ]
@@ -1,9 +1,10 @@
 from __future__ import annotations
-from django.db import models
-from django.utils import timezone
+from django.db import models, transaction
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import AbstractUser
+from .search import SearchDocumentField
+from .seats import resize_capacity
 
 # 유저
 class User(AbstractUser):
@@ -20,8 +21,55 @@ class TimeStampedModel(models.Model):
     class Meta:
         abstract = True
 
+# 정원 abstract model
+class SeatCapacityModel(TimeStampedModel):
+    # 정원 (None: 제한 없음), 잔여석/인기도는 신청/취소 시 조건부 UPDATE로만 변경 (api/seats.py)
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    remaining_seats = models.PositiveIntegerField(null=True, blank=True)
+
+    # 인스턴스 값이 오래됐을 수 있어 생성 이후 save()로 쓰지 않는 필드 (정원은 증감분으로 반영)
+    SEAT_FIELDS = ("capacity", "remaining_seats", "popularity")
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 불러온 정원 (지연 로딩으로 없으면 알 수 없음 -> 저장 시 항상 증감분 반영)
+        instance._loaded_capacity = instance.__dict__.get("capacity", models.DEFERRED)
+        return instance
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            # 정원을 처음 지정하면 잔여석을 정원으로 초기화
+            if self.capacity is None:
+                self.remaining_seats = None
+            elif self.remaining_seats is None:
+                self.remaining_seats = self.capacity
+            super().save(*args, **kwargs)
+            self._loaded_capacity = self.capacity
+            return
+
+        # 읽은 뒤 다른 요청이 예약/반환한 잔여석/인기도를 덮어쓰지 않도록 나머지 필드만 저장
+        update_fields = kwargs.pop("update_fields", None)
+        if update_fields is None:
+            update_fields = [field.name for field in self._meta.concrete_fields if not field.primary_key]
+        elif {"remaining_seats", "popularity"} & set(update_fields):
+            raise ValueError("잔여석/인기도는 api.seats의 조건부 UPDATE로만 변경합니다.")
+        resize = "capacity" in update_fields and self.capacity != getattr(self, "_loaded_capacity", models.DEFERRED)
+        update_fields = [name for name in update_fields if name not in self.SEAT_FIELDS]
+        with transaction.atomic():
+            if update_fields:
+                super().save(*args, update_fields=update_fields, **kwargs)
+            if resize:
+                resize_capacity(type(self), self.pk, self.capacity)
+        if resize:
+            self._loaded_capacity = self.capacity
+            self.refresh_from_db(fields=["remaining_seats", "popularity"])
+
 # 시험
-class Test(TimeStampedModel):
+class Test(SeatCapacityModel):
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     start_at = models.DateTimeField(null=True, blank=True)
@@ -29,6 +77,13 @@ class Test(TimeStampedModel):
     popularity = models.PositiveIntegerField(default=0)
     price = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        # 목록 정렬/키셋 페이지네이션 (정렬 키, id)
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="api_test_created_id_idx"),
+            models.Index(fields=["popularity", "id"], name="api_test_popularity_id_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.title
 
@@ -40,7 +95,7 @@ class Tag(models.Model):
         return self.name
 
 # 수업
-class Course(TimeStampedModel):
+class Course(SeatCapacityModel):
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     start_at = models.DateTimeField(null=True, blank=True)
@@ -50,9 +105,41 @@ class Course(TimeStampedModel):
 
     tags = models.ManyToManyField(Tag, related_name='courses', blank=True)
 
+    class Meta:
+        # 목록 정렬/키셋 페이지네이션 (정렬 키, id)
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="api_course_created_id_idx"),
+            models.Index(fields=["popularity", "id"], name="api_course_popularity_id_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.title
 
+# SQLite FTS5 검색 테이블(<테이블>_fts, 마이그레이션 0002에서 생성) 조회용 abstract model
+# - rowid가 시험/수업 id, api.search.sqlite_search에서 조인에만 사용 (PostgreSQL에는 테이블 없음)
+class SearchIndexModel(models.Model):
+    class Meta:
+        abstract = True
+        managed = False
+
+
+class TestSearchIndex(SearchIndexModel):
+    test = models.OneToOneField(Test, models.DO_NOTHING, primary_key=True, db_column="rowid",
+                                db_constraint=False, related_name="search_index")
+    document = SearchDocumentField(db_column="api_test_fts")
+
+    class Meta(SearchIndexModel.Meta):
+        db_table = "api_test_fts"
+
+
+class CourseSearchIndex(SearchIndexModel):
+    course = models.OneToOneField(Course, models.DO_NOTHING, primary_key=True, db_column="rowid",
+                                  db_constraint=False, related_name="search_index")
+    document = SearchDocumentField(db_column="api_course_fts")
+
+    class Meta(SearchIndexModel.Meta):
+        db_table = "api_course_fts"
+
 # 신청 기본 정보 abstract model
 class RegistrationBase(TimeStampedModel):
     STATUS_PENDING = "pending"
@@ -74,10 +161,26 @@ class RegistrationBase(TimeStampedModel):
 class TestRegistration(RegistrationBase):
     test = models.ForeignKey(Test, on_delete=models.CASCADE)
 
+    class Meta(RegistrationBase.Meta):
+        # 사용자별 신청 여부/상태 조회 (목록의 my_status, 중복 신청 확인)
+        indexes = [
+            models.Index(fields=["user", "test", "status"], name="api_testreg_user_test_idx"),
+            # 대기 신청만 담는 부분 인덱스 (complete_expired_registrations의 id 순 청크 조회)
+            models.Index(fields=["id"], condition=models.Q(status="pending"), name="api_testreg_pending_idx"),
+        ]
+
 # 수업 신청
 class CourseRegistration(RegistrationBase):
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
 
+    class Meta(RegistrationBase.Meta):
+        # 사용자별 신청 여부/상태 조회 (목록의 my_status, 중복 신청 확인)
+        indexes = [
+            models.Index(fields=["user", "course", "status"], name="api_coursereg_user_course_idx"),
+            # 대기 신청만 담는 부분 인덱스 (complete_expired_registrations의 id 순 청크 조회)
+            models.Index(fields=["id"], condition=models.Q(status="pending"), name="api_coursereg_pending_idx"),
+        ]
+
 class Payment(TimeStampedModel):
     METHOD_CREDIT_CARD = "credit_card"
     METHOD_KAKAOPAY = "kakaopay"
@@ -109,26 +212,14 @@ class Payment(TimeStampedModel):
     target = GenericForeignKey("target_content_type", "target_object_id")
 
     def cancel(self) -> None:
-        # Business rule: cannot cancel if related registration is completed
-        if hasattr(self, "target") and self.target:
-            if getattr(self.target, "status", None) == RegistrationBase.STATUS_COMPLETED:
-                raise ValueError("완료된 항목은 취소할 수 없습니다.")
-        self.status = self.STATUS_CANCELED
-        self.canceled_at = timezone.now()
-        self.save()
-        if hasattr(self, "target") and self.target:
-            # 인기도 감소
-            if self.target_content_type == ContentType.objects.get_for_model(TestRegistration):
-                test = Test.objects.get(id = self.target.test.id)
-                test.popularity -= 1
-                test.save()
-            elif self.target_content_type == ContentType.objects.get_for_model(CourseRegistration):
-                course = Course.objects.get(id = self.target.course.id)
-                course.popularity -= 1
-                course.save()
-            # 신청 취소 처리
-            self.target.status = self.STATUS_CANCELED
-            self.target.save()
+        """결제 취소 (services.cancel_payments와 같은 규칙, 이미 취소된 결제는 그대로 둠)"""
+        from .services import NOT_CANCELABLE, cancel_payments
+
+        with transaction.atomic():
+            result = cancel_payments(self.user, [self.pk])[self.pk]
+        if result == NOT_CANCELABLE:
+            raise ValueError("완료된 항목은 취소할 수 없습니다.")
+        self.refresh_from_db(fields=["status", "canceled_at", "updated_at"])
 
     def __str__(self) -> str:
         return f"Payment({self.id}) {self.user} {self.amount} {self.status}"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Lookup, Q, TextField, Value
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+# 시험/수업 전문 검색 (title, description)
+# - PostgreSQL: tsvector(GIN, 'simple' 설정) + title pg_trgm(GIN) 인덱스 (마이그레이션 0002)
+# - SQLite: FTS5 external content 테이블(<테이블>_fts, trigram 토크나이저) + 트리거로 동기화
+# - 그 외 DB: icontains (인덱스 미사용)
+# 한국어는 형태소 분석기가 없으므로 PostgreSQL은 공백 단위 토큰 + 제목 부분 일치(trigram)로 보완
+
+MAX_QUERY_LENGTH = 100
+# FTS5 trigram 토크나이저는 3글자 이상 토큰만 검색 가능
+MIN_FTS_TOKEN_LENGTH = 3
+
+
+class SearchDocumentField(TextField):
+    """FTS5 테이블 이름과 같은 숨은 열 (MATCH 대상, api.models의 검색 인덱스 모델에서 사용)"""
+
+
+@SearchDocumentField.register_lookup
+class FTSMatch(Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", [*lhs_params, *rhs_params]
+
+
+def search_vector_sql(table: str) -> str:
+    """PostgreSQL GIN 인덱스와 같은 tsvector 식 (인덱스를 사용하려면 식이 정확히 일치해야 함)"""
+    return (
+        f"setweight(to_tsvector('simple', coalesce({table}.title, '')), 'A') || "
+        f"setweight(to_tsvector('simple', coalesce({table}.description, '')), 'B')"
+    )
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def postgres_search(queryset, query: str):
+    table = connections[queryset.db].ops.quote_name(queryset.model._meta.db_table)
+    vector = search_vector_sql(table)
+    match = RawSQL(
+        f"({vector}) @@ websearch_to_tsquery('simple', %s) OR {table}.title ILIKE %s",
+        [query, f"%{escape_like(query)}%"],
+        output_field=BooleanField(),
+    )
+    rank = RawSQL(
+        f"ts_rank({vector}, websearch_to_tsquery('simple', %s)) + similarity({table}.title, %s)",
+        [query, query],
+        output_field=FloatField(),
+    )
+    return queryset.filter(match).alias(search_rank=rank)
+
+
+def sqlite_search(queryset, query: str):
+    fts = connections[queryset.db].ops.quote_name(f"{queryset.model._meta.db_table}_fts")
+    tokens = query.split()
+    fts_tokens = [token for token in tokens if len(token) >= MIN_FTS_TOKEN_LENGTH]
+    for token in tokens:
+        if len(token) < MIN_FTS_TOKEN_LENGTH:
+            queryset = queryset.filter(Q(title__icontains=token) | Q(description__icontains=token))
+    if not fts_tokens:
+        return queryset.alias(search_rank=Value(0.0, output_field=FloatField()))
+    # 각 토큰을 구문(phrase)으로 감싸 FTS5 문법 문자를 그대로 검색
+    match = " ".join('"%s"' % token.replace('"', '""') for token in fts_tokens)
+    # FTS 테이블(검색 인덱스 모델)을 조인해 MATCH 결과에서 출발
+    # (EXISTS 등 상관 서브쿼리는 행마다 MATCH를 다시 실행하여 일치 행이 많으면 수천 배 느림)
+    # bm25는 낮을수록 관련도가 높으므로 부호를 바꿔 사용 (제목 가중치 10), 조인한 FTS 테이블 별칭은 테이블 이름
+    return queryset.filter(search_index__document__match=match).alias(
+        search_rank=RawSQL(f"-bm25({fts}, 10.0, 1.0)", [], output_field=FloatField())
+    )
+
+
+def fallback_search(queryset, query: str):
+    for token in query.split():
+        queryset = queryset.filter(Q(title__icontains=token) | Q(description__icontains=token))
+    return queryset.alias(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class CatalogSearchFilter(BaseFilterBackend):
+    """
+    ?search= 전문 검색 (DB별 인덱스 사용) 후 관련도순 정렬
+    - ordering 파라미터가 있으면 해당 정렬을 유지
+    """
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()[:MAX_QUERY_LENGTH]
+        if not query:
+            return queryset
+        vendor = connections[queryset.db].vendor
+        if vendor == "postgresql":
+            queryset = postgres_search(queryset, query)
+        elif vendor == "sqlite":
+            queryset = sqlite_search(queryset, query)
+        else:
+            queryset = fallback_search(queryset, query)
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by("-search_rank", "-id")
+        return queryset
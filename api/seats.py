@@ -0,0 +1,53 @@
+from __future__ import annotations
+from collections import defaultdict
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest, Least
+
+# 시험/수업 잔여석 예약/반환
+# - 행을 잠그고 읽은 뒤 확인하는 대신 조건부 UPDATE 한 번으로 처리하여 인기 항목에 신청이 몰려도 초과 판매 없음
+#   (PostgreSQL은 같은 행의 UPDATE가 직렬화되고 앞선 트랜잭션 커밋 후 WHERE 조건을 다시 평가)
+# - 정원이 없는 항목(remaining_seats NULL)은 NULL - 1 = NULL 이므로 잔여석 변화 없이 인기도만 변경
+# - 정원 변경도 읽은 값을 쓰지 않고 UPDATE 안에서 증감분만 반영 (SET의 F("capacity")는 변경 전 값)
+
+
+def reserve_seat(model, pk) -> bool:
+    """잔여석 1개 예약 + 인기도 증가 (잔여석이 없으면 False)"""
+    updated = (
+        model.objects
+        .filter(pk=pk)
+        .filter(Q(remaining_seats__isnull=True) | Q(remaining_seats__gt=0))
+        .update(remaining_seats=F("remaining_seats") - 1, popularity=F("popularity") + 1)
+    )
+    return updated == 1
+
+
+def release_seats(model, counts: dict[int, int]) -> None:
+    """항목별 취소 건수(pk -> count)만큼 잔여석 반환 + 인기도 감소 (취소 건수가 같은 항목끼리 UPDATE 1회)"""
+    pks_by_count = defaultdict(list)
+    for pk, count in counts.items():
+        pks_by_count[count].append(pk)
+    for count, pks in pks_by_count.items():
+        model.objects.filter(pk__in=pks).update(**released(count))
+
+
+def released(count: int) -> dict:
+    return {
+        "remaining_seats": Least(F("remaining_seats") + count, F("capacity")),
+        "popularity": Greatest(F("popularity") - count, 0),
+    }
+
+
+def resize_capacity(model, pk, capacity: int | None) -> None:
+    """
+    정원 변경 + 잔여석을 정원 증감분만큼 조정 (0 미만이 되지 않음)
+    - 정원이 없던 항목은 정원 - 인기도(취소되지 않은 신청 수), 정원을 없애면 잔여석 NULL
+    """
+    if capacity is None:
+        remaining = Value(None, output_field=IntegerField())
+    else:
+        remaining = Case(
+            When(capacity__isnull=True, then=Greatest(Value(capacity) - F("popularity"), 0)),
+            default=Greatest(F("remaining_seats") + (Value(capacity) - F("capacity")), 0),
+            output_field=IntegerField(),
+        )
+    model.objects.filter(pk=pk).update(capacity=capacity, remaining_seats=remaining)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+import random
+import time
+from collections import Counter
+from datetime import timedelta
+from itertools import islice
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from .models import Course, CourseRegistration, Payment, RegistrationBase, Tag, Test, TestRegistration, User
+from .tags import tag_cache
+
+# 부하 테스트/벤치마크용 카탈로그 데이터 생성 (seed_catalog 명령, 벤치마크 스위트에서 사용)
+# - 같은 seed면 같은 데이터 (id는 기존 최대 id 다음부터 직접 지정, 일정은 실행 시각 기준 상대값)
+# - 행은 모델 인스턴스로 만들고 청크 단위 bulk_create, PostgreSQL(psycopg 3)에서는 COPY로 기록
+# - bulk_create/COPY는 save()/시그널을 거치지 않으므로 인기도/잔여석은 생성한 신청 수로 미리 계산
+
+SEED_USER_PREFIX = "seed"
+SEED_USER_PASSWORD = "pass1234"
+TAG_NAMES = ["파이썬", "장고", "데이터 분석", "백엔드", "프론트엔드", "코틀린", "자바", "스프링", "알고리즘", "추천"]
+METHODS = [Payment.METHOD_CREDIT_CARD, Payment.METHOD_KAKAOPAY, Payment.METHOD_BANK]
+# 신청 상태 비율 (대기/완료/취소)
+STATUS_WEIGHTS = {
+    RegistrationBase.STATUS_PENDING: 6,
+    RegistrationBase.STATUS_COMPLETED: 3,
+    RegistrationBase.STATUS_CANCELED: 1,
+}
+# 정원이 있는 시험/수업 비율
+CAPACITY_RATIO = 0.3
+
+# 비우는 테이블 (clear)
+SEEDED_MODELS = [Payment, TestRegistration, CourseRegistration, Course.tags.through, Course, Test, Tag]
+
+
+def copy_supported() -> bool:
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return connection.vendor == "postgresql" and is_psycopg3
+
+
+def next_id(model) -> int:
+    return (model.objects.aggregate(last=Max("id"))["last"] or 0) + 1
+
+
+def clear_seeded_data() -> None:
+    """카탈로그/신청/결제 전체와 생성된 사용자(seed<id>) 삭제"""
+    # 행 단위 삭제(Collector) 대신 flush 명령과 같은 SQL (PostgreSQL: TRUNCATE, SQLite: DELETE + 시퀀스 초기화)
+    tables = [model._meta.db_table for model in SEEDED_MODELS]
+    with transaction.atomic(), connection.cursor() as cursor:
+        for sql in connection.ops.sql_flush(no_style(), tables, reset_sequences=True, allow_cascade=True):
+            cursor.execute(sql)
+    User.objects.filter(username__regex=rf"^{SEED_USER_PREFIX}[0-9]+$").delete()
+    tag_cache.clear()
+
+
+class CatalogSeeder:
+    def __init__(self, *, tests: int, courses: int, tags: int, users: int, registrations: int, seed: int = 0,
+                 chunk_size: int = 5000, use_copy: bool | None = None):
+        self.tests = tests
+        self.courses = courses
+        self.tags = tags
+        self.users = users
+        self.registrations = registrations  # 사용자당 신청 수
+        self.chunk_size = chunk_size
+        self.use_copy = copy_supported() if use_copy is None else use_copy
+        self.rng = random.Random(seed)
+        self.now = timezone.now()
+        self.stats: dict[str, tuple[int, float]] = {}  # 테이블 -> (행 수, 초)
+
+    def run(self) -> dict[str, tuple[int, float]]:
+        with transaction.atomic():
+            self.seed()
+            # 직접 지정한 id 다음부터 시퀀스가 이어지도록 재설정 (SQLite는 필요 없음)
+            statements = connection.ops.sequence_reset_sql(no_style(), [Tag, User, Test, Course, Course.tags.through,
+                                                                        TestRegistration, CourseRegistration, Payment])
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+        tag_cache.clear()
+        return self.stats
+
+    def seed(self) -> None:
+        rng = self.rng
+        tag_ids = self.seed_tags()
+        user_start = next_id(User)
+        password = make_password(SEED_USER_PASSWORD)  # 해시 계산은 한 번만
+        self.write(User, (
+            User(id=user_start + i, username=f"{SEED_USER_PREFIX}{user_start + i}",
+                 email=f"{SEED_USER_PREFIX}{user_start + i}@example.com", password=password,
+                 date_joined=self.now)
+            for i in range(self.users)
+        ))
+
+        # 사용자별 신청 대상을 먼저 정해 인기도/잔여석 계산
+        test_start, course_start = next_id(Test), next_id(Course)
+        targets = [("test", test_start + i) for i in range(self.tests)]
+        targets += [("course", course_start + i) for i in range(self.courses)]
+        statuses = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()),
+                               k=self.users * min(self.registrations, len(targets)))
+        registrations = []  # (사용자 id, 종류, 대상 id, 상태)
+        for i in range(self.users):
+            for kind, target_id in rng.sample(targets, min(self.registrations, len(targets))):
+                registrations.append((user_start + i, kind, target_id, statuses[len(registrations)]))
+        taken = Counter((kind, target_id) for _, kind, target_id, status in registrations
+                        if status != RegistrationBase.STATUS_CANCELED)
+
+        prices = {}
+        self.write(Test, (self.build_item(Test, "시험", test_start + i, taken["test", test_start + i], prices,
+                                          hours=(1, 6), price_unit=5000, price_steps=20)
+                          for i in range(self.tests)))
+        self.write(Course, (self.build_item(Course, "수업", course_start + i, taken["course", course_start + i],
+                                            prices, hours=(240, 720), price_unit=10000, price_steps=30)
+                            for i in range(self.courses)))
+        through = Course.tags.through
+        if tag_ids:
+            through_start = next_id(through)
+            course_tags = (
+                (course_start + i, tag_id)
+                for i in range(self.courses)
+                for tag_id in rng.sample(tag_ids, min(len(tag_ids), rng.randint(1, 3)))
+            )
+            self.write(through, (through(id=through_start + n, course_id=course_id, tag_id=tag_id)
+                                 for n, (course_id, tag_id) in enumerate(course_tags)))
+
+        models = {"test": (TestRegistration, "test_id"), "course": (CourseRegistration, "course_id")}
+        content_types = ContentType.objects.get_for_models(TestRegistration, CourseRegistration)
+        payments = []  # (사용자 id, 신청 모델, 신청 id, 상태, 금액)
+        for kind, (model, field) in models.items():
+            start = next_id(model)
+            rows = [row for row in registrations if row[1] == kind]
+            self.write(model, (
+                model(id=start + n, user_id=user_id, status=status, created_at=self.now, updated_at=self.now,
+                      **{field: target_id})
+                for n, (user_id, _, target_id, status) in enumerate(rows)
+            ))
+            payments.extend((user_id, model, start + n, status, prices[kind, target_id])
+                            for n, (user_id, _, target_id, status) in enumerate(rows))
+
+        payment_start = next_id(Payment)
+        self.write(Payment, (
+            Payment(
+                id=payment_start + n, user_id=user_id, amount=amount, original_price=amount,
+                method=rng.choice(METHODS), created_at=self.now, updated_at=self.now,
+                status=Payment.STATUS_CANCELED if status == RegistrationBase.STATUS_CANCELED else Payment.STATUS_PAID,
+                canceled_at=self.now if status == RegistrationBase.STATUS_CANCELED else None,
+                target_content_type_id=content_types[model].id, target_object_id=registration_id,
+            )
+            for n, (user_id, model, registration_id, status, amount) in enumerate(payments)
+        ))
+
+    def seed_tags(self) -> list[int]:
+        names = (TAG_NAMES + [f"태그 {i}" for i in range(len(TAG_NAMES) + 1, self.tags + 1)])[:self.tags]
+        existing = dict(Tag.objects.filter(name__in=names).values_list("name", "id"))
+        start = next_id(Tag)
+        missing = [name for name in names if name not in existing]
+        self.write(Tag, (Tag(id=start + i, name=name) for i, name in enumerate(missing)))
+        existing.update((name, start + i) for i, name in enumerate(missing))
+        return [existing[name] for name in names]
+
+    def build_item(self, model, label: str, pk: int, taken: int, prices: dict, *, hours: tuple[int, int],
+                   price_unit: int, price_steps: int):
+        rng = self.rng
+        # 시작 시각은 현재 기준 -15일 ~ +15일
+        start_at = self.now + timedelta(days=rng.uniform(-15, 15))
+        price = rng.randint(1, price_steps) * price_unit
+        prices[model._meta.model_name, pk] = price
+        capacity = taken + rng.randint(0, 50) if rng.random() < CAPACITY_RATIO else None
+        return model(
+            id=pk, title=f"{label} 제목 {pk}", description=f"이것은 {label} 번호 {pk}에 대한 상세 설명입니다.",
+            start_at=start_at, end_at=start_at + timedelta(hours=rng.uniform(*hours)), popularity=taken,
+            price=price, capacity=capacity, remaining_seats=None if capacity is None else capacity - taken,
+            created_at=self.now, updated_at=self.now,
+        )
+
+    def write(self, model, objs) -> None:
+        """모델 인스턴스를 chunk_size 단위로 기록 (COPY 또는 bulk_create)"""
+        started = time.perf_counter()
+        count = 0
+        objs = iter(objs)
+        while chunk := list(islice(objs, self.chunk_size)):
+            if self.use_copy:
+                self.copy(model, chunk)
+            else:
+                model.objects.bulk_create(chunk)
+            count += len(chunk)
+        if count:
+            self.stats[model._meta.db_table] = (count, time.perf_counter() - started)
+
+    def copy(self, model, objs) -> None:
+        fields = model._meta.concrete_fields
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        with connection.cursor() as cursor:
+            with cursor.copy(f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN") as copy:
+                for obj in objs:
+                    copy.write_row([getattr(obj, field.attname) for field in fields])
@@ -2,6 +2,7 @@ from __future__ import annotations
 from django.contrib.auth.hashers import make_password
 from rest_framework import serializers
 from .models import User, Test, Course, Payment, TestRegistration, CourseRegistration
+from .tags import TagNameField
 
 class SignupSerializer(serializers.ModelSerializer):
     class Meta:
@@ -19,13 +20,17 @@ class SignupSerializer(serializers.ModelSerializer):
 class TestSerializer(serializers.ModelSerializer):
     class Meta:
         model = Test
-        fields = ["id", "title", "description", "start_at", "end_at", "popularity", "created_at", "price"]
+        fields = ["id", "title", "description", "start_at", "end_at", "popularity", "created_at", "price",
+                  "capacity", "remaining_seats"]
 
 
 class CourseSerializer(serializers.ModelSerializer):
+    tags = TagNameField(many=True)
+
     class Meta:
         model = Course
-        fields = ["id", "title", "description", "start_at", "end_at", "popularity", "created_at", "price"]
+        fields = ["id", "title", "description", "start_at", "end_at", "popularity", "created_at", "price",
+                  "capacity", "remaining_seats", "tags"]
 
 
 class PaymentSerializer(serializers.ModelSerializer):
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from collections import Counter, defaultdict
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from config.metrics import record_cancellation
+from .models import Course, CourseRegistration, Payment, RegistrationBase, Test, TestRegistration
+from .seats import release_seats
+
+# 여러 건을 한 번에 처리하는 신청/결제 작업 (호출하는 쪽에서 transaction.atomic 안에서 사용)
+
+COMPLETED = "completed"
+ALREADY_COMPLETED = "already_completed"
+CANCELED = "canceled"
+NOT_FOUND = "not_found"
+
+COMPLETE_RESULTS = {
+    None: NOT_FOUND,  # 없는 신청 또는 다른 사용자의 신청
+    RegistrationBase.STATUS_PENDING: COMPLETED,
+    RegistrationBase.STATUS_COMPLETED: ALREADY_COMPLETED,
+    RegistrationBase.STATUS_CANCELED: CANCELED,
+}
+
+
+def complete_registrations(user, model, ids: list[int]) -> dict[int, str]:
+    """
+    사용자의 신청(model: TestRegistration/CourseRegistration) ids를 완료 처리하고 id별 결과 반환
+    - 소유자/상태 확인 조회 1회(행 잠금) + 대기(pending) 신청 UPDATE 1회
+    - 완료/취소된 신청은 변경하지 않음 (단건 complete와 같은 규칙)
+    """
+    if not ids:
+        return {}
+    statuses = dict(
+        model.objects.select_for_update().filter(id__in=ids, user=user).values_list("id", "status")
+    )
+    pending = [pk for pk, status in statuses.items() if status == RegistrationBase.STATUS_PENDING]
+    if pending:
+        model.objects.filter(id__in=pending).update(
+            status=RegistrationBase.STATUS_COMPLETED, updated_at=timezone.now()
+        )
+    return {pk: COMPLETE_RESULTS[statuses.get(pk)] for pk in ids}
+
+
+def complete_expired_chunk(model, target_field: str, cutoff, after_id: int, limit: int) -> tuple[int, int | None]:
+    """
+    대상(target_field: "test"/"course")의 end_at이 cutoff 이전인 대기 신청을 id 순으로 limit건 완료 처리
+    - id > after_id 키셋 조회 1회 + 조건부 UPDATE 1회 (호출하는 쪽에서 청크마다 짧은 트랜잭션으로 감쌈)
+    - 조회와 UPDATE 사이에 취소/완료된 신청은 status 조건으로 제외
+    - 반환: (완료 처리 수, 이번 청크의 마지막 id, 남은 대상이 없으면 None)
+    """
+    ids = list(
+        model.objects.filter(
+            status=RegistrationBase.STATUS_PENDING, id__gt=after_id, **{f"{target_field}__end_at__lt": cutoff}
+        ).order_by("id").values_list("id", flat=True)[:limit]
+    )
+    if not ids:
+        return 0, None
+    completed = model.objects.filter(id__in=ids, status=RegistrationBase.STATUS_PENDING).update(
+        status=RegistrationBase.STATUS_COMPLETED, updated_at=timezone.now()
+    )
+    return completed, ids[-1]
+
+
+ALREADY_CANCELED = "already_canceled"
+NOT_CANCELABLE = "not_cancelable"
+
+
+def payment_targets() -> dict[int, tuple]:
+    """결제 대상 ContentType id -> (신청 모델, 시험/수업 모델, 대상 필드 = 종류) (ContentType은 캐시에서 조회)"""
+    specs = ((TestRegistration, Test, "test"), (CourseRegistration, Course, "course"))
+    content_types = ContentType.objects.get_for_models(*(model for model, _, _ in specs))
+    return {content_types[model].id: (model, target_model, field) for model, target_model, field in specs}
+
+
+def cancel_payments(user, ids: list[int]) -> dict[int, str]:
+    """
+    사용자의 결제 ids를 취소하고 id별 결과 반환 (단건 취소와 같은 규칙)
+    - 결제 잠금 조회 1회 + 대상 신청 종류별 잠금 조회 1회
+    - 결제/신청 상태 변경은 종류별 UPDATE ... IN 1회, 잔여석/인기도는 항목별 취소 건수로 모아 F() UPDATE
+    - 완료된 신청의 결제는 취소 불가, 이미 취소된 신청은 잔여석을 다시 반환하지 않음
+    """
+    if not ids:
+        return {}
+    payments = list(
+        Payment.objects.select_for_update().filter(id__in=ids, user=user)
+        .values_list("id", "status", "target_content_type_id", "target_object_id")
+    )
+    targets = payment_targets()
+    registration_ids = defaultdict(set)
+    for _, status, content_type_id, object_id in payments:
+        if status == Payment.STATUS_PAID and content_type_id in targets:
+            registration_ids[content_type_id].add(object_id)
+    # (ContentType id, 신청 id) -> (신청 상태, 시험/수업 id)
+    registrations = {}
+    for content_type_id, object_ids in registration_ids.items():
+        model, _, field = targets[content_type_id]
+        rows = model.objects.select_for_update().filter(id__in=object_ids).values_list("id", "status", f"{field}_id")
+        registrations.update(((content_type_id, pk), (status, target_id)) for pk, status, target_id in rows)
+
+    results = {}
+    canceled_payments = defaultdict(list)
+    canceled_registrations = defaultdict(set)
+    for pk, status, content_type_id, object_id in payments:
+        registration = registrations.get((content_type_id, object_id))
+        if status == Payment.STATUS_CANCELED:
+            results[pk] = ALREADY_CANCELED
+        elif registration and registration[0] == RegistrationBase.STATUS_COMPLETED:
+            results[pk] = NOT_CANCELABLE
+        else:
+            results[pk] = CANCELED
+            canceled_payments[content_type_id].append(pk)
+            if registration and registration[0] != RegistrationBase.STATUS_CANCELED:
+                canceled_registrations[content_type_id].add(object_id)
+
+    now = timezone.now()
+    if canceled_payments:
+        Payment.objects.filter(id__in=[pk for pks in canceled_payments.values() for pk in pks]).update(
+            status=Payment.STATUS_CANCELED, canceled_at=now, updated_at=now
+        )
+    for content_type_id, object_ids in canceled_registrations.items():
+        model, target_model, _ = targets[content_type_id]
+        model.objects.filter(id__in=object_ids).update(status=RegistrationBase.STATUS_CANCELED, updated_at=now)
+        release_seats(target_model, Counter(registrations[content_type_id, pk][1] for pk in object_ids))
+    for content_type_id, pks in canceled_payments.items():
+        if content_type_id in targets:
+            record_cancellation(targets[content_type_id][2], len(pks))
+    return {pk: results.get(pk, NOT_FOUND) for pk in ids}
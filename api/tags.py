@@ -0,0 +1,92 @@
+from __future__ import annotations
+from django.conf import settings
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from .jwt_auth import TTLLRUCache
+from .models import Course, Tag
+
+# 태그 사전(id <-> 이름) 프로세스 내 캐시
+# - Tag 테이블은 작고 거의 바뀌지 않으므로 전체를 한 번에 읽어 두고 응답의 태그 이름/필터의 이름->ID 변환에 사용
+# - 태그 저장/삭제 시 즉시 무효화, 다른 워커 프로세스는 TTL 이내에 갱신 (모르는 ID는 즉시 다시 읽음)
+
+_tag_cache_settings = getattr(settings, "TAG_CACHE", {})
+tag_cache = TTLLRUCache(max_size=1, ttl=_tag_cache_settings.get("TTL", 300))
+
+TAG_MATCH_ANY = "any"
+TAG_MATCH_ALL = "all"
+
+
+class TagDictionary:
+    def __init__(self, pairs):
+        self.names = dict(pairs)
+        self.ids = {name: tag_id for tag_id, name in self.names.items()}
+
+
+def get_tag_dictionary(refresh: bool = False) -> TagDictionary:
+    tags = None if refresh else tag_cache.get("tags")
+    if tags is None:
+        tags = TagDictionary(Tag.objects.values_list("id", "name"))
+        tag_cache.set("tags", tags)
+    return tags
+
+
+def get_tag_names(tag_ids) -> list[str]:
+    """태그 ID 목록 -> 이름 목록 (캐시에 없는 ID가 있으면 한 번 다시 읽음, 삭제된 태그는 제외)"""
+    tags = get_tag_dictionary()
+    if any(tag_id not in tags.names for tag_id in tag_ids):
+        tags = get_tag_dictionary(refresh=True)
+    return [tags.names[tag_id] for tag_id in tag_ids if tag_id in tags.names]
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_dictionary(sender, instance, **kwargs):
+    tag_cache.clear()
+
+
+class TagNameField(serializers.RelatedField):
+    """
+    태그 이름 (태그 사전 캐시 사용)
+    - many=True 목록은 ValuesSerializer 경로에서 through 테이블 한 번 조회 후 represent_pks로 변환
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        names = get_tag_names([value.pk])
+        return names[0] if names else None
+
+    @staticmethod
+    def represent_pks(tag_ids) -> list[str]:
+        return get_tag_names(tag_ids)
+
+
+def filter_by_tags(queryset, query_params):
+    """
+    ?tags=이름1,이름2 (&tags_match=any|all) 로 수업 필터링
+    - any: 태그 중 하나라도 가진 수업, all: 모든 태그를 가진 수업
+    - api_course_tags의 (tag_id) 인덱스로 수업 ID를 찾는 서브쿼리 사용 (Tag 테이블 조인 없음)
+    """
+    value = query_params.get("tags")
+    if not value:
+        return queryset
+    match = query_params.get("tags_match", TAG_MATCH_ANY)
+    if match not in (TAG_MATCH_ANY, TAG_MATCH_ALL):
+        raise ValidationError({"tags_match": f"{TAG_MATCH_ANY} 또는 {TAG_MATCH_ALL}만 사용할 수 있습니다."})
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    tags = get_tag_dictionary()
+    if any(name not in tags.ids for name in names):
+        tags = get_tag_dictionary(refresh=True)
+    tag_ids = {tags.ids[name] for name in names if name in tags.ids}
+    if not tag_ids or (match == TAG_MATCH_ALL and len(tag_ids) < len(names)):
+        return queryset.none()
+
+    course_ids = Course.tags.through.objects.filter(tag_id__in=tag_ids).values("course_id")
+    if match == TAG_MATCH_ALL and len(tag_ids) > 1:
+        course_ids = course_ids.annotate(matched=Count("tag_id")).filter(matched=len(tag_ids)).values("course_id")
+    return queryset.filter(id__in=course_ids)
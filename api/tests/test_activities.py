@@ -0,0 +1,58 @@
+from __future__ import annotations
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import Course, Test
+from api.tests.test_api import BaseAPITestCase
+
+
+class ActivityCatalogTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        # 종류가 달라도 정렬 키가 같은 항목(동순위)을 섞어 생성
+        for i in range(5):
+            Test.objects.create(title=f"T{i + 3}", popularity=i % 3, price=1000)
+            Course.objects.create(title=f"C{i + 3}", popularity=i % 3, price=1000)
+
+    def collect(self, **params):
+        items, pages = [], 0
+        r = self.client.get("/api/activities", {"page_size": 3, **params})
+        while True:
+            self.assertEqual(r.status_code, 200)
+            body = r.json()
+            items.extend((item["type"], item["id"]) for item in body["results"])
+            pages += 1
+            if not body["next"]:
+                return items, pages
+            r = self.client.get(body["next"])
+
+    def expected(self, *order_by):
+        rows = [("test", t.id, t) for t in Test.objects.all()] + [("course", c.id, c) for c in Course.objects.all()]
+        kind = {"test": 0, "course": 1}
+        field = order_by[0].lstrip("-")
+        rows.sort(key=lambda row: (getattr(row[2], field), kind[row[0]], row[1]), reverse=order_by[0].startswith("-"))
+        return [(name, pk) for name, pk, _ in rows]
+
+    def test_merged_pages_follow_ordering(self):
+        for ordering in ("-created_at", "created_at", "-popularity", "popularity"):
+            items, pages = self.collect(ordering=ordering)
+            self.assertEqual(items, self.expected(ordering), ordering)
+            self.assertEqual(pages, 5)
+
+    def test_one_query_per_page(self):
+        self.client.get("/api/activities")  # 사용자 캐시 적재
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.get("/api/activities", {"page_size": 3, "ordering": "-popularity"})
+            self.client.get(r.json()["next"])
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertIn("UNION ALL", ctx.captured_queries[0]["sql"])
+
+    def test_filters_and_invalid_params(self):
+        items, _ = self.collect(type="course", status="available")
+        self.assertEqual(items, [("course", self.course_open.id)])
+        first = self.client.get("/api/activities", {"page_size": 1}).json()
+        self.assertEqual(set(first["results"][0]), {"id", "type", "title", "description", "start_at", "end_at",
+                                                    "popularity", "created_at", "price", "capacity",
+                                                    "remaining_seats"})
+        self.assertEqual(self.client.get(first["next"] + "&ordering=popularity").status_code, 404)
+        self.assertEqual(self.client.get("/api/activities", {"cursor": "broken"}).status_code, 404)
+        self.assertEqual(self.client.get("/api/activities", {"ordering": "title"}).status_code, 400)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from datetime import timedelta
 from django.utils import timezone
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
@@ -9,6 +10,7 @@ from api.models import Test, Course, TestRegistration, CourseRegistration, Payme
 
 class BaseAPITestCase(TestCase):
     def setUp(self):
+        cache.clear()  # 로그인 시도 제한 카운터 초기화
         self.client = APIClient()
         User = get_user_model()
         self.user = User.objects.create_user(
@@ -208,9 +210,15 @@ class RecommendTests(BaseAPITestCase):
         )
         course2.tags.add(tag_math)
 
+        # 다른 사용자의 취소된 신청이 있어도 태그/수강한 수업 판단에 영향 없음
+        other = get_user_model().objects.create_user(username="other", email="other@example.com")
+        CourseRegistration.objects.create(user=other, course=self.course_open,
+                                          status=CourseRegistration.STATUS_CANCELED)
+
         r = self.client.get("/api/courses/recommend")
         self.assertEqual(r.status_code, 200)
         self.assertIn("results", r.data)  # 페이지네이션 확인
+        self.assertEqual([course["id"] for course in r.data["results"]], [course2.id])
 
 
 class PaginationTests(BaseAPITestCase):
@@ -0,0 +1,116 @@
+from __future__ import annotations
+import asyncio
+from unittest import mock
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import AsyncClient, SimpleTestCase
+from django.utils.module_loading import import_string
+from rest_framework import permissions
+from config.throttling import TokenBucketThrottle
+from api.models import Payment, Tag, Course
+from api.tests.test_api import BaseAPITestCase
+from api.viewsets import RecommendCoursesViewSet
+
+
+class AsyncReadEndpointTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        tag = Tag.objects.create(name="python")
+        self.course_open.tags.add(tag)
+        Course.objects.create(title="C3", start_at=self.open_start, end_at=self.open_end, price=30000).tags.add(tag)
+        self.client.post(
+            f"/api/tests/{self.test_open.id}/apply",
+            {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD},
+            format="json",
+        )
+        self.client.post(
+            f"/api/courses/{self.course_open.id}/enroll",
+            {"amount": 20000, "payment_method": Payment.METHOD_KAKAOPAY},
+            format="json",
+        )
+        self.auth_headers = {"Authorization": self.client._credentials["HTTP_AUTHORIZATION"]}
+        self.async_client = AsyncClient()
+
+    async def assert_same_response(self, sync_path, async_path):
+        sync_response = await self.sync_get(sync_path)
+        async_response = await self.async_client.get(async_path, headers=self.auth_headers)
+        self.assertEqual(async_response.status_code, 200)
+        # 페이지 링크의 경로를 제외하면 동기 응답과 동일해야 함
+        self.assertEqual(
+            async_response.content.replace(b"/api/async/", b"/api/"),
+            sync_response.content,
+        )
+
+    async def sync_get(self, path):
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(self.client.get)(path)
+
+    async def test_catalog_lists_match_sync_endpoints(self):
+        await self.assert_same_response("/api/tests/?page_size=1", "/api/async/tests/?page_size=1")
+        await self.assert_same_response(
+            "/api/courses/?ordering=popularity&page=2&page_size=1",
+            "/api/async/courses/?ordering=popularity&page=2&page_size=1",
+        )
+
+    async def test_my_payments_and_recommend_match_sync_endpoints(self):
+        await self.assert_same_response("/api/me/payments?status=paid", "/api/async/me/payments?status=paid")
+        await self.assert_same_response("/api/courses/recommend", "/api/async/courses/recommend")
+
+    async def test_requires_authentication(self):
+        r = await AsyncClient().get("/api/async/tests/")
+        self.assertEqual(r.status_code, 401)
+        self.assertIn("WWW-Authenticate", r)
+
+    async def test_throttle_runs_off_event_loop_and_shares_bucket(self):
+        in_event_loop = []
+        allow_request = TokenBucketThrottle.allow_request
+
+        def record(throttle, request, view):
+            try:
+                asyncio.get_running_loop()
+                in_event_loop.append(True)
+            except RuntimeError:
+                in_event_loop.append(False)
+            self.assertIsInstance(view, RecommendCoursesViewSet)
+            return allow_request(throttle, request, view)
+
+        with mock.patch.dict(TokenBucketThrottle.THROTTLE_RATES, {"recommend": "4/min"}), \
+                mock.patch.object(TokenBucketThrottle, "allow_request", record):
+            self.assertEqual((await self.sync_get("/api/courses/recommend")).status_code, 200)
+            r = await self.async_client.get("/api/async/courses/recommend", headers=self.auth_headers)
+        self.assertEqual(r.status_code, 429)
+        self.assertIn("Retry-After", r)
+        # 캐시 I/O는 이벤트 루프 밖에서 수행
+        self.assertEqual(in_event_loop, [False, False])
+
+    async def test_viewset_permission_classes_apply(self):
+        with mock.patch.object(RecommendCoursesViewSet, "permission_classes", [permissions.IsAdminUser]):
+            r = await self.async_client.get("/api/async/courses/recommend", headers=self.auth_headers)
+        self.assertEqual(r.status_code, 403)
+
+    async def test_invalid_page(self):
+        r = await self.async_client.get("/api/async/tests/?page=99", headers=self.auth_headers)
+        self.assertEqual(r.status_code, 404)
+
+    async def test_sql_stats_collected_in_async_chain(self):
+        with self.assertLogs("api.sql", level="INFO") as logs:
+            r = await self.async_client.get("/api/async/tests/", headers=self.auth_headers)
+        self.assertEqual(r.status_code, 200)
+        summary = logs.records[-1].sql_summary
+        self.assertEqual(summary["view"], "async_tests")
+        self.assertGreaterEqual(summary["queries"], 2)
+
+
+class AsyncMiddlewareTests(SimpleTestCase):
+    def test_project_middlewares_stay_async(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        # 하나라도 동기 전용이면 ASGI 요청마다 sync_to_async 전환이 생김
+        for path in settings.MIDDLEWARE:
+            middleware = import_string(path)
+            self.assertTrue(getattr(middleware, "async_capable", False), path)
+            if path.startswith("config."):
+                self.assertTrue(iscoroutinefunction(middleware(get_response)), path)
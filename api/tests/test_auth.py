@@ -1,11 +1,18 @@
 from __future__ import annotations
+import threading
+from unittest import mock
+from django.contrib.auth import hashers
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from api.authentication import LoginEmailRateThrottle, password_pool
 
 
 class AuthTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
 
     def test_signup_and_login(self):
@@ -28,3 +35,126 @@ class AuthTests(TestCase):
         self.assertIn("access", resp.data)
 
 
+
+
+
+class LoginPathTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        get_user_model().objects.create_user(
+            username="login", email="login@example.com", password="pass1234"
+        )
+
+    def login(self, email, password):
+        return self.client.post("/api/login", {"email": email, "password": password}, format="json")
+
+    def test_unknown_email_and_wrong_password_share_response(self):
+        # 존재하지 않는 이메일도 더미 해시 검증을 거쳐 동일한 응답
+        with mock.patch.object(password_pool, "check", wraps=password_pool.check) as check:
+            r1 = self.login("nobody@example.com", "pass1234")
+            r2 = self.login("login@example.com", "wrong")
+        self.assertEqual(check.call_count, 2)
+        self.assertEqual(r1.status_code, 401)
+        self.assertEqual(r2.status_code, 401)
+        self.assertEqual(r1.data, r2.data)
+
+    def test_login_rate_limited_per_email(self):
+        with mock.patch.dict(LoginEmailRateThrottle.THROTTLE_RATES, {"login_email": "2/min"}):
+            self.assertEqual(self.login("login@example.com", "wrong").status_code, 401)
+            self.assertEqual(self.login("login@example.com", "wrong").status_code, 401)
+            r = self.login("login@example.com", "pass1234")
+        self.assertEqual(r.status_code, 429)
+
+    def test_login_rejected_when_hash_pool_is_full(self):
+        full = threading.BoundedSemaphore(1)
+        full.acquire()
+        with mock.patch.object(password_pool, "_slots", full):
+            r = self.login("login@example.com", "pass1234")
+        self.assertEqual(r.status_code, 429)
+        self.assertIn("Retry-After", r)
+
+    def test_outdated_hash_is_rehashed_in_pool(self):
+
+        user = get_user_model().objects.get(email="login@example.com")
+        user.password = hashers.PBKDF2PasswordHasher().encode("pass1234", hashers.PBKDF2PasswordHasher().salt(), 1000)
+        user.save(update_fields=["password"])
+
+        threads = []
+        make_password = hashers.make_password
+
+        def record(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return make_password(*args, **kwargs)
+
+        with mock.patch("api.authentication.make_password", record):
+            r = self.login("login@example.com", "pass1234")
+        self.assertEqual(r.status_code, 200)
+        # 재해시(PBKDF2)는 요청 스레드가 아닌 해시 풀에서 계산
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("password-check"))
+        user.refresh_from_db()
+        self.assertFalse(user.password.startswith("pbkdf2_sha256$1000$"))
+        self.assertTrue(user.check_password("pass1234"))
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        from api.jwt_auth import user_cache
+
+        user_cache.clear()
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            username="cached", email="cached@example.com", password="pass1234"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()}")
+
+    def login(self, password="pass1234"):
+        resp = self.client.post(
+            "/api/login",
+            {"email": "cached@example.com", "password": password},
+            format="json",
+        )
+        return resp.data["access"]
+
+    def test_second_request_skips_user_query(self):
+        # 첫 요청: 사용자 조회 1회 + 목록 count/select
+        with self.assertNumQueries(2):
+            self.client.get("/api/tests/")
+        # 두 번째 요청부터는 캐시된 사용자 사용
+        with self.assertNumQueries(1):
+            r = self.client.get("/api/tests/")
+        self.assertEqual(r.status_code, 200)
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get("/api/tests/")
+        self.user.is_active = False
+        self.user.save()
+
+        r = self.client.get("/api/tests/")
+        self.assertEqual(r.status_code, 401)
+
+    def test_queryset_update_needs_explicit_invalidation(self):
+        from api.jwt_auth import invalidate_users
+
+        self.client.get("/api/tests/")
+        get_user_model().objects.filter(pk=self.user.pk).update(is_active=False)
+        # 시그널이 없으므로 TTL 동안 캐시된 사용자로 인증
+        self.assertEqual(self.client.get("/api/tests/").status_code, 200)
+        invalidate_users([self.user.pk])
+        self.assertEqual(self.client.get("/api/tests/").status_code, 401)
+
+    # simplejwt 모듈들이 설정 객체를 import 시점에 가져가므로 override_settings 대신 직접 변경
+    @mock.patch.object(jwt_settings, "CHECK_REVOKE_TOKEN", True)
+    def test_revoked_token_rejected_on_cache_hit(self):
+        old = self.login()
+        self.user.set_password("newpass1234")
+        self.user.save()
+        # 새 비밀번호로 발급한 토큰의 요청이 캐시를 다시 채운 뒤에도 이전 토큰은 거부
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login('newpass1234')}")
+        self.assertEqual(self.client.get("/api/tests/").status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {old}")
+        r = self.client.get("/api/tests/")
+        self.assertEqual(r.status_code, 401)
+        self.assertEqual(r.data["detail"].code, "password_changed")
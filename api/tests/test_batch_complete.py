@@ -0,0 +1,58 @@
+from __future__ import annotations
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from api.models import CourseRegistration, RegistrationBase, TestRegistration
+from api.tests.test_api import BaseAPITestCase
+
+
+class BatchCompleteTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        other = get_user_model().objects.create_user(username="other", email="other@example.com")
+        self.pending = TestRegistration.objects.create(user=self.user, test=self.test_open)
+        self.done = TestRegistration.objects.create(user=self.user, test=self.test_closed,
+                                                    status=RegistrationBase.STATUS_COMPLETED)
+        self.canceled = CourseRegistration.objects.create(user=self.user, course=self.course_open,
+                                                          status=RegistrationBase.STATUS_CANCELED)
+        self.course_pending = CourseRegistration.objects.create(user=self.user, course=self.course_closed)
+        self.others = TestRegistration.objects.create(user=other, test=self.test_open)
+
+    def post(self, body):
+        return self.client.post("/api/registrations/complete", body, format="json")
+
+    def test_per_id_results(self):
+        r = self.post({
+            "test_ids": [self.pending.id, self.done.id, self.others.id, 999999, self.pending.id],
+            "course_ids": [self.canceled.id, self.course_pending.id],
+        })
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["completed"], 2)
+        self.assertEqual([(item["target_type"], item["id"], item["result"]) for item in r.json()["results"]], [
+            ("test", self.pending.id, "completed"),
+            ("test", self.done.id, "already_completed"),
+            ("test", self.others.id, "not_found"),
+            ("test", 999999, "not_found"),
+            ("course", self.canceled.id, "canceled"),
+            ("course", self.course_pending.id, "completed"),
+        ])
+        statuses = dict(TestRegistration.objects.values_list("id", "status"))
+        self.assertEqual(statuses[self.pending.id], RegistrationBase.STATUS_COMPLETED)
+        self.assertEqual(statuses[self.others.id], RegistrationBase.STATUS_PENDING)
+        self.canceled.refresh_from_db()
+        self.assertEqual(self.canceled.status, RegistrationBase.STATUS_CANCELED)
+
+    def test_query_count_independent_of_batch_size(self):
+        ids = [TestRegistration.objects.create(user=self.user, test=self.test_open).id for _ in range(50)]
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.post({"test_ids": ids})
+        self.assertEqual(r.json()["completed"], 50)
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+
+    @override_settings(BATCH_COMPLETE_MAX_IDS=2)
+    def test_validation(self):
+        self.assertEqual(self.post({"test_ids": [1, 2, 3]}).status_code, 400)
+        self.assertEqual(self.post({"course_ids": ["1"]}).status_code, 400)
+        self.assertEqual(self.post({"test_ids": [self.pending.id]}).status_code, 200)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from api.benchmarking import SCENARIOS, find_regressions
+
+
+class BenchmarkEndpointsTests(TestCase):
+    def run_command(self, output, *args):
+        call_command("benchmark_endpoints", "--current-db", "--tests", "30", "--courses", "30", "--users", "6",
+                     "--registrations", "3", "--iterations", "3", "--warmup", "1", "--output", str(output), *args,
+                     stdout=StringIO(), stderr=StringIO())
+        return json.loads(Path(output).read_text())
+
+    def test_every_scenario_succeeds_and_reports_percentiles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            results = self.run_command(Path(tmp) / "endpoints.json")
+        self.assertEqual(list(results["endpoints"]), [scenario.name for scenario in SCENARIOS])
+        for name, result in results["endpoints"].items():
+            self.assertEqual(result["errors"], 0, name)
+            self.assertGreater(result["requests"], 0, name)
+            self.assertLessEqual(result["p50_ms"], result["p95_ms"])
+            self.assertLessEqual(result["p95_ms"], result["p99_ms"])
+        # 조회 시나리오는 빈 목록으로 일찍 끝나지 않고 실제 조회 경로를 측정
+        for scenario in SCENARIOS:
+            if scenario.method == "GET":
+                self.assertEqual(results["endpoints"][scenario.name]["empty"], 0, scenario.name)
+        self.assertEqual(results["meta"]["vendor"], "sqlite")
+
+    def test_fails_against_faster_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = {"endpoints": {"tests-list": {"p50_ms": 0.001, "queries": 1}}}
+            (Path(tmp) / "baseline.json").write_text(json.dumps(baseline))
+            with self.assertRaisesMessage(CommandError, "tests-list: queries 1 -> "):
+                self.run_command(Path(tmp) / "endpoints.json", "--only", "tests-list",
+                                 "--baseline", str(Path(tmp) / "baseline.json"))
+
+    def test_find_regressions(self):
+        baseline = {"endpoints": {"a": {"p50_ms": 10.0, "queries": 3}, "b": {"p50_ms": 0.2, "queries": 2}}}
+        results = {"endpoints": {"a": {"p50_ms": 11.0, "queries": 3}, "b": {"p50_ms": 0.5, "queries": 2},
+                                 "c": {"p50_ms": 100.0, "queries": 9}}}
+        self.assertEqual(find_regressions(baseline, results), [])  # 10% 증가, 1ms 미만 증가, 기준 없음
+        results["endpoints"]["a"] = {"p50_ms": 14.0, "queries": 4}
+        self.assertEqual(find_regressions(baseline, results), ["a: p50 10.00ms -> 14.00ms (+40%)", "a: queries 3 -> 4"])
+        self.assertEqual(find_regressions(baseline, results, threshold=0.5), ["a: queries 3 -> 4"])
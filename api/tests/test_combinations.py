@@ -0,0 +1,145 @@
+from __future__ import annotations
+import random
+import time
+from datetime import timedelta
+from unittest import mock
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from api.combinations import (
+    CombinationSearchPool,
+    CombinationSearchTimeout,
+    SearchDeadlineExceeded,
+    search_all,
+    search_subtree,
+    to_intervals,
+    unique_combinations,
+)
+from api.tests.test_api import BaseAPITestCase
+from api.viewsets import combination_pool
+
+
+def reference_combinations(activities):
+    """기존 재귀 탐색 구현 (결과 순서 비교용)"""
+    results = []
+
+    def overlap(a, b):
+        return a["start_at"] < b["end_at"] and b["start_at"] < a["end_at"]
+
+    def find(start_index, current):
+        if current:
+            results.append(list(current))
+        for i in range(start_index, len(activities)):
+            if all(not overlap(existing, activities[i]) for existing in current):
+                current.append(activities[i])
+                find(i + 1, current)
+                current.pop()
+
+    find(0, [])
+    return results
+
+
+def make_activities(count, seed=0):
+    rnd = random.Random(seed)
+    now = timezone.now()
+    activities = []
+    for i in range(count):
+        start = now + timedelta(minutes=rnd.randint(0, 600), microseconds=rnd.randint(0, 999999))
+        activities.append({
+            "id": i + 1, "name": f"A{i}", "type": "test",
+            "start_at": start, "end_at": start + timedelta(minutes=rnd.randint(10, 180)),
+        })
+    activities.sort(key=lambda x: x["start_at"])
+    return activities
+
+
+class CombinationSearchTests(SimpleTestCase):
+    def test_search_matches_reference_order(self):
+        for seed in range(5):
+            activities = make_activities(10, seed)
+            expected = reference_combinations(activities)
+            actual = [[activities[i] for i in combo] for combo in search_all(to_intervals(activities))]
+            self.assertEqual(actual, expected)
+
+    def test_process_pool_matches_inline_search(self):
+        activities = make_activities(12, seed=7)
+        intervals = to_intervals(activities)
+        self.assertEqual(combination_pool.search(intervals), search_all(intervals))
+
+    def test_worker_stops_after_deadline(self):
+        intervals = [(i * 10, i * 10 + 5) for i in range(16)]
+        with self.assertRaises(SearchDeadlineExceeded):
+            search_subtree(intervals, 0, deadline=time.time() - 1)
+
+    def test_timeout_waits_for_running_subtrees(self):
+        # 겹치지 않는 22개: 첫 하위 탐색만 2^21개 조합 (중단하지 않으면 수 초)
+        intervals = [(i * 10, i * 10 + 5) for i in range(22)]
+        pool = CombinationSearchPool(workers=2, timeout=0.05, max_pending=1)
+        pool.start()
+        try:
+            started = time.monotonic()
+            with self.assertRaises(CombinationSearchTimeout):
+                pool.search(intervals)
+            self.assertLess(time.monotonic() - started, 1.0)
+            # 반환 시점에 이 요청의 작업이 모두 끝나 워커가 바로 다음 탐색을 처리
+            pool.timeout = 10
+            started = time.monotonic()
+            self.assertEqual(pool.search(intervals[:8]), search_all(intervals[:8]))
+            self.assertLess(time.monotonic() - started, 1.0)
+        finally:
+            pool._executor.shutdown()
+
+    def test_unique_combinations_by_activity_fields(self):
+        activities = make_activities(3, seed=1)
+        combinations = search_all(to_intervals(activities))
+        self.assertIs(unique_combinations(activities, combinations), combinations)
+        # 같은 액티비티가 두 번 들어온 경우 구성이 같은 조합은 처음 것만 유지
+        duplicated = activities + [dict(activities[0])]
+        unique = unique_combinations(duplicated, [(0,), (1,), (3,), (1, 3), (0, 1)])
+        self.assertEqual(unique, [(0,), (1,), (1, 3)])
+
+
+class CombinationRecommendPoolTests(BaseAPITestCase):
+    def payload(self, count, gap_minutes=30):
+        now = timezone.now()
+        return [
+            {"id": i, "name": f"A{i}", "type": "course",
+             "start_at": (now + timedelta(minutes=i * gap_minutes)).isoformat(),
+             "end_at": (now + timedelta(minutes=i * gap_minutes + 45)).isoformat()}
+            for i in range(count)
+        ]
+
+    def test_pool_response_matches_inline_response(self):
+        payload = self.payload(8)
+        with override_settings(COMBINATION_POOL_THRESHOLD=100):
+            inline = self.client.post("/api/combination/recommend?page_size=100", payload, format="json")
+        with override_settings(COMBINATION_POOL_THRESHOLD=2):
+            pooled = self.client.post("/api/combination/recommend?page_size=100", payload, format="json")
+        self.assertEqual(pooled.status_code, 200)
+        self.assertEqual(pooled.content, inline.content)
+
+    def test_too_many_activities_rejected(self):
+        with override_settings(COMBINATION_MAX_ACTIVITIES=5):
+            r = self.client.post("/api/combination/recommend", self.payload(6), format="json")
+        self.assertEqual(r.status_code, 400)
+
+    def test_duplicate_activities_are_deduplicated(self):
+        payload = self.payload(3)
+        r = self.client.post("/api/combination/recommend?page_size=100", payload + [payload[0]], format="json")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.data["count"], self.client.post(
+            "/api/combination/recommend?page_size=100", payload, format="json").data["count"])
+
+    def test_search_timeout_returns_503(self):
+        # 겹치지 않는 18개: 2^18 - 1개 조합
+        payload = self.payload(18, gap_minutes=60)
+        with override_settings(COMBINATION_POOL_THRESHOLD=2), \
+                mock.patch.object(combination_pool, "timeout", 0.001):
+            r = self.client.post("/api/combination/recommend", payload, format="json")
+        self.assertEqual(r.status_code, 503)
+        # 시간 초과는 풀을 재생성하지 않고 (다른 요청의 작업 유지) 다음 탐색에 그대로 사용
+        executor = combination_pool._executor
+        self.assertIsNotNone(executor)
+        activities = make_activities(12, seed=3)
+        intervals = to_intervals(activities)
+        self.assertEqual(combination_pool.search(intervals), search_all(intervals))
+        self.assertIs(combination_pool._executor, executor)
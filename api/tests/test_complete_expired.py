@@ -0,0 +1,69 @@
+from __future__ import annotations
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import CourseRegistration, Payment, RegistrationBase, TestRegistration
+from api.tests.test_api import BaseAPITestCase
+
+
+class CompleteExpiredRegistrationsTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        User = get_user_model()
+        users = [User.objects.create_user(username=f"u{i}", email=f"u{i}@example.com") for i in range(5)]
+        self.expired = [TestRegistration.objects.create(user=user, test=self.test_closed) for user in users]
+        self.active = TestRegistration.objects.create(user=self.user, test=self.test_open)
+        self.canceled = TestRegistration.objects.create(user=self.user, test=self.test_closed,
+                                                        status=RegistrationBase.STATUS_CANCELED)
+        self.course_expired = CourseRegistration.objects.create(user=self.user, course=self.course_closed)
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command("complete_expired_registrations", *args, stdout=out)
+        return out.getvalue()
+
+    def statuses(self, model=TestRegistration):
+        return dict(model.objects.values_list("id", "status"))
+
+    def test_completes_only_expired_pending_in_chunks(self):
+        with CaptureQueriesContext(connection) as ctx:
+            out = self.run_command("--chunk-size", "2")
+        statuses = self.statuses()
+        for registration in self.expired:
+            self.assertEqual(statuses[registration.id], RegistrationBase.STATUS_COMPLETED)
+        self.assertEqual(statuses[self.active.id], RegistrationBase.STATUS_PENDING)
+        self.assertEqual(statuses[self.canceled.id], RegistrationBase.STATUS_CANCELED)
+        self.assertEqual(self.statuses(CourseRegistration)[self.course_expired.id], RegistrationBase.STATUS_COMPLETED)
+        # 시험 5건 → 청크 3개, 수업 1건 → 청크 1개 (청크마다 UPDATE 1회)
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 4)
+        self.assertIn("test=5 course=1", out)
+
+    def test_resumes_from_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = Path(tmp) / "checkpoint.json"
+            out = self.run_command("--type", "test", "--chunk-size", "2", "--max-chunks", "1",
+                                   "--checkpoint", str(checkpoint))
+            self.assertIn("남은 대상 있음", out)
+            state = json.loads(checkpoint.read_text())
+            self.assertEqual(state["test"], self.expired[1].id)
+            self.assertEqual(list(self.statuses().values()).count(RegistrationBase.STATUS_COMPLETED), 2)
+
+            self.run_command("--type", "test", "--chunk-size", "2", "--checkpoint", str(checkpoint))
+            self.assertFalse(checkpoint.exists())
+        self.assertEqual(list(self.statuses().values()).count(RegistrationBase.STATUS_COMPLETED), 5)
+        self.assertEqual(self.statuses(CourseRegistration)[self.course_expired.id], RegistrationBase.STATUS_PENDING)
+
+    def test_expired_registration_can_no_longer_be_canceled(self):
+        payment = Payment.objects.create(user=self.user, amount=25000, method=Payment.METHOD_BANK,
+                                         target=self.course_expired)
+        self.run_command("--type", "course")
+        r = self.client.post(f"/api/payments/{payment.id}/cancel")
+        self.assertEqual(r.status_code, 400)
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, Payment.STATUS_PAID)
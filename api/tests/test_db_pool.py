@@ -0,0 +1,26 @@
+from __future__ import annotations
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class DBPoolStatsTests(TestCase):
+    def client_for(self, **extra):
+        user = get_user_model().objects.create_user(
+            username=f"u{len(extra)}", email=f"u{len(extra)}@example.com", password="pass1234", **extra
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        return client
+
+    def test_staff_can_read_pool_stats(self):
+        r = self.client_for(is_staff=True).get("/metrics/db-pool")
+        self.assertEqual(r.status_code, 200)
+        self.assertIn("pid", r.data)
+        self.assertIn("default", r.data["databases"])
+        self.assertIn(r.data["databases"]["default"]["mode"], {"pool", "persistent", "per_request"})
+
+    def test_regular_user_is_forbidden(self):
+        r = self.client_for().get("/metrics/db-pool")
+        self.assertEqual(r.status_code, 403)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+from unittest import mock, skipUnless
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import resolve
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from config.db_routers import ReplicaRouter, ReplicaRoutingMiddleware, _current_request
+from api.models import Payment, Test
+
+
+class FakeUser:
+    is_authenticated = True
+
+    def __init__(self, pk):
+        self.pk = pk
+
+
+@override_settings(REPLICA_DB_ALIAS="replica")
+class ReplicaRouterTests(TestCase):
+    def setUp(self):
+        caches[settings.REPLICA_PIN_CACHE].clear()
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def route_within(self, request):
+        """요청 처리 중 라우터가 선택하는 읽기 DB"""
+        seen = {}
+
+        def view(req):
+            seen["db"] = self.router.db_for_read(Test)
+            return HttpResponse(status=201 if req.method == "POST" else 200)
+
+        request.resolver_match = resolve(request.path)
+        ReplicaRoutingMiddleware(view)(request)
+        return seen["db"]
+
+    def test_reads_outside_request_use_default(self):
+        self.assertIsNone(self.router.db_for_read(Test))
+        self.assertEqual(self.router.db_for_write(Test), "default")
+
+    def test_safe_requests_read_from_replica(self):
+        self.assertEqual(self.route_within(self.factory.get("/api/tests/")), "replica")
+        self.assertEqual(self.route_within(self.factory.post("/api/tests/1/apply")), "default")
+
+    def test_only_targeted_views_use_replica_or_read_pins(self):
+        read = self.factory.get("/api/tests/1/")
+        read.user = FakeUser(7)
+        with mock.patch("config.db_routers.is_pinned") as is_pinned:
+            self.assertEqual(self.route_within(read), "default")
+        is_pinned.assert_not_called()
+        with override_settings(REPLICA_READ_VIEWS={"tests-detail"}):
+            self.assertEqual(self.route_within(self.factory.get("/api/tests/1/")), "replica")
+
+    def test_reads_pin_to_primary_after_write(self):
+        write = self.factory.post("/api/registrations")
+        write.user = FakeUser(7)
+        self.route_within(write)
+
+        read = self.factory.get("/api/me/payments")
+        read.user = FakeUser(7)
+        self.assertEqual(self.route_within(read), "default")
+
+        other = self.factory.get("/api/me/payments")
+        other.user = FakeUser(8)
+        self.assertEqual(self.route_within(other), "replica")
+        self.assertIsNone(_current_request.get())
+
+    @override_settings(REPLICA_DB_ALIAS=None)
+    def test_without_replica_everything_uses_default(self):
+        self.assertIsNone(self.route_within(self.factory.get("/api/tests/")))
+
+    def test_warns_on_process_local_pin_cache(self):
+        local = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        with override_settings(CACHES={"default": local, "pins": local}, REPLICA_PIN_CACHE="pins"):
+            with self.assertLogs("config.db_routers", level="WARNING"):
+                ReplicaRouter()
+        with override_settings(CACHES={"default": local}, REPLICA_PIN_CACHE="pins"):
+            with self.assertRaises(ImproperlyConfigured):
+                ReplicaRouter()
+        with override_settings(REPLICA_DB_ALIAS=None, CACHES={"default": local}, REPLICA_PIN_CACHE="pins"):
+            ReplicaRouter()  # 복제본 미사용 시 검사하지 않음
+
+
+# 복제본 DB 설정 시에만 실행 (예: DJANGO_DB_REPLICA_ENGINE=django.db.backends.sqlite3 DJANGO_DB_REPLICA_NAME=replica.sqlite3)
+@skipUnless(settings.REPLICA_DB_ALIAS, "replica database is not configured")
+class ReplicaRoutingIntegrationTests(TestCase):
+    databases = {"default", "replica"} if settings.REPLICA_DB_ALIAS else {"default"}
+
+    def setUp(self):
+        caches[settings.REPLICA_PIN_CACHE].clear()
+        # 복제 지연 상황을 흉내내기 위해 사용자만 두 DB에 생성 (시험은 primary에만 존재)
+        User = get_user_model()
+        self.user = User.objects.create_user(username="r", email="r@example.com", password="pass1234")
+        User.objects.using("replica").create(id=self.user.id, username="r", email="r@example.com",
+                                             password=self.user.password)
+        now = timezone.now()
+        self.test = Test.objects.create(
+            title="T1", start_at=now - timedelta(days=1), end_at=now + timedelta(days=1), price=10000
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    def test_reads_go_to_replica_until_user_writes(self):
+        r = self.client.get("/api/tests/")
+        self.assertEqual(r.data["count"], 0)  # 복제본에는 아직 없음
+
+        r = self.client.post(
+            f"/api/tests/{self.test.id}/apply",
+            {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD},
+            format="json",
+        )
+        self.assertEqual(r.status_code, 201)
+
+        r = self.client.get("/api/me/payments")
+        self.assertEqual(r.data["count"], 1)  # 쓰기 직후에는 primary에서 조회
@@ -0,0 +1,98 @@
+from __future__ import annotations
+import logging
+import threading
+from django.test import SimpleTestCase
+from prometheus_client import REGISTRY
+from config.log import JsonFormatter, NonBlockingQueueHandler, SamplingFilter
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, gate: threading.Event | None = None):
+        super().__init__()
+        self.gate = gate
+        self.messages = []
+
+    def filter(self, record):
+        # 핸들러 잠금 밖에서 첫 로그만 막아 리스너가 밀린 상황을 만듦 (호출 스레드의 직접 기록은 막지 않음)
+        if self.gate is not None and not self.messages and threading.current_thread() is not threading.main_thread():
+            self.gate.wait(5)
+        return super().filter(record)
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+class NonBlockingQueueHandlerTests(SimpleTestCase):
+    def make_logger(self, handler) -> logging.Logger:
+        logger = logging.getLogger(f"test.log.{id(handler)}")
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        self.addCleanup(handler.close)
+        return logger
+
+    def test_formats_in_listener_thread(self):
+        target = ListHandler()
+        handler = NonBlockingQueueHandler(handlers=[target])
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        logger = self.make_logger(handler)
+
+        logger.warning("신청 완료: user=%s", 7)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.error("실패", exc_info=True)
+        handler.stop()
+
+        self.assertEqual(target.messages[0], "WARNING 신청 완료: user=7")
+        self.assertIn("ValueError: boom", target.messages[1])
+
+    def test_message_is_built_in_calling_thread(self):
+        target = ListHandler()
+        handler = NonBlockingQueueHandler(handlers=[target])
+        logger = self.make_logger(handler)
+
+        items = [1]
+        logger.warning("items=%s", items)
+        items.append(2)  # 리스너가 기록하기 전에 args가 바뀌어도 로그 시점의 값으로 기록
+        handler.stop()
+        self.assertEqual(target.messages, ["items=[1]"])
+
+    def test_drops_info_but_keeps_warnings_when_queue_full(self):
+        dropped = REGISTRY.get_sample_value("log_records_dropped_total") or 0
+        gate = threading.Event()
+        target = ListHandler(gate)
+        handler = NonBlockingQueueHandler(handlers=[target], queue_size=1, full_timeout=0.01)
+        logger = self.make_logger(handler)
+
+        for i in range(10):
+            logger.info("info %s", i)
+        logger.warning("warning")
+        logger.error("error")
+        self.assertGreater(handler.dropped, 0)  # 리스너가 막혀 있어도 호출 스레드는 대기하지 않음
+        self.assertEqual(REGISTRY.get_sample_value("log_records_dropped_total"), dropped + handler.dropped)
+        gate.set()
+        handler.stop()
+        self.assertLess(len(target.messages), 12)
+        self.assertIn("warning", target.messages)
+        self.assertIn("error", target.messages)
+
+
+class SamplingFilterTests(SimpleTestCase):
+    def record(self, name: str, level: int) -> logging.LogRecord:
+        return logging.LogRecord(name, level, __file__, 0, "msg", (), None)
+
+    def test_samples_only_info_of_selected_loggers(self):
+        f = SamplingFilter(rate=0.0, names=["api.sql"])
+        self.assertFalse(f.filter(self.record("api.sql", logging.INFO)))
+        self.assertTrue(f.filter(self.record("api.sql", logging.WARNING)))
+        self.assertTrue(f.filter(self.record("api.viewsets", logging.INFO)))
+
+
+class JsonFormatterTests(SimpleTestCase):
+    def test_includes_extra_fields(self):
+        record = logging.LogRecord("api.sql", logging.INFO, __file__, 0, "sql queries=%d", (3,), None)
+        record.sql_summary = {"queries": 3}
+        output = JsonFormatter().format(record)
+        self.assertIn('"message": "sql queries=3"', output)
+        self.assertIn('"sql_summary": {"queries": 3}', output)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from django.test import override_settings
+from prometheus_client import REGISTRY
+from api.models import Payment
+from api.tests.test_api import BaseAPITestCase
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class MetricsTests(BaseAPITestCase):
+    def test_request_metrics_labelled_by_view_and_action(self):
+        labels = {"view": "TestViewSet", "action": "list", "method": "GET"}
+        before = sample("http_requests_total", status="200", **labels)
+        queries_before = sample("http_request_db_queries_count", view="TestViewSet", action="list")
+
+        self.client.get("/api/tests/")
+
+        self.assertEqual(sample("http_requests_total", status="200", **labels), before + 1)
+        self.assertEqual(sample("http_request_db_queries_count", view="TestViewSet", action="list"),
+                         queries_before + 1)
+        r = self.client.get("/metrics")
+        self.assertEqual(r.status_code, 200)
+        self.assertIn(b'http_request_duration_seconds_bucket{action="list"', r.content)
+        # 처리 중인 요청 수는 URL name별 (요청이 끝나면 0으로 돌아옴)
+        self.assertIn(b'http_requests_in_flight{view="tests-list"} 0.0', r.content)
+
+    def test_business_counters_after_commit(self):
+        before = sample("registrations_total", kind="test", source="single")
+        cancels_before = sample("payment_cancellations_total", kind="test")
+        with self.captureOnCommitCallbacks(execute=True):
+            r = self.client.post(
+                f"/api/tests/{self.test_open.id}/apply",
+                {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD},
+                format="json",
+            )
+        self.assertEqual(sample("registrations_total", kind="test", source="single"), before + 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/payments/{r.data['id']}/cancel", format="json")
+        self.assertEqual(sample("payment_cancellations_total", kind="test"), cancels_before + 1)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_token(self):
+        self.client.credentials()
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        r = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret", REMOTE_ADDR="10.0.0.5")
+        self.assertEqual(r.status_code, 200)
+
+    def test_metrics_denied_outside_allowed_ips_without_token(self):
+        self.client.credentials()
+        self.assertEqual(self.client.get("/metrics", REMOTE_ADDR="10.0.0.5").status_code, 403)
+        self.assertEqual(self.client.get("/metrics").status_code, 200)  # 127.0.0.1
+        with override_settings(METRICS_ALLOWED_IPS=[]):
+            self.assertEqual(self.client.get("/metrics").status_code, 403)
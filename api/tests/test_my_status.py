@@ -0,0 +1,38 @@
+from __future__ import annotations
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import CourseRegistration, Test, TestRegistration
+from api.tests.test_api import BaseAPITestCase
+
+
+class MyStatusTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        TestRegistration.objects.create(user=self.user, test=self.test_open, status=TestRegistration.STATUS_COMPLETED)
+        TestRegistration.objects.create(user=self.user, test=self.test_closed, status=TestRegistration.STATUS_CANCELED)
+        CourseRegistration.objects.create(user=self.user, course=self.course_open)
+
+    def statuses(self, path, **params):
+        r = self.client.get(path, {"include": "my_status", "page_size": 100, **params})
+        self.assertEqual(r.status_code, 200)
+        return {row["id"]: row["my_status"] for row in r.json()["results"]}
+
+    def test_status_per_item(self):
+        self.assertEqual(self.statuses("/api/tests/"), {self.test_open.id: "completed", self.test_closed.id: None})
+        self.assertEqual(self.statuses("/api/async/courses/", fields="id"),
+                         {self.course_open.id: "pending", self.course_closed.id: None})
+        self.assertNotIn("my_status", self.client.get("/api/tests/").json()["results"][0])
+        self.assertEqual(self.client.get("/api/tests/", {"include": "owner"}).status_code, 400)
+
+    def test_query_count_independent_of_page_size(self):
+        for i in range(30):
+            test = Test.objects.create(title=f"T{i + 3}", price=1000)
+            TestRegistration.objects.create(user=self.user, test=test)
+        self.client.get("/api/tests/")  # 사용자 캐시 적재
+        counts = []
+        for page_size in (2, 30):
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertEqual(len(self.statuses("/api/tests/", page_size=page_size)), page_size)
+            counts.append(len(ctx.captured_queries))
+        # count + 페이지 조회
+        self.assertEqual(counts, [2, 2])
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from api.models import Course, CourseRegistration, Payment, RegistrationBase, Test, TestRegistration
+from api.tests.test_api import BaseAPITestCase
+
+
+class BatchCancelTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        # 정원 3석 중 3석 판매된 시험
+        Test.objects.filter(pk=self.test_open.pk).update(capacity=3, remaining_seats=0, popularity=3)
+        Course.objects.filter(pk=self.course_open.pk).update(popularity=1)
+
+    def pay(self, registration, user=None, **kwargs):
+        return Payment.objects.create(user=user or self.user, amount=1000, method=Payment.METHOD_CREDIT_CARD,
+                                      target=registration, **kwargs)
+
+    def post(self, body):
+        return self.client.post("/api/payments/cancel", body, format="json")
+
+    def test_per_id_results_and_aggregated_seat_release(self):
+        other = get_user_model().objects.create_user(username="other", email="other@example.com")
+        test_payments = [self.pay(TestRegistration.objects.create(user=self.user, test=self.test_open))
+                         for _ in range(2)]
+        course_payment = self.pay(CourseRegistration.objects.create(user=self.user, course=self.course_open))
+        already = self.pay(TestRegistration.objects.create(user=self.user, test=self.test_open,
+                                                           status=RegistrationBase.STATUS_CANCELED),
+                           status=Payment.STATUS_CANCELED)
+        completed = self.pay(TestRegistration.objects.create(user=self.user, test=self.test_open,
+                                                             status=RegistrationBase.STATUS_COMPLETED))
+        others = self.pay(TestRegistration.objects.create(user=other, test=self.test_open), user=other)
+
+        ids = [p.id for p in test_payments] + [course_payment.id, already.id, completed.id, others.id, 999999]
+        r = self.post({"payment_ids": ids})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["canceled"], 3)
+        self.assertEqual([item["result"] for item in r.json()["results"]], [
+            "canceled", "canceled", "canceled", "already_canceled", "not_cancelable", "not_found", "not_found",
+        ])
+
+        self.test_open.refresh_from_db()
+        self.course_open.refresh_from_db()
+        self.assertEqual((self.test_open.remaining_seats, self.test_open.popularity), (2, 1))
+        self.assertEqual(self.course_open.popularity, 0)
+        for payment in test_payments + [course_payment]:
+            payment.refresh_from_db()
+            self.assertEqual(payment.status, Payment.STATUS_CANCELED)
+            self.assertIsNotNone(payment.canceled_at)
+            self.assertEqual(payment.target.status, RegistrationBase.STATUS_CANCELED)
+        others.refresh_from_db()
+        self.assertEqual(others.status, Payment.STATUS_PAID)
+
+    def test_query_count_independent_of_batch_size(self):
+        def run(size):
+            ids = [self.pay(TestRegistration.objects.create(user=self.user, test=self.test_open)).id
+                   for _ in range(size)]
+            ids += [self.pay(CourseRegistration.objects.create(user=self.user, course=self.course_open)).id
+                    for _ in range(size)]
+            with CaptureQueriesContext(connection) as ctx:
+                r = self.post({"payment_ids": ids})
+            self.assertEqual(r.json()["canceled"], size * 2)
+            return len(ctx.captured_queries)
+
+        run(1)  # 사용자/ContentType 캐시 적재
+        self.assertEqual(run(2), run(20))
+
+    @override_settings(BATCH_CANCEL_MAX_IDS=2)
+    def test_validation(self):
+        self.assertEqual(self.post({"payment_ids": [1, 2, 3]}).status_code, 400)
+        self.assertEqual(self.post({"payment_ids": "1"}).status_code, 400)
+        self.assertEqual(self.post({"payment_ids": []}).json(), {"canceled": 0, "results": []})
+
+    def test_single_cancel_errors(self):
+        payment = self.pay(TestRegistration.objects.create(user=self.user, test=self.test_open))
+        self.assertEqual(self.client.post("/api/payments/999999/cancel").status_code, 404)
+        self.assertEqual(self.client.post(f"/api/payments/{payment.id}/cancel").status_code, 200)
+        self.assertEqual(self.client.post(f"/api/payments/{payment.id}/cancel").status_code, 400)
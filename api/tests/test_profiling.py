@@ -0,0 +1,48 @@
+from __future__ import annotations
+import cProfile
+import tempfile
+from pathlib import Path
+from unittest import mock
+from django.test import SimpleTestCase
+from config.profiling import ProfileStore, profile_store
+from api.tests.test_api import BaseAPITestCase
+
+
+class ProfilingTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        patcher = mock.patch.object(profile_store, "directory", Path(tmpdir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_staff_request_is_profiled(self):
+        self.user.is_staff = True
+        self.user.save()
+        r = self.client.get("/api/me/payments", HTTP_X_PROFILE="1", HTTP_X_REQUEST_ID="req-123")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r["X-Profile-Id"], "req-123")
+        phases = [part.split(";")[0] for part in r["Server-Timing"].split(", ")]
+        self.assertEqual(phases, ["db", "serialize", "render"])
+
+        r = self.client.get("/metrics/profiles/req-123")
+        self.assertEqual(r.status_code, 200)
+        self.assertIn(b"function calls", r.content)
+
+    def test_non_staff_request_is_not_profiled(self):
+        r = self.client.get("/api/courses/recommend?profile=1")
+        self.assertEqual(r.status_code, 200)
+        self.assertNotIn("Server-Timing", r)
+        self.assertEqual(list(profile_store.directory.glob("*.prof")), [])
+
+
+class ProfileStoreTests(SimpleTestCase):
+    def test_keeps_only_latest_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ProfileStore(tmpdir, max_files=2)
+            for request_id in ("a", "b", "c"):
+                store.save(request_id, cProfile.Profile())
+            self.assertEqual(len(list(Path(tmpdir).glob("*.prof"))), 2)
+            self.assertIsNone(store.find("a"))
+            self.assertIsNotNone(store.find("c"))
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import json
+import uuid
+import zoneinfo
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+from config.renderers import FastJSONRenderer
+from api.tests.test_api import BaseAPITestCase
+
+
+class FastJSONRendererParityTests(SimpleTestCase):
+    def assert_same(self, data, accepted_media_type=None):
+        self.assertEqual(
+            FastJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type),
+        )
+
+    def test_matches_drf_output(self):
+        self.assert_same({
+            "utc": datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc),
+            "utc_micro": datetime(2024, 5, 1, 9, 30, 0, 123456, tzinfo=timezone.utc),
+            "london": datetime(2024, 1, 1, 9, 30, tzinfo=zoneinfo.ZoneInfo("Europe/London")),
+            "seoul": datetime(2024, 5, 1, 9, 30, tzinfo=zoneinfo.ZoneInfo("Asia/Seoul")),
+            "naive": datetime(2024, 5, 1, 9, 30),
+            "date": date(2024, 5, 1),
+            "delta": timedelta(minutes=90),
+            "decimal": Decimal("12.50"),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "text": "한글 텍스트 \u2028 \u2029 \"quoted\" </script>",
+            "lazy": gettext_lazy("Not found."),
+            "error": [ErrorDetail("잘못된 요청입니다.", code="invalid")],
+            "nested": ReturnDict({"n": [1, 2.5, True, None]}, serializer=None),
+            1: "int key",
+        })
+
+    def test_floats_match_drf_values(self):
+        data = {"floats": [0.1, 2.5, 1e16, 1.5e-7, -0.0, 12345678.9, 1e300]}
+        fast, drf = FastJSONRenderer().render(data), JSONRenderer().render(data)
+        # 지수 표기는 다를 수 있으므로(1e16 vs 1e+16) 파싱한 값으로 비교
+        self.assertEqual(json.loads(fast), json.loads(drf))
+
+    def test_non_finite_floats_rejected_like_drf(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            data = {"nested": [{"value": value}], "none": None}
+            with self.assertRaises(ValueError):
+                JSONRenderer().render(data)
+            with self.assertRaises(ValueError):
+                FastJSONRenderer().render(data)
+
+    def test_falls_back_for_indent_and_big_ints(self):
+        self.assert_same({"a": [1, 2]}, "application/json; indent=4")
+        self.assert_same({"big": 2 ** 70})
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+
+class FastJSONParserTests(BaseAPITestCase):
+    def test_invalid_text_plain_json_is_400(self):
+        r = self.client.post("/api/registrations", "{not json", content_type="text/plain")
+        self.assertEqual(r.status_code, 400)
+
+    def test_text_plain_json_is_parsed(self):
+        body = '{"list": [{"target_type": "test", "target_id": %d, "amount": 10000}], "payment_method": "credit_card"}'
+        r = self.client.post("/api/registrations", body % self.test_open.id, content_type="text/plain")
+        self.assertEqual(r.status_code, 201)
+
+    @override_settings(MAX_JSON_BODY_SIZE=64)
+    def test_oversized_body_is_413(self):
+        r = self.client.post("/api/registrations", {"list": [], "payment_method": "x" * 100}, format="json")
+        self.assertEqual(r.status_code, 413)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+import io
+import tempfile
+from pathlib import Path
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+from config.schema import prebuilt_schema
+
+
+class PrebuiltSchemaTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        call_command("generate_schema", output_dir=cls.tmpdir.name, stdout=io.StringIO())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        prebuilt_schema.clear()
+        self.addCleanup(prebuilt_schema.clear)
+
+    def test_serves_prebuilt_file_with_etag(self):
+        with override_settings(SCHEMA_DIR=self.tmpdir.name):
+            r = self.client.get("/swagger.json")
+            self.assertEqual(r.status_code, 200)
+            self.assertEqual(r.content, (Path(self.tmpdir.name) / "swagger.json").read_bytes())
+            self.assertIn("max-age", r["Cache-Control"])
+
+            r = self.client.get("/swagger.json", HTTP_IF_NONE_MATCH=r["ETag"])
+            self.assertEqual(r.status_code, 304)
+            self.assertEqual(self.client.get("/swagger.yaml").status_code, 200)
+
+    def test_check_detects_stale_schema(self):
+        call_command("generate_schema", output_dir=self.tmpdir.name, check=True, stdout=io.StringIO())
+        with tempfile.TemporaryDirectory() as empty:
+            with self.assertRaises(CommandError):
+                call_command("generate_schema", output_dir=empty, check=True)
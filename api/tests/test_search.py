@@ -0,0 +1,57 @@
+from __future__ import annotations
+from unittest import skipUnless
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import Course, Test
+from api.tests.test_api import BaseAPITestCase
+
+
+class CatalogSearchTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.python = Test.objects.create(title="파이썬 기초 시험", description="입문자를 위한 문법 평가", price=1000)
+        self.django = Test.objects.create(title="장고 실전", description="파이썬 웹 프레임워크 실습", price=1000)
+        Test.objects.create(title="자바 기초", description="객체지향", price=1000)
+
+    def search(self, path, **params):
+        r = self.client.get(path, {"page_size": 100, **params})
+        self.assertEqual(r.status_code, 200)
+        return [row["id"] for row in r.json()["results"]]
+
+    def test_ranks_title_match_first(self):
+        self.assertEqual(self.search("/api/tests/", search="파이썬"), [self.python.id, self.django.id])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.search("/api/tests/", search="파이썬 실습"), [self.django.id])
+        # trigram 최소 길이보다 짧은 단어는 부분 일치로 처리
+        self.assertEqual(self.search("/api/tests/", search="기초 파이썬"), [self.python.id])
+
+    def test_explicit_ordering_and_fts_syntax(self):
+        ids = self.search("/api/tests/", search="파이썬", ordering="created_at")
+        self.assertEqual(ids, [self.python.id, self.django.id])
+        self.assertEqual(self.search("/api/tests/", search='"파이썬 OR*'), [])
+
+    def test_index_follows_updates_and_deletes(self):
+        course = Course.objects.create(title="데이터 분석", price=1000)
+        self.assertEqual(self.search("/api/courses/", search="데이터"), [course.id])
+        Course.objects.filter(pk=course.pk).update(title="머신러닝 입문")
+        self.assertEqual(self.search("/api/courses/", search="데이터"), [])
+        self.assertEqual(self.search("/api/courses/", search="머신러닝", fields="id"), [course.id])
+        course.delete()
+        self.assertEqual(self.search("/api/courses/", search="머신러닝"), [])
+
+
+@skipUnless(connection.vendor == "postgresql", "PostgreSQL 전문 검색(tsvector/pg_trgm) 전용")
+class PostgresCatalogSearchTests(CatalogSearchTests):
+    """SQLite와 같은 검색 결과 + PostgreSQL 전용 동작 (제목 부분 일치, 검색 식)"""
+
+    def test_title_substring_match_via_trigram(self):
+        # 공백 단위 토큰과 맞지 않는 제목 일부도 ILIKE(pg_trgm 인덱스)로 검색
+        self.assertEqual(self.search("/api/tests/", search="이썬 기"), [self.python.id])
+
+    def test_uses_indexed_search_expression(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.search("/api/tests/", search="파이썬")
+        sql = "\n".join(query["sql"] for query in queries)
+        self.assertIn("websearch_to_tsquery('simple'", sql)
+        self.assertIn("to_tsvector('simple', coalesce(\"api_test\".title, ''))", sql)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import threading
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from api.models import Course, CourseRegistration, Payment, Test
+from api.seats import reserve_seat
+from api.tests.test_api import BaseAPITestCase
+
+
+class SeatCapacityTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_open.capacity = 1
+        self.test_open.save()
+
+    def test_reserve_and_release(self):
+        self.assertEqual(self.test_open.remaining_seats, 1)
+        r = self.client.post(f"/api/tests/{self.test_open.id}/apply",
+                             {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD}, format="json")
+        self.assertEqual(r.status_code, 201)
+        self.test_open.refresh_from_db()
+        self.assertEqual((self.test_open.remaining_seats, self.test_open.popularity), (0, 1))
+
+        other = APIClient()
+        other.force_authenticate(get_user_model().objects.create_user(username="other", email="o@example.com"))
+        r = other.post(f"/api/tests/{self.test_open.id}/apply",
+                       {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD}, format="json")
+        self.assertEqual(r.status_code, 409)
+
+        payment_id = Payment.objects.get(user=self.user).id
+        self.assertEqual(self.client.post(f"/api/payments/{payment_id}/cancel").status_code, 200)
+        self.test_open.refresh_from_db()
+        self.assertEqual((self.test_open.remaining_seats, self.test_open.popularity), (1, 0))
+
+    def test_payment_cancel_releases_seat_once(self):
+        r = self.client.post(f"/api/tests/{self.test_open.id}/apply",
+                             {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD}, format="json")
+        self.assertEqual(r.status_code, 201)
+        payment = Payment.objects.get(user=self.user)
+        payment.cancel()
+        payment.cancel()
+        self.assertEqual(payment.status, Payment.STATUS_CANCELED)
+        self.test_open.refresh_from_db()
+        self.assertEqual((self.test_open.remaining_seats, self.test_open.popularity), (1, 0))
+
+    def test_bulk_registration_rolls_back_when_sold_out(self):
+        self.course_open.capacity = 0
+        self.course_open.save()
+        r = self.client.post("/api/registrations", {"payment_method": Payment.METHOD_KAKAOPAY, "list": [
+            {"target_type": "test", "target_id": self.test_open.id, "amount": 10000},
+            {"target_type": "course", "target_id": self.course_open.id, "amount": 20000},
+        ]}, format="json")
+        self.assertEqual(r.status_code, 409)
+        self.test_open.refresh_from_db()
+        self.assertEqual(self.test_open.remaining_seats, 1)
+        self.assertFalse(Payment.objects.exists())
+
+    def test_unlimited_items_only_count_popularity(self):
+        r = self.client.post(f"/api/courses/{self.course_open.id}/enroll",
+                             {"amount": 20000, "payment_method": Payment.METHOD_BANK}, format="json")
+        self.assertEqual(r.status_code, 201)
+        self.course_open.refresh_from_db()
+        self.assertEqual((self.course_open.remaining_seats, self.course_open.popularity), (None, 1))
+
+    def test_stale_instance_save_keeps_taken_seats(self):
+        stale = Test.objects.get(pk=self.test_open.pk)
+        r = self.client.post(f"/api/tests/{self.test_open.id}/apply",
+                             {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD}, format="json")
+        self.assertEqual(r.status_code, 201)
+        stale.title = "제목 변경"
+        stale.save()
+        self.test_open.refresh_from_db()
+        self.assertEqual((self.test_open.title, self.test_open.remaining_seats, self.test_open.popularity),
+                         ("제목 변경", 0, 1))
+
+    def test_capacity_change_applies_delta(self):
+        stale = Test.objects.get(pk=self.test_open.pk)
+        r = self.client.post(f"/api/tests/{self.test_open.id}/apply",
+                             {"amount": 10000, "payment_method": Payment.METHOD_CREDIT_CARD}, format="json")
+        self.assertEqual(r.status_code, 201)
+        stale.capacity = 3
+        stale.save()
+        self.assertEqual((stale.remaining_seats, stale.popularity), (2, 1))
+        # 줄일 때는 0 미만이 되지 않음, 정원을 없애면 잔여석 NULL, 다시 정하면 정원 - 인기도
+        for capacity, remaining in [(0, 0), (None, None), (4, 3)]:
+            stale.capacity = capacity
+            stale.save(update_fields=["capacity"])
+            self.test_open.refresh_from_db()
+            self.assertEqual(self.test_open.remaining_seats, remaining)
+
+    def test_save_without_capacity_change_skips_resize(self):
+        item = Test.objects.get(pk=self.test_open.pk)
+        item.title = "제목 변경"
+        with CaptureQueriesContext(connection) as queries:
+            item.save()
+        self.assertEqual([q["sql"].startswith("UPDATE") for q in queries].count(True), 1)
+        with self.assertRaises(ValueError):
+            item.save(update_fields=["title", "remaining_seats"])
+
+    def test_stale_reservations_never_oversell(self):
+        # 모두 같은 (오래된) 잔여석을 읽은 뒤 예약해도 조건부 UPDATE가 정원만큼만 성공
+        self.test_open.capacity = 100
+        self.test_open.save()
+        stale = [Test.objects.get(pk=self.test_open.pk) for _ in range(300)]
+        reserved = [reserve_seat(Test, item.pk) for item in stale if item.remaining_seats > 0]
+        self.assertEqual(reserved.count(True), 100)
+        self.test_open.refresh_from_db()
+        self.assertEqual((self.test_open.remaining_seats, self.test_open.popularity), (0, 100))
+
+
+class ConcurrentEnrollTests(TransactionTestCase):
+    """
+    스레드별 DB 연결로 동시에 수강 신청 (PostgreSQL 또는 파일 SQLite 테스트 DB에서 실행, run_tests.sh 참고)
+    - 구매자 수는 수백 명, 스레드 수는 DB 최대 연결 수를 넘지 않도록 제한
+    """
+    CAPACITY = 100
+    BUYERS = 300
+    THREADS = 50
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("SQLite 공유 메모리 테스트 DB는 동시 쓰기 트랜잭션을 지원하지 않음 (DJANGO_DB_TEST_NAME으로 파일 DB 지정)")
+
+    def test_no_oversell_under_concurrent_buyers(self):
+        now = timezone.now()
+        course = Course.objects.create(title="인기 수업", start_at=now - timedelta(days=1),
+                                       end_at=now + timedelta(days=1), price=1000, capacity=self.CAPACITY)
+        User = get_user_model()
+        users = User.objects.bulk_create(
+            User(username=f"buyer{i}", email=f"buyer{i}@example.com") for i in range(self.BUYERS)
+        )
+        barrier = threading.Barrier(self.THREADS)
+        statuses = []
+
+        def buy(buyers):
+            client = APIClient()
+            barrier.wait()
+            try:
+                for user in buyers:
+                    client.force_authenticate(user)
+                    r = client.post(f"/api/courses/{course.id}/enroll",
+                                    {"amount": 1000, "payment_method": Payment.METHOD_CREDIT_CARD}, format="json")
+                    statuses.append(r.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=buy, args=(users[i::self.THREADS],)) for i in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        course.refresh_from_db()
+        self.assertEqual(statuses.count(201), self.CAPACITY)
+        self.assertEqual(statuses.count(409), self.BUYERS - self.CAPACITY)
+        self.assertEqual(course.remaining_seats, 0)
+        self.assertEqual(CourseRegistration.objects.filter(course=course).count(), self.CAPACITY)
+        self.assertEqual(course.popularity, self.CAPACITY)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+from io import StringIO
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+from api.models import Course, CourseRegistration, Payment, RegistrationBase, Tag, Test, TestRegistration, User
+
+
+class SeedCatalogTests(TestCase):
+    def seed(self, *args):
+        call_command("seed_catalog", "--tests", "20", "--courses", "15", "--tags", "12", "--users", "8",
+                     "--registrations", "4", "--chunk-size", "7", "--method", "bulk", *args, stdout=StringIO())
+
+    def snapshot(self):
+        return (
+            list(Test.objects.order_by("id").values_list("id", "title", "price", "capacity", "popularity")),
+            list(Course.tags.through.objects.order_by("id").values_list("course_id", "tag_id")),
+            list(TestRegistration.objects.order_by("id").values_list("user_id", "test_id", "status")),
+            list(Payment.objects.order_by("id").values_list("user_id", "amount", "method", "status")),
+        )
+
+    def test_counts_and_derived_columns(self):
+        self.seed()
+        self.assertEqual((Test.objects.count(), Course.objects.count(), Tag.objects.count()), (20, 15, 12))
+        self.assertEqual(User.objects.count(), 8)
+        registrations = TestRegistration.objects.count() + CourseRegistration.objects.count()
+        self.assertEqual(registrations, 8 * 4)
+        self.assertEqual(Payment.objects.count(), registrations)
+        self.assertEqual(Payment.objects.filter(status=Payment.STATUS_CANCELED).count(),
+                         TestRegistration.objects.filter(status=RegistrationBase.STATUS_CANCELED).count()
+                         + CourseRegistration.objects.filter(status=RegistrationBase.STATUS_CANCELED).count())
+        # 인기도/잔여석은 취소되지 않은 신청 수와 일치
+        active = ~Q(testregistration__status=RegistrationBase.STATUS_CANCELED)
+        for test in Test.objects.annotate(taken=Count("testregistration", filter=active)):
+            self.assertEqual(test.popularity, test.taken)
+            if test.capacity is not None:
+                self.assertEqual(test.remaining_seats, test.capacity - test.taken)
+        self.assertTrue(self.client.login(username=User.objects.first().username, password="pass1234"))
+
+    def test_same_seed_reproduces_data(self):
+        self.seed()
+        first = self.snapshot()
+        self.seed("--clear")
+        self.assertEqual(self.snapshot(), first)
+        self.seed("--clear", "--seed", "1")
+        self.assertNotEqual(self.snapshot(), first)
+        # 지운 뒤 id가 다시 1부터 시작하고, 이어서 생성하면 다음 id부터
+        self.assertEqual(Test.objects.order_by("id").first().id, 1)
+        self.seed()
+        self.assertEqual(Test.objects.count(), 40)
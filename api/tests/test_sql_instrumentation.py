@@ -0,0 +1,61 @@
+from __future__ import annotations
+from django.conf import settings
+from django.test import override_settings
+from rest_framework.test import APIClient
+from api.models import Course, Payment, Test
+from api.tests.test_api import BaseAPITestCase
+from config.middleware import QueryStats
+
+
+class QueryInstrumentationTests(BaseAPITestCase):
+    def test_summary_line_per_request(self):
+        with self.assertLogs("api.sql", level="INFO") as logs:
+            self.client.get("/api/tests/")
+        self.assertEqual(len(logs.records), 1)
+        summary = logs.records[0].sql_summary
+        self.assertEqual(summary["view"], "tests-list")
+        self.assertEqual(summary["status"], 200)
+        self.assertGreaterEqual(summary["queries"], 2)
+        self.assertFalse(summary["over_budget"])
+
+    def apply_all(self, count):
+        for i in range(count):
+            for model, path in ((Test, "tests/{}/apply"), (Course, "courses/{}/enroll")):
+                item = model.objects.create(title=f"N{i}", start_at=self.open_start, end_at=self.open_end, price=1000)
+                self.client.post(
+                    "/api/" + path.format(item.id),
+                    {"amount": 1000, "payment_method": Payment.METHOD_CREDIT_CARD},
+                    format="json",
+                )
+
+    def me_payments_summary(self):
+        with self.assertLogs("api.sql", level="INFO") as logs:
+            r = self.client.get("/api/me/payments")
+        self.assertEqual(r.status_code, 200)
+        return logs.records[-1].sql_summary
+
+    def test_me_payments_within_budget(self):
+        # 신청(GenericForeignKey)은 유형별 1회 조회: 결제 수와 무관하게 예산(6) 이내
+        self.apply_all(1)
+        few = self.me_payments_summary()
+        self.apply_all(5)
+        many = self.me_payments_summary()
+        self.assertEqual(many["budget"], settings.SQL_QUERY_BUDGETS["me_payments"])
+        self.assertLessEqual(many["queries"], many["budget"])
+        self.assertEqual(many["queries"], few["queries"])
+        self.assertFalse(many["repeated"])
+
+    @override_settings(SQL_QUERY_BUDGETS={"me_payments": 2})
+    def test_flags_over_budget_and_repeated_queries(self):
+        self.apply_all(1)
+        # 미들웨어는 생성 시 설정을 읽으므로 새 클라이언트로 요청
+        client = APIClient()
+        client.credentials(**self.client._credentials)
+        with self.assertLogs("api.sql", level="WARNING") as logs:
+            client.get("/api/me/payments")
+        self.assertTrue(logs.records[0].sql_summary["over_budget"])
+
+        stats = QueryStats()
+        for i in range(5):
+            stats(lambda *args: None, "SELECT 1 WHERE id = %s", (i,), False, {})
+        self.assertEqual(stats.repeated(5), [("SELECT 1 WHERE id = %s", 5)])
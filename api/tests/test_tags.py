@@ -0,0 +1,59 @@
+from __future__ import annotations
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import Course, Tag
+from api.tags import get_tag_names, tag_cache
+from api.tests.test_api import BaseAPITestCase
+
+
+class CourseTagTests(BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        tag_cache.clear()
+        self.python, self.web, self.data = (Tag.objects.create(name=name) for name in ("python", "web", "data"))
+        self.course_open.tags.set([self.python, self.web])
+        self.course_closed.tags.set([self.python])
+        self.course_data = Course.objects.create(title="C3", price=1000)
+        self.course_data.tags.set([self.data])
+
+    def list_courses(self, **params):
+        r = self.client.get("/api/courses/", {"page_size": 100, "ordering": "created_at", **params})
+        self.assertEqual(r.status_code, 200)
+        return r.json()["results"]
+
+    def test_tags_embedded_without_tag_queries(self):
+        get_tag_names([])  # 태그 사전 적재
+        with CaptureQueriesContext(connection) as ctx:
+            results = self.list_courses()
+        self.assertEqual(
+            [(row["id"], row["tags"]) for row in results],
+            [(self.course_open.id, ["python", "web"]), (self.course_closed.id, ["python"]),
+             (self.course_data.id, ["data"])],
+        )
+        sql = [q["sql"] for q in ctx.captured_queries]
+        self.assertEqual(sum("api_course_tags" in s for s in sql), 1)
+        self.assertFalse(any('FROM "api_tag"' in s for s in sql))
+
+        r = self.client.get(f"/api/courses/{self.course_open.id}/")
+        self.assertEqual(r.json()["tags"], ["python", "web"])
+        self.assertEqual(self.list_courses(fields="title,tags")[0], {"title": "C1", "tags": ["python", "web"]})
+
+    def test_filter_any_and_all(self):
+        ids = lambda **params: [row["id"] for row in self.list_courses(fields="id", **params)]
+        self.assertEqual(ids(tags="web,data"), [self.course_open.id, self.course_data.id])
+        self.assertEqual(ids(tags="python,web", tags_match="all"), [self.course_open.id])
+        self.assertEqual(ids(tags="python,unknown", tags_match="all"), [])
+        self.assertEqual(ids(tags="python,unknown"), [self.course_open.id, self.course_closed.id])
+        r = self.client.get("/api/courses/", {"tags": "python", "tags_match": "some"})
+        self.assertEqual(r.status_code, 400)
+
+    def test_tag_changes_invalidate_dictionary(self):
+        self.assertEqual(get_tag_names([self.web.id]), ["web"])
+        self.web.name = "frontend"
+        self.web.save()
+        self.assertEqual(self.list_courses(tags="frontend")[0]["tags"], ["python", "frontend"])
+
+    def test_async_list_embeds_tags(self):
+        r = self.client.get("/api/async/courses/", {"tags": "data"})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual([row["tags"] for row in r.json()["results"]], [["data"]])
@@ -0,0 +1,56 @@
+from __future__ import annotations
+from datetime import timedelta
+from unittest import mock
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import timezone
+from config.middleware import ConcurrencyLimitMiddleware
+from config.throttling import TokenBucketThrottle
+from api.tests.test_api import BaseAPITestCase
+
+
+class TokenBucketThrottleTests(BaseAPITestCase):
+    def combination_payload(self):
+        now = timezone.now()
+        return [
+            {"id": i, "name": f"A{i}", "type": "test",
+             "start_at": (now + timedelta(hours=i)).isoformat(),
+             "end_at": (now + timedelta(hours=i, minutes=30)).isoformat()}
+            for i in range(3)
+        ]
+
+    def test_cost_weighted_bucket_rejects_expensive_requests(self):
+        # 조합 추천 비용: 5 + 3 * 2 = 11
+        with mock.patch.dict(TokenBucketThrottle.THROTTLE_RATES, {"combination": "20/min"}):
+            r = self.client.post("/api/combination/recommend", self.combination_payload(), format="json")
+            self.assertEqual(r.status_code, 200)
+            r = self.client.post("/api/combination/recommend", self.combination_payload(), format="json")
+        self.assertEqual(r.status_code, 429)
+        self.assertIn("Retry-After", r)
+
+    def test_buckets_are_separated_per_endpoint(self):
+        with mock.patch.dict(TokenBucketThrottle.THROTTLE_RATES, {"combination": "20/min", "recommend": "4/min"}):
+            self.client.post("/api/combination/recommend", self.combination_payload(), format="json")
+            r = self.client.get("/api/courses/recommend")
+            self.assertEqual(r.status_code, 200)
+            r = self.client.get("/api/courses/recommend")
+        self.assertEqual(r.status_code, 429)
+
+
+class ConcurrencyLimitMiddlewareTests(SimpleTestCase):
+    @override_settings(MAX_IN_FLIGHT_REQUESTS=1, LOAD_SHED_RETRY_AFTER=2)
+    def test_sheds_requests_over_limit(self):
+        factory = RequestFactory()
+        inner = {}
+
+        def get_response(request):
+            # 첫 요청 처리 중에 두 번째 요청이 들어온 상황
+            inner["response"] = middleware(factory.get("/api/tests/"))
+            return HttpResponse("ok")
+
+        middleware = ConcurrencyLimitMiddleware(get_response)
+        response = middleware(factory.get("/api/tests/"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(inner["response"].status_code, 503)
+        self.assertEqual(inner["response"]["Retry-After"], "2")
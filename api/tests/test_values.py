@@ -0,0 +1,78 @@
+from __future__ import annotations
+import json
+from datetime import datetime, timezone as dt_timezone
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from api.models import Course, Test
+from api.serializers import CourseSerializer, PaymentSerializer, TestSerializer
+from api.values import ValuesSerializer
+from api.tests.test_api import BaseAPITestCase
+
+
+class ValuesSerializerParityTests(TestCase):
+    def setUp(self):
+        for model in (Test, Course):
+            model.objects.create(title="기본", price=1000)  # 시작/종료 시각 없음(None), 빈 설명
+            model.objects.create(
+                title="마이크로초   \"따옴표\"",
+                description="설명\n두 줄",
+                start_at=datetime(2025, 1, 31, 23, 59, 59, 999999, tzinfo=dt_timezone.utc),
+                end_at=datetime(2025, 2, 1, 0, 0, tzinfo=dt_timezone.utc),
+                popularity=2 ** 31 - 1,
+                price=0,
+            )
+
+    def assert_parity(self, serializer_class, queryset):
+        values_serializer = ValuesSerializer.for_serializer(serializer_class)
+        expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+        actual = JSONRenderer().render(values_serializer.to_representation(values_serializer.values(queryset)))
+        self.assertEqual(actual, expected)
+
+    def test_byte_identical_to_model_serializer(self):
+        for tz in ("Asia/Seoul", "UTC"):
+            with timezone.override(tz):
+                self.assert_parity(TestSerializer, Test.objects.order_by("id"))
+                self.assert_parity(CourseSerializer, Course.objects.order_by("id"))
+
+    def test_annotated_queryset(self):
+        from django.db.models import Count
+        queryset = Course.objects.annotate(n=Count("tags")).order_by("-n", "-popularity")
+        self.assert_parity(CourseSerializer, queryset)
+
+    def test_rejects_computed_fields(self):
+        with self.assertRaises(ImproperlyConfigured):
+            ValuesSerializer(PaymentSerializer)
+
+
+class ValuesListEndpointTests(BaseAPITestCase):
+    def test_list_matches_model_serializer(self):
+        Course.objects.filter(pk=self.course_closed.pk).update(popularity=5)
+        r = self.client.get("/api/courses/?page_size=100&ordering=popularity")
+        expected = CourseSerializer(Course.objects.order_by("popularity"), many=True).data
+        self.assertEqual(r.json()["results"], json.loads(JSONRenderer().render(expected)))
+
+
+class SparseFieldsetTests(BaseAPITestCase):
+    def test_fields_limits_response_and_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.get("/api/tests/?fields=title,id")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(list(r.json()["results"][0]), ["id", "title"])  # 직렬화기 필드 순서 유지
+        select = next(q["sql"] for q in ctx.captured_queries if "api_test" in q["sql"] and "COUNT" not in q["sql"])
+        self.assertNotIn("description", select)
+
+    def test_omit_on_recommend_and_retrieve(self):
+        r = self.client.get("/api/courses/recommend?omit=description,created_at")
+        self.assertEqual(r.status_code, 200)
+        r = self.client.get(f"/api/courses/{self.course_open.id}/?omit=description")
+        self.assertEqual(r.status_code, 200)
+        self.assertNotIn("description", r.json())
+        self.assertEqual(r.json()["title"], "C1")
+
+    def test_unknown_or_empty_fields_rejected(self):
+        self.assertEqual(self.client.get("/api/courses/?fields=title,secret").status_code, 400)
+        self.assertEqual(self.client.get("/api/courses/?fields=title&omit=title").status_code, 400)
@@ -8,9 +8,11 @@ from .viewsets import (
     PaymentViewSet,
     TestRegistrationViewSet,
     CourseRegistrationViewSet,
-    RegistrationsViewSet, RecommendCoursesViewSet, CombinationRecommendViewSet
+    RegistrationsViewSet, RecommendCoursesViewSet, CombinationRecommendViewSet, ActivityViewSet,
+    RegistrationBatchCompleteViewSet,
 )
 from .authentication import EmailTokenObtainPairView
+from . import async_views
 
 router = DefaultRouter()
 router.register(r"tests", TestViewSet, basename="tests")
@@ -33,6 +35,8 @@ urlpatterns = [
     path("courses/<int:pk>/enroll", CourseViewSet.as_view({"post": "enroll"}), name="enroll_course"),
     # 수업 완료
     path("courses/<int:pk>/complete", CourseRegistrationViewSet.as_view({"post": "complete"}), name="complete_course"),
+    # 결제 일괄 취소
+    path("payments/cancel", PaymentViewSet.as_view({"post": "batch_cancel"}), name="bulk_cancel_payments"),
     # 결제 취소
     path("payments/<int:pk>/cancel", PaymentViewSet.as_view({"post": "cancel"}), name="cancel_payment"),
     # 내 결제 내역
@@ -41,6 +45,17 @@ urlpatterns = [
     path("combination/recommend", CombinationRecommendViewSet.as_view({"post": "combination_recommend"}), name="combination_recommend"),
     # 수업/시험 동시에 수강/응시
     path("registrations", RegistrationsViewSet.as_view({"post": "registrations"}), name="bulk_registrations"),
+    # 시험/수업 신청 일괄 완료
+    path("registrations/complete", RegistrationBatchCompleteViewSet.as_view({"post": "complete"}),
+         name="bulk_complete_registrations"),
     # 태그 기반 수업 추천 (페이지네이션 지원)
     path("courses/recommend", RecommendCoursesViewSet.as_view({"get": "recommend"}), name="recommend_course"),
+    # 시험/수업 통합 목록 (키셋 페이지네이션)
+    path("activities", ActivityViewSet.as_view({"get": "list"}), name="activities"),
+
+    # 비동기(ASGI) 읽기 전용 엔드포인트: 동기 엔드포인트와 동일한 파라미터/응답
+    path("async/tests/", async_views.test_list, name="async_tests"),
+    path("async/courses/", async_views.course_list, name="async_courses"),
+    path("async/courses/recommend", async_views.recommend_courses, name="async_recommend_course"),
+    path("async/me/payments", async_views.my_payments, name="async_me_payments"),
 ]
@@ -0,0 +1,233 @@
+from __future__ import annotations
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# 값 변환 없이 그대로 응답에 사용해도 to_representation 결과와 같은 (직렬화 필드, 모델 필드) 조합
+IDENTITY_FIELDS = (
+    (serializers.IntegerField, (models.IntegerField, models.AutoField)),
+    (serializers.CharField, (models.CharField, models.TextField)),
+)
+
+
+class ValuesSerializer:
+    """
+    ModelSerializer의 필드 정의로 .values() 행 변환기를 미리 만들어 두고,
+    모델 인스턴스 생성/필드별 get_attribute 없이 목록 응답 데이터를 만드는 읽기 전용 직렬화기
+    - 결과는 serializer_class(instances, many=True).data 와 같은 JSON을 생성
+    - 모델 필드를 그대로 읽는 필드만 지원 (SerializerMethodField, 관계/중첩 필드는 ImproperlyConfigured)
+    - 예외: ManyToManyField의 many=True 관계 필드는 페이지 단위로 through 테이블을 한 번 조회 (prefetch)
+      (PrimaryKeyRelatedField 또는 represent_pks(pk 목록)를 제공하는 관계 필드)
+    - field_names: 응답에 포함할 필드 (None이면 전체, 조회 컬럼도 해당 필드로 제한)
+    """
+    _cache: dict[tuple, "ValuesSerializer"] = {}
+
+    def __init__(self, serializer_class, field_names: tuple[str, ...] | None = None):
+        serializer = serializer_class()
+        model = serializer.Meta.model
+        self.serializer_class = serializer_class
+        self.columns = []
+        self.fields = []
+        # (응답 필드 이름, ManyToManyField, pk 목록 변환 함수)
+        self.many_fields = []
+        # 현재 시간대별 변환 함수 목록 (DateTimeField 출력이 활성 시간대에 따라 달라짐)
+        self._converters = {}
+        for name, field in serializer.fields.items():
+            if field.write_only or (field_names is not None and name not in field_names):
+                continue
+            if isinstance(field, serializers.ManyRelatedField) and "." not in field.source:
+                model_field = model._meta.get_field(field.source)
+                represent = getattr(field.child_relation, "represent_pks", None)
+                if represent is None and type(field.child_relation) is serializers.PrimaryKeyRelatedField:
+                    represent = list
+                if not isinstance(model_field, models.ManyToManyField) or represent is None:
+                    raise ImproperlyConfigured(f"{serializer_class.__name__}.{name}: values() 경로에서 지원하지 않는 필드")
+                self.many_fields.append((name, model_field, represent))
+                self.fields.append((name, field, model_field))
+                continue
+            if isinstance(field, (serializers.SerializerMethodField, serializers.RelatedField,
+                                  serializers.BaseSerializer)) or "." in field.source or field.source == "*":
+                raise ImproperlyConfigured(f"{serializer_class.__name__}.{name}: values() 경로에서 지원하지 않는 필드")
+            model_field = model._meta.get_field(field.source)
+            self.columns.append(field.source)
+            self.fields.append((name, field, model_field))
+        # 관계 필드는 행의 pk로 조회
+        self.pk_column = model._meta.pk.attname
+        if self.many_fields and self.pk_column not in self.columns:
+            self.columns.append(self.pk_column)
+
+    @classmethod
+    def for_serializer(cls, serializer_class, field_names: tuple[str, ...] | None = None) -> "ValuesSerializer":
+        key = (serializer_class, field_names)
+        instance = cls._cache.get(key)
+        if instance is None:
+            instance = cls._cache[key] = cls(serializer_class, field_names)
+        return instance
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        return tuple(name for name, _, _ in self.fields)
+
+    @staticmethod
+    def compile(field, model_field, tz):
+        """필드 값 변환 함수 (변환이 필요 없으면 None)"""
+        if isinstance(field, serializers.ManyRelatedField):
+            # prefetch에서 이미 응답 값으로 변환
+            return None
+        for field_class, model_classes in IDENTITY_FIELDS:
+            if type(field) is field_class and isinstance(model_field, model_classes):
+                return None
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if (
+            type(field) is serializers.DateTimeField
+            and tz is not None
+            and not hasattr(field, "timezone")
+            and output_format is not None
+            and output_format.lower() == ISO_8601
+        ):
+            # DateTimeField.to_representation의 ISO 8601 출력과 같은 결과를 시간대 조회 없이 생성
+            to_representation = field.to_representation
+
+            def convert_datetime(value):
+                if value.tzinfo is None:
+                    return to_representation(value)
+                try:
+                    value = value.astimezone(tz).isoformat()
+                except OverflowError:
+                    return to_representation(value)
+                return value[:-6] + "Z" if value.endswith("+00:00") else value
+            return convert_datetime
+        return field.to_representation
+
+    def get_converters(self) -> tuple:
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        converters = self._converters.get(tz)
+        if converters is None:
+            converters = self._converters[tz] = tuple(
+                (name, model_field.name if isinstance(field, serializers.ManyRelatedField) else field.source,
+                 self.compile(field, model_field, tz))
+                for name, field, model_field in self.fields
+            )
+        return converters
+
+    def values(self, queryset):
+        return queryset.values(*self.columns)
+
+    def prefetch(self, rows) -> list[dict]:
+        """
+        관계 필드 값을 행에 채움 (관계 필드당 through 테이블 쿼리 1회, pk 순)
+        - 비동기 뷰에서는 DB 접근이 직렬화 스레드에서 일어나지 않도록 to_representation 전에 호출
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        if not self.many_fields or not rows or self.many_fields[0][1].name in rows[0]:
+            return rows
+        row_ids = [row[self.pk_column] for row in rows]
+        for name, model_field, represent in self.many_fields:
+            through = model_field.remote_field.through
+            source = through._meta.get_field(model_field.m2m_field_name()).attname
+            target = through._meta.get_field(model_field.m2m_reverse_field_name()).attname
+            related = {row_id: [] for row_id in row_ids}
+            pairs = through.objects.filter(**{f"{source}__in": row_ids}).order_by(target).values_list(source, target)
+            for row_id, related_id in pairs:
+                related[row_id].append(related_id)
+            for row in rows:
+                row[model_field.name] = represent(related[row[self.pk_column]])
+        return rows
+
+    def to_representation(self, rows, extra: tuple[str, ...] = ()) -> list[dict]:
+        """extra: 행에 주석(annotate)으로 추가한 값 중 그대로 응답에 포함할 이름"""
+        rows = self.prefetch(rows)
+        converters = self.get_converters()
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in converters:
+                value = row[column]
+                # Serializer.to_representation과 같이 None은 변환하지 않음
+                item[name] = value if convert is None or value is None else convert(value)
+            for name in extra:
+                item[name] = row[name]
+            data.append(item)
+        return data
+
+
+def parse_field_list(value: str) -> list[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def get_sparse_field_names(serializer_class, query_params) -> tuple[str, ...] | None:
+    """
+    ?fields=a,b (포함할 필드) / ?omit=c (제외할 필드) 로 선택된 필드 (지정하지 않으면 None)
+    - 결과는 직렬화기 필드 순서를 따르며, 알 수 없는 필드나 빈 결과는 ValidationError(400)
+    """
+    fields = query_params.get("fields")
+    omit = query_params.get("omit")
+    if not fields and not omit:
+        return None
+    available = ValuesSerializer.for_serializer(serializer_class).field_names
+    selected = set(parse_field_list(fields)) if fields else set(available)
+    omitted = set(parse_field_list(omit)) if omit else set()
+    unknown = (selected | omitted) - set(available)
+    if unknown:
+        raise ValidationError({"fields": f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"})
+    names = tuple(name for name in available if name in selected and name not in omitted)
+    if not names:
+        raise ValidationError({"fields": "최소 한 개의 필드가 필요합니다."})
+    return names
+
+
+def sparse_values_serializer(serializer_class, request) -> ValuesSerializer:
+    """요청의 fields/omit 파라미터를 반영한 ValuesSerializer"""
+    return ValuesSerializer.for_serializer(
+        serializer_class, get_sparse_field_names(serializer_class, request.query_params)
+    )
+
+
+class ValuesListMixin:
+    """
+    list 액션을 ValuesSerializer 경로로 처리 (serializer_class 기준)
+    - ?fields= / ?omit= 으로 응답 필드를 선택하면 조회 컬럼도 같은 필드로 제한 (list: values(), retrieve: only())
+    """
+
+    def get_sparse_field_names(self) -> tuple[str, ...] | None:
+        if not hasattr(self, "_sparse_field_names"):
+            self._sparse_field_names = get_sparse_field_names(self.get_serializer_class(), self.request.query_params)
+        return self._sparse_field_names
+
+    def get_values_serializer(self) -> ValuesSerializer:
+        return ValuesSerializer.for_serializer(self.get_serializer_class(), self.get_sparse_field_names())
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        names = self.get_sparse_field_names() if self.action == "retrieve" else None
+        if names is not None:
+            queryset = queryset.only(*self.get_values_serializer().columns)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        names = self.get_sparse_field_names()
+        if names is not None:
+            for name in list(serializer.fields):
+                if name not in names:
+                    serializer.fields.pop(name)
+        return serializer
+
+    def get_extra_values(self) -> dict:
+        """목록 항목에 추가할 값 {응답 이름: 주석 식} (요청별, values() 조회에 함께 포함)"""
+        return {}
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = self.get_values_serializer()
+        extra_values = self.get_extra_values()
+        queryset = values_serializer.values(self.filter_queryset(self.get_queryset())).annotate(**extra_values)
+        extra = tuple(extra_values)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.to_representation(page, extra))
+        return Response(values_serializer.to_representation(queryset, extra))
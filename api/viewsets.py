@@ -1,16 +1,21 @@
 from __future__ import annotations
 from typing import Any
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import status, permissions, viewsets, mixins
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 import logging
-from django.db.models import Q, Count
+from django.db.models import Q, Count, OuterRef, Prefetch, Subquery
+from django_filters.rest_framework import DjangoFilterBackend
 
+from config.metrics import record_combination_search, record_registration
+from config.profiling import ProfilingMixin
 from .models import (
     Test,
     Course,
@@ -26,10 +31,68 @@ from .serializers import (
     CourseSerializer,
     PaymentSerializer, ActivitySerializer,
 )
-from .exceptions import BusinessLogicException, PaymentException, RegistrationException
+from .combinations import (
+    CombinationSearchBusy,
+    CombinationSearchPool,
+    CombinationSearchTimeout,
+    search_all,
+    to_intervals,
+    unique_combinations,
+)
+from .activities import get_activities_page
+from .search import CatalogSearchFilter
+from .seats import reserve_seat
+from .services import (
+    ALREADY_CANCELED,
+    CANCELED,
+    COMPLETED,
+    NOT_CANCELABLE,
+    NOT_FOUND,
+    cancel_payments,
+    complete_registrations,
+)
+from .tags import filter_by_tags
+from .values import ValuesListMixin, parse_field_list, sparse_values_serializer
+from .exceptions import (
+    BusinessLogicException,
+    CombinationSearchException,
+    PaymentException,
+    RegistrationException,
+    SoldOutException,
+)
 
 logger = logging.getLogger(__name__)
 
+combination_pool = CombinationSearchPool(
+    workers=settings.COMBINATION_POOL_WORKERS,
+    timeout=settings.COMBINATION_TASK_TIMEOUT,
+    max_pending=settings.COMBINATION_POOL_MAX_PENDING,
+)
+
+
+MY_STATUS = "my_status"
+INCLUDE_OPTIONS = (MY_STATUS,)
+
+
+def my_status_values(request, registration_model, target_field: str) -> dict:
+    """
+    ?include=my_status: 목록 항목별 요청 사용자의 신청 상태 (취소 제외 최근 신청의 pending/completed, 없으면 null)
+    - (user, 대상, status) 인덱스를 사용하는 상관 서브쿼리 주석으로 페이지 조회 쿼리에 포함
+    """
+    include = set(parse_field_list(request.query_params.get("include", "")))
+    unknown = include - set(INCLUDE_OPTIONS)
+    if unknown:
+        raise ValidationError({"include": f"알 수 없는 항목입니다: {', '.join(sorted(unknown))}"})
+    if MY_STATUS not in include or not request.user.is_authenticated:
+        return {}
+    registrations = (
+        registration_model.objects
+        .filter(user=request.user, **{target_field: OuterRef("pk")})
+        .exclude(status=RegistrationBase.STATUS_CANCELED)
+        .order_by("-id")
+    )
+    return {MY_STATUS: Subquery(registrations.values("status")[:1])}
+
 
 # 회원가입 viewset
 class SignupViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
@@ -39,11 +102,16 @@ class SignupViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
 
 
 # 시험 ViewSet
-class TestViewSet(viewsets.ReadOnlyModelViewSet):
+class TestViewSet(ValuesListMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = TestSerializer
     queryset = Test.objects.all()
     ordering_fields = ["popularity", "created_at"]
     ordering = ["-created_at"]
+    # ?search= 관련도순 전문 검색 (api/search.py)
+    filter_backends = [DjangoFilterBackend, OrderingFilter, CatalogSearchFilter]
+
+    def get_extra_values(self):
+        return my_status_values(self.request, TestRegistration, "test")
 
     def get_queryset(self):
         AVAILABLE = "available"
@@ -91,9 +159,9 @@ class TestViewSet(viewsets.ReadOnlyModelViewSet):
 
             # 트랜잭션 내에서 모든 작업 수행
             with transaction.atomic():
-                # 인기도 증가
-                test.popularity += 1
-                test.save(update_fields=["popularity"])
+                # 잔여석 예약 + 인기도 증가 (조건부 UPDATE)
+                if not reserve_seat(Test, test.pk):
+                    raise SoldOutException("시험 잔여석이 없습니다.")
 
                 # 신청 생성
                 registration = TestRegistration.objects.create(user=request.user, test=test)
@@ -108,30 +176,41 @@ class TestViewSet(viewsets.ReadOnlyModelViewSet):
                     target_object_id=registration.id,
                 )
 
-                logger.info(f"시험 신청 완료: user={request.user.id}, test={test.id}, payment={payment.id}")
+                record_registration("test")
+                logger.info("시험 신청 완료: user=%s, test=%s, payment=%s", request.user.id, test.id, payment.id)
                 return Response(
                     PaymentSerializer(payment).data, status=status.HTTP_201_CREATED
                 )
 
         except (ValueError, TypeError) as e:
-            logger.error(f"시험 신청 중 데이터 오류: {e}")
+            logger.error("시험 신청 중 데이터 오류: %s", e)
             raise PaymentException("잘못된 결제 정보입니다.")
         except Exception as e:
-            logger.error(f"시험 신청 중 예상치 못한 오류: {e}", exc_info=True)
+            logger.error("시험 신청 중 예상치 못한 오류: %s", e, exc_info=True)
             raise
 
 
 # 수업 ViewSet
-class CourseViewSet(viewsets.ReadOnlyModelViewSet):
+class CourseViewSet(ValuesListMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = CourseSerializer
     queryset = Course.objects.all()
     ordering_fields = ["popularity", "created_at"]
     ordering = ["-created_at"]
+    # ?search= 관련도순 전문 검색 (api/search.py)
+    filter_backends = [DjangoFilterBackend, OrderingFilter, CatalogSearchFilter]
+
+    def get_extra_values(self):
+        return my_status_values(self.request, CourseRegistration, "course")
 
     def get_queryset(self):
         AVAILABLE = "available"
         queryset = super().get_queryset()
 
+        # ?tags= 태그 필터 (any/all)
+        queryset = filter_by_tags(queryset, self.request.query_params)
+        if self.action == "retrieve":
+            queryset = queryset.prefetch_related(Prefetch("tags", queryset=Tag.objects.only("id").order_by("id")))
+
         if self.request.query_params.get("status") == AVAILABLE:
             return (queryset
             .filter(start_at__lte=timezone.now(), end_at__gte=timezone.now())
@@ -171,9 +250,9 @@ class CourseViewSet(viewsets.ReadOnlyModelViewSet):
 
             # 트랜잭션 내에서 모든 작업 수행
             with transaction.atomic():
-                # 인기도 증가
-                course.popularity += 1
-                course.save(update_fields=["popularity"])
+                # 잔여석 예약 + 인기도 증가 (조건부 UPDATE)
+                if not reserve_seat(Course, course.pk):
+                    raise SoldOutException("수업 잔여석이 없습니다.")
 
                 # 신청 생성
                 registration = CourseRegistration.objects.create(user=request.user, course=course)
@@ -188,17 +267,28 @@ class CourseViewSet(viewsets.ReadOnlyModelViewSet):
                     target_object_id=registration.id,
                 )
 
-                logger.info(f"수업 신청 완료: user={request.user.id}, course={course.id}, payment={payment.id}")
+                record_registration("course")
+                logger.info("수업 신청 완료: user=%s, course=%s, payment=%s", request.user.id, course.id, payment.id)
                 return Response(PaymentSerializer(payment).data, status=status.HTTP_201_CREATED)
 
         except (ValueError, TypeError) as e:
-            logger.error(f"수업 신청 중 데이터 오류: {e}")
+            logger.error("수업 신청 중 데이터 오류: %s", e)
             raise PaymentException("잘못된 결제 정보입니다.")
         except Exception as e:
-            logger.error(f"수업 신청 중 예상치 못한 오류: {e}", exc_info=True)
+            logger.error("수업 신청 중 예상치 못한 오류: %s", e, exc_info=True)
             raise
 
 
+def parse_id_list(data, key: str, max_ids: int, label: str) -> list[int]:
+    """일괄 처리 요청 본문의 ID 목록 검증 (정수 목록, 최대 max_ids개, 중복 제거)"""
+    ids = data.get(key, [])
+    if not isinstance(ids, list) or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+        raise ValidationError({key: f"{label} ID 목록이어야 합니다."})
+    if len(ids) > max_ids:
+        raise ValidationError({key: f"한 번에 최대 {max_ids}개까지 처리할 수 있습니다."})
+    return list(dict.fromkeys(ids))
+
+
 # 결제 ViewSet
 class PaymentViewSet(viewsets.GenericViewSet):
     serializer_class = PaymentSerializer
@@ -207,40 +297,40 @@ class PaymentViewSet(viewsets.GenericViewSet):
     @action(detail=True, methods=["post"], url_path="cancel")
     @transaction.atomic
     def cancel(self, request, pk: int | str = None):
-        try:
-            payment = get_object_or_404(Payment, id=pk, user=request.user)
-
-            # 이미 취소된 결제인지 확인
-            if payment.status == Payment.STATUS_CANCELED:
-                raise PaymentException("이미 취소된 결제입니다.")
+        # 일괄 취소와 같은 서비스로 처리 (결제/신청 잠금 조회 후 UPDATE)
+        result = cancel_payments(request.user, [int(pk)])[int(pk)]
+        if result == NOT_FOUND:
+            raise NotFound()
+        # 이미 취소된 결제인지 확인
+        if result == ALREADY_CANCELED:
+            raise PaymentException("이미 취소된 결제입니다.")
+        # 완료된 항목은 취소할 수 없음
+        if result == NOT_CANCELABLE:
+            raise BusinessLogicException("완료된 항목은 취소할 수 없습니다.")
+        logger.info("결제 취소 완료: payment=%s, user=%s", pk, request.user.id)
+        return Response({"message": "결제가 취소되었습니다."}, status=status.HTTP_200_OK)
 
-            target = payment.target
-            # 완료된 항목은 취소할 수 없음
-            if target and getattr(target, "status", None) == TestRegistration.STATUS_COMPLETED:
-                raise BusinessLogicException("완료된 항목은 취소할 수 없습니다.")
-
-            # 트랜잭션 내에서 취소 처리
-            with transaction.atomic():
-                try:
-                    # 결제 취소
-                    payment.cancel()
-                    logger.info(f"결제 취소 완료: payment={payment.id}, user={request.user.id}")
-                    return Response({"message": "결제가 취소되었습니다."}, status=status.HTTP_200_OK)
-                except ValueError as e:
-                    logger.error(f"결제 취소 중 오류: {e}")
-                    raise BusinessLogicException(str(e))
-
-        except Exception as e:
-            logger.error(f"결제 취소 중 예상치 못한 오류: {e}", exc_info=True)
-            raise
-
-
-class PaymentDetailViewSet(viewsets.GenericViewSet):
+    @transaction.atomic
+    def batch_cancel(self, request):
+        if not hasattr(request.data, "get"):
+            raise ValidationError("잘못된 요청입니다.")
+        ids = parse_id_list(request.data, "payment_ids", settings.BATCH_CANCEL_MAX_IDS, "결제")
+        outcomes = cancel_payments(request.user, ids)
+        canceled = sum(result == CANCELED for result in outcomes.values())
+        logger.info("결제 일괄 취소: user=%s, requested=%s, canceled=%s", request.user.id, len(ids), canceled)
+        return Response({
+            "canceled": canceled,
+            "results": [{"id": pk, "result": result} for pk, result in outcomes.items()],
+        })
+
+
+class PaymentDetailViewSet(ProfilingMixin, viewsets.GenericViewSet):
     serializer_class = PaymentDetailSerializer
     queryset = Payment.objects.all()
 
-    @action(detail=False, methods=["get"], url_path="me")
-    def me(self, request):
+    @staticmethod
+    def get_my_payments_queryset(request):
+        """내 결제 내역 조회 조건 (상태/기간 필터, 최신순)"""
         qs = Payment.objects.filter(user=request.user)
         status_param = request.query_params.get("status")
         if status_param:
@@ -251,28 +341,65 @@ class PaymentDetailViewSet(viewsets.GenericViewSet):
             qs = qs.filter(created_at__date__gte=from_date)
         if to_date:
             qs = qs.filter(created_at__date__lte=to_date)
-        qs = qs.order_by("-created_at")
+        return qs.order_by("-created_at")
+
+    @staticmethod
+    def build_payment_detail(payment, registration) -> dict:
+        """결제 + 신청(시험/수업) 정보를 응답 항목으로 변환"""
+        is_test = isinstance(registration, TestRegistration)
+        target = registration.test if is_test else registration.course
+        return {
+            "payment_id": payment.id,
+            "amount": payment.amount,
+            "method": payment.method,
+            "status": payment.status,
+            "created_at": payment.created_at,
+            "canceled_at": payment.canceled_at,
+            "target_type": payment.target_content_type.model,
+            "target_registration_id": registration.id,
+            "target_title": target.title,
+            "target_start_at": target.start_at,
+            "target_end_at": target.end_at,
+        }
+
+    @staticmethod
+    def get_registration_querysets(payments) -> list[tuple[int, Any]]:
+        """
+        페이지의 결제가 가리키는 신청(GenericForeignKey)을 유형별 쿼리셋으로 묶음 (유형별 1회 조회)
+        - payments는 target_content_type을 select_related로 함께 조회해야 추가 쿼리가 없음
+        - 반환: [(content type id, 시험/수업을 함께 조회하는 신청 쿼리셋)]
+        """
+        ids_by_type: dict[int, list] = {}
+        models = {}
+        for payment in payments:
+            ids_by_type.setdefault(payment.target_content_type_id, []).append(payment.target_object_id)
+            models[payment.target_content_type_id] = payment.target_content_type.model_class()
+        querysets = []
+        for content_type_id, ids in ids_by_type.items():
+            model = models[content_type_id]
+            related = "test" if model is TestRegistration else "course"
+            querysets.append((content_type_id, model.objects.filter(id__in=ids).select_related(related)))
+        return querysets
+
+    @classmethod
+    def build_payment_details(cls, payments, registrations: dict) -> list[dict]:
+        """registrations: {(content type id, 신청 id): 신청}"""
+        return [
+            cls.build_payment_detail(payment, registrations[payment.target_content_type_id, payment.target_object_id])
+            for payment in payments
+        ]
+
+    @action(detail=False, methods=["get"], url_path="me")
+    def me(self, request):
+        qs = self.get_my_payments_queryset(request).select_related("target_content_type")
 
         page = self.paginate_queryset(qs)
-        data = []
-        for payment in page:
-            is_test = isinstance(payment.target, TestRegistration)
-            data.append(
-                {
-                    "payment_id": payment.id,
-                    "amount": payment.amount,
-                    "method": payment.method,
-                    "status": payment.status,
-                    "created_at": payment.created_at,
-                    "canceled_at": payment.canceled_at,
-                    "target_type": payment.target_content_type.model,
-                    "target_registration_id": payment.target.id,
-                    "target_title": payment.target.test.title if is_test else payment.target.course.title,
-                    "target_start_at": payment.target.test.start_at if is_test else payment.target.course.start_at,
-                    "target_end_at": payment.target.test.end_at if is_test else payment.target.course.end_at,
-                }
-            )
-        serializer = PaymentDetailSerializer(data, many=True)
+        registrations = {
+            (content_type_id, registration.id): registration
+            for content_type_id, queryset in self.get_registration_querysets(page)
+            for registration in queryset
+        }
+        serializer = PaymentDetailSerializer(self.build_payment_details(page, registrations), many=True)
         return self.get_paginated_response(serializer.data)
 
 
@@ -299,11 +426,11 @@ class TestRegistrationViewSet(viewsets.ViewSet):
                     else reg.save()
                 )
 
-                logger.info(f"시험 완료 처리: registration={reg.id}, user={request.user.id}")
+                logger.info("시험 완료 처리: registration=%s, user=%s", reg.id, request.user.id)
                 return Response({"message": "시험 응시 상태가 완료로 변경되었습니다."})
 
         except Exception as e:
-            logger.error(f"시험 완료 처리 중 오류: {e}", exc_info=True)
+            logger.error("시험 완료 처리 중 오류: %s", e, exc_info=True)
             raise
 
 
@@ -330,23 +457,49 @@ class CourseRegistrationViewSet(viewsets.ViewSet):
                     else reg.save()
                 )
 
-                logger.info(f"수업 완료 처리: registration={reg.id}, user={request.user.id}")
+                logger.info("수업 완료 처리: registration=%s, user=%s", reg.id, request.user.id)
                 return Response({"message": "수업 수강 상태가 완료로 변경되었습니다."})
 
         except Exception as e:
-            logger.error(f"수업 완료 처리 중 오류: {e}", exc_info=True)
+            logger.error("수업 완료 처리 중 오류: %s", e, exc_info=True)
             raise
 
+# 시험/수업 신청 일괄 완료
+class RegistrationBatchCompleteViewSet(viewsets.ViewSet):
+    TARGETS = (("test_ids", "test", TestRegistration), ("course_ids", "course", CourseRegistration))
+
+    @transaction.atomic
+    def complete(self, request):
+        if not hasattr(request.data, "get"):
+            raise ValidationError("잘못된 요청입니다.")
+        targets = [
+            (target_type, model, parse_id_list(request.data, key, settings.BATCH_COMPLETE_MAX_IDS, "신청"))
+            for key, target_type, model in self.TARGETS
+        ]
+        results = []
+        for target_type, model, ids in targets:
+            outcomes = complete_registrations(request.user, model, ids)
+            results.extend({"target_type": target_type, "id": pk, "result": result} for pk, result in outcomes.items())
+
+        completed = sum(item["result"] == COMPLETED for item in results)
+        logger.info("신청 일괄 완료: user=%s, requested=%s, completed=%s", request.user.id, len(results), completed)
+        return Response({"completed": completed, "results": results})
+
+
 # 신청 가능한 일정 조합 추천
-class CombinationRecommendViewSet(viewsets.GenericViewSet):
-    def _is_overlap(self, activity1, activity2):
-        """두 액티비티가 겹치는지 확인하는 헬퍼 함수"""
-        start1, end1 = activity1['start_at'], activity1['end_at']
-        start2, end2 = activity2['start_at'], activity2['end_at']
-        return start1 < end2 and start2 < end1
+class CombinationRecommendViewSet(ProfilingMixin, viewsets.GenericViewSet):
+    throttle_scope = "combination"
+
+    def get_throttle_cost(self, request) -> int:
+        # 조합 탐색 비용은 액티비티 수에 따라 급격히 증가
+        size = len(request.data) if isinstance(request.data, list) else 0
+        return 5 + size * 2
 
     @action(detail=False, methods=["post"], url_path="combination_recommend")
     def combination_recommend(self, request):
+        # 조합 수는 액티비티 수에 지수적으로 증가하므로 검증 전에 입력 크기 제한
+        if isinstance(request.data, list) and len(request.data) > settings.COMBINATION_MAX_ACTIVITIES:
+            raise ValidationError(f"액티비티는 최대 {settings.COMBINATION_MAX_ACTIVITIES}개까지 요청할 수 있습니다.")
         request_serializer = ActivitySerializer(data=request.data, many=True)
         if not request_serializer.is_valid():
             return Response(request_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -355,64 +508,48 @@ class CombinationRecommendViewSet(viewsets.GenericViewSet):
 
         # 성능을 위해 시작 시간 기준으로 정렬
         activities.sort(key=lambda x: x['start_at'])
+        intervals = to_intervals(activities)
+
+        # 액티비티 수가 임계값 이상이면 프로세스 풀에서 첫 액티비티 기준으로 분할 탐색
+        if len(activities) >= settings.COMBINATION_POOL_THRESHOLD:
+            try:
+                index_combinations = combination_pool.search(intervals)
+            except CombinationSearchTimeout:
+                logger.warning("조합 탐색 시간 초과: activities=%s", len(activities))
+                raise CombinationSearchException("조합 탐색 시간이 초과되었습니다.")
+            except CombinationSearchBusy:
+                raise CombinationSearchException("조합 탐색 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+            mode = "pool"
+        else:
+            index_combinations = search_all(intervals)
+            mode = "inline"
+        record_combination_search(len(activities), len(index_combinations), mode)
 
-        results = []
-
-        # 재귀 함수 정의
-        def find_combinations(start_index, current_combination):
-            # 현재 조합이 유효하므로 결과에 추가 (단, 비어있지 않은 조합만)
-            if current_combination:
-                results.append(list(current_combination))
-
-            # 남은 액티비티들을 순회하며 조합 확장
-            for i in range(start_index, len(activities)):
-                next_activity = activities[i]
-
-                # 현재 조합에 있는 어떤 액티비티와도 겹치지 않는지 확인
-                is_compatible = True
-                for existing_activity in current_combination:
-                    if self._is_overlap(existing_activity, next_activity):
-                        is_compatible = False
-                        break
-
-                # 겹치지 않는다면, 조합에 추가하고 다음 단계로 재귀 호출
-                if is_compatible:
-                    current_combination.append(next_activity)
-                    find_combinations(i + 1, current_combination)
-                    # 다음 탐색을 위해 마지막에 추가한 요소 제거
-                    current_combination.pop()
-
-        # 재귀 시작
-        find_combinations(0, [])
-
-        # 중복 제거 및 가장 긴 조합부터 정렬하여 응답
-        unique_combinations = []
-        seen = set()
-        for combo in results:
-            # 리스트를 정렬된 문자열로 변환하여 중복 체크
-            sorted_combo = sorted(combo, key=lambda x: x.get('id', 0))
-            combo_str = str(sorted_combo)
-            if combo_str not in seen:
-                seen.add(combo_str)
-                unique_combinations.append(combo)
-        
-        unique_combinations.sort(key=len, reverse=True)
+        # 중복 제거(같은 액티비티 구성) 및 가장 긴 조합부터 정렬 (인덱스 튜플로 처리하고 응답할 페이지만 액티비티로 변환)
+        combinations = unique_combinations(activities, index_combinations)
+        combinations.sort(key=len, reverse=True)
 
         # 페이지네이션 적용
-        page = self.paginate_queryset(unique_combinations)
+        page = [[activities[i] for i in combo] for combo in self.paginate_queryset(combinations)]
         return self.get_paginated_response(page)
 
 
 # 수업/시험 동시 결제 ViewSet
 class RegistrationsViewSet(viewsets.ViewSet):
+    throttle_scope = "registrations"
+
+    def get_throttle_cost(self, request) -> int:
+        # 신청 항목 수만큼 조회/쓰기 발생
+        items = request.data.get("list") if hasattr(request.data, "get") else None
+        return 2 + (len(items) if isinstance(items, list) else 0)
+
     @action(detail=True, methods=["post"], url_path="registrations")
     @transaction.atomic
     def registrations(self, request):
         try:
-            logger.error('-----------------')
-            logger.error(f"{request.data}")
-
             data_list = request.data.get("list")
+            logger.debug("일괄 신청 요청: user=%s, items=%s", request.user.id,
+                         len(data_list) if isinstance(data_list, list) else None)
             if not isinstance(data_list, list):
                 raise ValidationError("잘못된 요청입니다.")
             method = request.data.get("payment_method")
@@ -450,8 +587,8 @@ class RegistrationsViewSet(viewsets.ViewSet):
                         if original_price != test.price:
                             raise PaymentException("결제 금액이 시험 가격과 다릅니다.")
 
-                        test.popularity += 1
-                        test.save(update_fields=["popularity"])
+                        if not reserve_seat(Test, test.pk):
+                            raise SoldOutException("시험 잔여석이 없습니다.")
                         # 신청 생성
                         registration = TestRegistration.objects.create(user=request.user, test=test)
                         # 결제생성
@@ -464,6 +601,7 @@ class RegistrationsViewSet(viewsets.ViewSet):
                             target_content_type=ContentType.objects.get_for_model(TestRegistration),
                             target_object_id=registration.id,
                         )
+                        record_registration("test", source="bulk")
 
                     elif param.get("target_type") == "course":  # 수업의 경우
                         course = get_object_or_404(Course, id=param.get("target_id"))
@@ -489,8 +627,8 @@ class RegistrationsViewSet(viewsets.ViewSet):
                         if original_price != course.price:
                             raise PaymentException("결제 금액이 수업 가격과 다릅니다.")
 
-                        course.popularity += 1
-                        course.save(update_fields=["popularity"])
+                        if not reserve_seat(Course, course.pk):
+                            raise SoldOutException("수업 잔여석이 없습니다.")
                         # 신청 생성
                         registration = CourseRegistration.objects.create(user=request.user, course=course)
                         # 결제생성
@@ -503,55 +641,77 @@ class RegistrationsViewSet(viewsets.ViewSet):
                             target_content_type=ContentType.objects.get_for_model(CourseRegistration),
                             target_object_id=registration.id,
                         )
+                        record_registration("course", source="bulk")
 
             return Response("신청 완료", status=status.HTTP_201_CREATED)
 
         except (ValueError, TypeError) as e:
-            logger.error(f"수업 신청 중 데이터 오류: {e}")
+            logger.error("수업 신청 중 데이터 오류: %s", e)
             raise PaymentException("잘못된 결제 정보입니다.")
         except Exception as e:
-            logger.error(f"수업 신청 중 예상치 못한 오류: {e}", exc_info=True)
+            logger.error("수업 신청 중 예상치 못한 오류: %s", e, exc_info=True)
             raise
 
 
 # 사용자 수강 수업 태그 기반으로 수업 추천
-class RecommendCoursesViewSet(viewsets.ReadOnlyModelViewSet):
+class RecommendCoursesViewSet(ProfilingMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = CourseSerializer
+    throttle_scope = "recommend"
+    throttle_cost = 4
 
     def get_queryset(self):
         return Course.objects.all()
 
-    @action(detail=False, methods=["get"], url_path="recommend")
-    def recommend(self, request):
-        user_taken_course_tags = (Tag.objects.filter(
-            courses__courseregistration__user=request.user
-        ).exclude(
-            courses__courseregistration__status=RegistrationBase.STATUS_CANCELED
+    # 수강으로 보는 신청 상태 (취소 제외)
+    # - 사용자 조건과 같은 신청 행에 걸리도록 filter() 한 번에 지정
+    #   (exclude()는 별도 서브쿼리라 다른 사용자의 취소 신청이 있는 수업/태그까지 제외)
+    TAKEN_STATUSES = [RegistrationBase.STATUS_PENDING, RegistrationBase.STATUS_COMPLETED]
+
+    @classmethod
+    def get_taken_tag_ids_queryset(cls, user):
+        """사용자가 수강(취소 제외)한 수업들의 태그 ID"""
+        return (Tag.objects.filter(
+            courses__courseregistration__user=user,
+            courses__courseregistration__status__in=cls.TAKEN_STATUSES,
         ).values_list('id', flat=True).distinct())
 
-        if not user_taken_course_tags:
-            empty_qs = Course.objects.none()
-            page = self.paginate_queryset(empty_qs)
-            serializer = CourseSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
+    @classmethod
+    def get_recommended_queryset(cls, user, tag_ids):
+        """겹치는 태그 수 > 인기순으로 정렬된 추천 수업 (수강한 수업 제외)"""
         user_taken_course_ids = Course.objects.filter(
-            courseregistration__user=request.user
-        ).exclude(
-            courseregistration__status=RegistrationBase.STATUS_CANCELED
+            courseregistration__user=user,
+            courseregistration__status__in=cls.TAKEN_STATUSES,
         ).values_list('id', flat=True)
 
         # 추천 대상 수업들을 필터링하고, 겹치는 태그 수를 계산하여 정렬합니다.
-        recommended_courses = Course.objects.exclude(
+        return Course.objects.exclude(
             id__in=user_taken_course_ids  # 이미 수강한 수업 제외
         ).annotate(
-            matching_tags_count=Count('tags', filter=Q(tags__id__in=user_taken_course_tags))
+            matching_tags_count=Count('tags', filter=Q(tags__id__in=tag_ids))
         ).filter(
             matching_tags_count__gt=0  # 겹치는 태그가 하나 이상 있는 수업만 필터링
         ).order_by(
             '-matching_tags_count', '-popularity'  # 겹치는 태그 수 > 인기순으로 정렬
         )
 
-        page = self.paginate_queryset(recommended_courses)
-        serializer = CourseSerializer(page, many=True)
-        return self.get_paginated_response(serializer.data)
+    @action(detail=False, methods=["get"], url_path="recommend")
+    def recommend(self, request):
+        values_serializer = sparse_values_serializer(CourseSerializer, request)
+        user_taken_course_tags = self.get_taken_tag_ids_queryset(request.user)
+
+        if not user_taken_course_tags:
+            empty_qs = Course.objects.none()
+            page = self.paginate_queryset(empty_qs)
+            return self.get_paginated_response(values_serializer.to_representation(page))
+
+        recommended_courses = self.get_recommended_queryset(request.user, user_taken_course_tags)
+
+        page = self.paginate_queryset(values_serializer.values(recommended_courses))
+        return self.get_paginated_response(values_serializer.to_representation(page))
+
+
+# 시험/수업 통합 목록 (UNION ALL + 키셋 페이지네이션, api/activities.py)
+class ActivityViewSet(viewsets.ViewSet):
+
+    def list(self, request):
+        return Response(get_activities_page(request))
@@ -0,0 +1,142 @@
+"""
+동일한 워커 수에서 WSGI(gunicorn sync 워커)와 ASGI(uvicorn 워커)의 동시 처리 성능 비교
+
+사용법 (DB는 현재 환경변수 설정을 사용하며 migrate 된 상태여야 함):
+    python benchmarks/bench_asgi.py --workers 3 --concurrency 32 --requests 600
+
+각 엔드포인트에 대해
+- WSGI: gunicorn config.wsgi --workers N 의 동기 엔드포인트 (/api/...)
+- ASGI: uvicorn config.asgi --workers N 의 비동기 엔드포인트 (/api/async/...)
+를 같은 동시성으로 호출하여 처리량(req/s)과 지연시간(p50/p95/p99)을 출력합니다.
+"""
+from __future__ import annotations
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+ENDPOINTS = [
+    ("tests", "/api/tests/", "/api/async/tests/"),
+    ("courses", "/api/courses/", "/api/async/courses/"),
+    ("me/payments", "/api/me/payments", "/api/async/me/payments"),
+    ("courses/recommend", "/api/courses/recommend", "/api/async/courses/recommend"),
+]
+
+
+def issue_token() -> str:
+    import django
+
+    django.setup()
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    User = get_user_model()
+    user, created = User.objects.get_or_create(
+        email="bench@example.com", defaults={"username": "bench"}
+    )
+    if created:
+        user.set_password("bench1234")
+        user.save()
+    return str(AccessToken.for_user(user))
+
+
+def start_server(kind: str, workers: int, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        # 벤치마크 중 요청 제한/SQL 로그가 결과를 왜곡하지 않도록 완화
+        "DJANGO_THROTTLE_RECOMMEND": "1000000/min",
+        "DJANGO_MAX_IN_FLIGHT_REQUESTS": "0",
+    }
+    if kind == "wsgi":
+        cmd = ["gunicorn", "config.wsgi:application", "--workers", str(workers),
+               "--bind", f"127.0.0.1:{port}"]
+    else:
+        cmd = ["uvicorn", "config.asgi:application", "--workers", str(workers),
+               "--host", "127.0.0.1", "--port", str(port), "--no-access-log"]
+    return subprocess.Popen(cmd, cwd=BASE_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_ready(url: str, timeout: float = 30) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1)
+            return
+        except urllib.error.HTTPError:
+            return  # 401 등 응답이 오면 서버 준비 완료
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server not ready: {url}")
+
+
+def run_load(url: str, token: str, requests: int, concurrency: int) -> dict:
+    def one(_):
+        req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=60) as resp:
+                resp.read()
+                ok = resp.status == 200
+        except urllib.error.HTTPError:
+            ok = False
+        return time.perf_counter() - started, ok
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] * 1000 for r in results)
+    q = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": requests / elapsed,
+        "p50": q[49],
+        "p95": q[94],
+        "p99": q[98],
+        "errors": sum(1 for r in results if not r[1]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--port", type=int, default=8101)
+    args = parser.parse_args()
+
+    token = issue_token()
+    servers = {
+        "wsgi": (start_server("wsgi", args.workers, args.port), args.port),
+        "asgi": (start_server("asgi", args.workers, args.port + 1), args.port + 1),
+    }
+    try:
+        for _, (_, port) in servers.items():
+            wait_ready(f"http://127.0.0.1:{port}/api/tests/")
+
+        print(f"workers={args.workers} concurrency={args.concurrency} requests={args.requests}")
+        print(f"{'endpoint':<20}{'server':<6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for name, sync_path, async_path in ENDPOINTS:
+            for kind, path in (("wsgi", sync_path), ("asgi", async_path)):
+                port = servers[kind][1]
+                r = run_load(f"http://127.0.0.1:{port}{path}", token, args.requests, args.concurrency)
+                print(f"{name:<20}{kind:<6}{r['rps']:>10.1f}{r['p50']:>10.1f}{r['p95']:>10.1f}{r['p99']:>10.1f}{r['errors']:>8}")
+    finally:
+        for process, _ in servers.values():
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
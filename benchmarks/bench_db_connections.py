@@ -0,0 +1,101 @@
+"""
+DB 연결 재사용 방식별 요청당 오버헤드 비교
+
+사용법 (DB는 현재 환경변수 설정을 사용하며 migrate 된 상태여야 함):
+    python benchmarks/bench_db_connections.py --requests 500
+
+WSGIHandler를 직접 호출하여 실제 서버와 같은 요청 시작/종료 시그널(연결 정리)을 거치도록 하고,
+다음 방식을 각각 별도 프로세스에서 측정합니다.
+- per_request: CONN_MAX_AGE=0 (요청마다 새 연결)
+- persistent: CONN_MAX_AGE=60 + CONN_HEALTH_CHECKS
+- pool: psycopg 3 커넥션 풀 (PostgreSQL에서만)
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+MODES = {
+    "per_request": {"DJANGO_DB_POOL": "false", "DJANGO_DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DJANGO_DB_POOL": "false", "DJANGO_DB_CONN_MAX_AGE": "60"},
+    "pool": {"DJANGO_DB_POOL": "true"},
+}
+
+
+def measure(path: str, requests: int) -> dict:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+    from django.contrib.auth import get_user_model
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connections
+    from django.test import RequestFactory
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    User = get_user_model()
+    user, _ = User.objects.get_or_create(email="bench@example.com", defaults={"username": "bench"})
+    token = str(AccessToken.for_user(user))
+    connections.close_all()
+
+    handler = WSGIHandler()
+    factory = RequestFactory()
+
+    def start_response(status, headers, exc_info=None):
+        assert status.startswith("200"), status
+
+    path_info, _, query_string = path.partition("?")
+    latencies = []
+    for _ in range(requests):
+        environ = factory._base_environ(PATH_INFO=path_info, QUERY_STRING=query_string,
+                                        REQUEST_METHOD="GET", HTTP_AUTHORIZATION=f"Bearer {token}")
+        started = time.perf_counter()
+        response = handler(environ, start_response)
+        b"".join(response)
+        response.close()  # request_finished → 연결 정리(close_old_connections)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    q = statistics.quantiles(latencies, n=100)
+    return {"mean": statistics.mean(latencies), "p50": q[49], "p95": q[94], "p99": q[98]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--path", default="/api/tests/?page_size=1")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(measure(args.path, args.requests)))
+        return
+
+    engine = os.getenv("DJANGO_DB_ENGINE", "django.db.backends.postgresql")
+    print(f"engine={engine} path={args.path} requests={args.requests}")
+    print(f"{'mode':<14}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for mode, env in MODES.items():
+        if mode == "pool" and engine != "django.db.backends.postgresql":
+            continue
+        env = {
+            **os.environ, **env,
+            # 요청 제한/SQL 로그가 결과를 왜곡하지 않도록 완화
+            "DJANGO_MAX_IN_FLIGHT_REQUESTS": "0",
+        }
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--requests", str(args.requests), "--path", args.path],
+            env=env, cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        print(f"{mode:<14}{r['mean']:>10.2f}{r['p50']:>10.2f}{r['p95']:>10.2f}{r['p99']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
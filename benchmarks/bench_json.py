@@ -0,0 +1,94 @@
+"""
+DRF 기본 JSON 렌더러/파서와 orjson 기반 렌더러/파서(config.renderers / config.parsers) 비교
+
+사용법:
+    python benchmarks/bench_json.py --items 500 --activities 16 --repeat 20
+
+- registrations 요청: POST /api/registrations 본문 (신청 항목 --items개) 파싱
+- combination 요청: POST /api/combination/recommend 본문 (액티비티 --activities개) 파싱
+- combination 응답: 조합 탐색 결과(시각 포함 dict 목록) 전체 렌더링
+"""
+from __future__ import annotations
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+
+def build_payloads(items: int, activities: int):
+    from api.combinations import search_all, to_intervals
+
+    registrations = {
+        "payment_method": "credit_card",
+        "list": [{"target_type": "test" if i % 2 else "course", "target_id": i, "amount": 10000 + i}
+                 for i in range(items)],
+    }
+    base = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    activity_list = [
+        {"id": i, "title": f"액티비티 {i}",
+         "start_at": base + timedelta(hours=3 * (i // 2) + (i % 2)),
+         "end_at": base + timedelta(hours=3 * (i // 2) + (i % 2) + 2)}
+        for i in range(activities)
+    ]
+    combinations = [[activity_list[i] for i in combo] for combo in search_all(to_intervals(activity_list))]
+    combination_request = [
+        {**a, "start_at": a["start_at"].isoformat(), "end_at": a["end_at"].isoformat()} for a in activity_list
+    ]
+    return registrations, combination_request, {"count": len(combinations), "results": combinations}
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--activities", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from config.parsers import FastJSONParser
+    from config.renderers import FastJSONRenderer
+
+    registrations, combination_request, combination_response = build_payloads(args.items, args.activities)
+    bodies = {
+        "registrations": json.dumps(registrations, ensure_ascii=False).encode(),
+        "combination": json.dumps(combination_request, ensure_ascii=False).encode(),
+    }
+
+    print(f"items={args.items} activities={args.activities} combinations={combination_response['count']}")
+    print(f"{'case':<32}{'size KB':>10}{'drf ms':>10}{'fast ms':>10}{'speedup':>9}")
+    for name, body in bodies.items():
+        drf = measure(lambda: JSONParser().parse(io.BytesIO(body)), args.repeat)
+        fast = measure(lambda: FastJSONParser().parse(io.BytesIO(body)), args.repeat)
+        print(f"{'parse ' + name + ' request':<32}{len(body) / 1024:>10.1f}{drf:>10.2f}{fast:>10.2f}{drf / fast:>8.1f}x")
+
+    rendered = JSONRenderer().render(combination_response)
+    assert rendered == FastJSONRenderer().render(combination_response)
+    drf = measure(lambda: JSONRenderer().render(combination_response), args.repeat)
+    fast = measure(lambda: FastJSONRenderer().render(combination_response), args.repeat)
+    print(f"{'render combination response':<32}{len(rendered) / 1024:>10.1f}{drf:>10.2f}{fast:>10.2f}{drf / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+요청 경로에서 로그 호출 비용 비교 (동기 FileHandler vs 큐 기반 핸들러)
+
+사용법:
+    python benchmarks/bench_logging.py --threads 8 --messages 5000 --disk-latency-ms 0.2
+
+여러 스레드(요청 스레드 역할)에서 로그를 기록하며 호출 스레드가 소비한 시간을 측정합니다.
+- sync: 기존 설정과 같은 콘솔 + FileHandler, f-string 메시지
+- queue: config.log.NonBlockingQueueHandler, %-style 지연 포맷
+- queue+sampling: queue + INFO 로그 10% 샘플링 (요청별 SQL 요약 등 대량 로그)
+--disk-latency-ms 로 느린 디스크(쓰기당 지연)를 흉내 낼 수 있습니다.
+"""
+from __future__ import annotations
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from config.log import NonBlockingQueueHandler, SamplingFilter  # noqa: E402
+
+FORMAT = "{levelname} {asctime} {module} {process:d} {thread:d} {message}"
+
+
+class SlowFileHandler(logging.FileHandler):
+    def __init__(self, filename: str, latency: float):
+        super().__init__(filename)
+        self.latency = latency
+
+    def emit(self, record):
+        super().emit(record)
+        if self.latency:
+            time.sleep(self.latency)
+
+
+def build_targets(tmpdir: str, name: str, latency: float) -> list[logging.Handler]:
+    formatter = logging.Formatter(FORMAT, style="{")
+    handlers = [
+        logging.StreamHandler(open(os.devnull, "w")),
+        SlowFileHandler(os.path.join(tmpdir, f"{name}.log"), latency),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def run(logger: logging.Logger, threads: int, messages: int, lazy: bool) -> list[float]:
+    payload = {"list": [{"test_id": i} for i in range(5)], "payment_method": "card"}
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        for i in range(messages):
+            started = time.perf_counter()
+            if lazy:
+                logger.info("sql view=%s queries=%d payload=%s", "tests-list", i, payload)
+            else:
+                logger.info(f"sql view=tests-list queries={i} payload={payload}")
+            local.append((time.perf_counter() - started) * 1_000_000)
+        with lock:
+            latencies.extend(local)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--disk-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    latency = args.disk_latency_ms / 1000
+
+    print(f"threads={args.threads} messages/thread={args.messages} disk_latency_ms={args.disk_latency_ms}")
+    print(f"{'setup':<16}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'total s':>10}{'dropped':>9}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in ("sync", "queue", "queue+sampling"):
+            logger = logging.getLogger(f"bench.{name}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            targets = build_targets(tmpdir, name, latency)
+            if name == "sync":
+                handlers = targets
+            else:
+                queue_handler = NonBlockingQueueHandler(handlers=targets, queue_size=10000)
+                if name == "queue+sampling":
+                    queue_handler.addFilter(SamplingFilter(rate=0.1))
+                handlers = [queue_handler]
+            for handler in handlers:
+                logger.addHandler(handler)
+
+            started = time.perf_counter()
+            latencies = run(logger, args.threads, args.messages, lazy=name != "sync")
+            elapsed = time.perf_counter() - started
+
+            dropped = 0
+            for handler in handlers:
+                dropped += getattr(handler, "dropped", 0)
+                handler.close()
+            q = statistics.quantiles(latencies, n=100)
+            print(f"{name:<16}{statistics.mean(latencies):>10.1f}{q[49]:>10.1f}{q[98]:>10.1f}"
+                  f"{elapsed:>10.2f}{dropped:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+시험 목록 검색 비교: 전문 검색 인덱스(api.search) vs title/description icontains(LIKE '%q%')
+
+사용법 (DB는 현재 환경변수 설정을 사용하며 migrate 된 상태여야 함):
+    python benchmarks/bench_search.py --rows 100000 --repeat 20
+
+트랜잭션 안에서 시험 --rows개를 만들어 측정한 뒤 롤백하므로 DB에 데이터가 남지 않습니다.
+검색어별로 목록 첫 페이지 조회 + 전체 건수(count) 시간을 측정합니다.
+"""
+from __future__ import annotations
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+WORDS = (
+    "파이썬", "자바", "데이터", "분석", "머신러닝", "알고리즘", "네트워크", "보안", "클라우드", "데이터베이스",
+    "프론트엔드", "백엔드", "운영체제", "컴파일러", "통계", "선형대수", "웹개발", "모바일", "디자인", "마케팅",
+    "기초", "심화", "실전", "입문", "자격증", "모의고사", "중간평가", "기말평가", "프로젝트", "세미나",
+)
+# 흔한 단어 / 여러 단어 / 드문 단어(회차 번호) / 짧은 단어 / 결과 없음
+QUERIES = ("파이썬", "머신러닝 실전", "4321회차", "기초", "없는검색어")
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    from django.db import connection, transaction
+    from django.db.models import Q
+    from django.test import RequestFactory
+    from rest_framework.request import Request
+    from api.models import Test
+    from api.search import CatalogSearchFilter
+
+    rng = random.Random(0)
+    search_filter = CatalogSearchFilter()
+
+    with transaction.atomic():
+        started = time.perf_counter()
+        Test.objects.bulk_create(
+            (
+                Test(title=f"{' '.join(rng.sample(WORDS, 3))} {i}회차", description=" ".join(rng.choices(WORDS, k=6)),
+                     popularity=i % 100, price=10000)
+                for i in range(args.rows)
+            ),
+            batch_size=5000,
+        )
+        print(f"{connection.vendor}: {args.rows} rows seeded in {time.perf_counter() - started:.1f}s")
+        queryset = Test.objects.order_by("-created_at")
+
+        def indexed(query):
+            request = Request(RequestFactory().get("/", {"search": query}))
+            results = search_filter.filter_queryset(request, queryset, None)
+            return list(results[:args.page_size]), results.count()
+
+        def baseline(query):
+            results = queryset
+            for token in query.split():
+                results = results.filter(Q(title__icontains=token) | Q(description__icontains=token))
+            return list(results[:args.page_size]), results.count()
+
+        rows = []
+        for query in QUERIES:
+            count = indexed(query)[1]
+            assert count == baseline(query)[1], query
+            rows.append((query, count, measure(lambda: indexed(query), args.repeat),
+                         measure(lambda: baseline(query), args.repeat)))
+        transaction.set_rollback(True)
+
+    print(f"page_size={args.page_size} repeat={args.repeat} (median ms, first page + count)")
+    print(f"{'query':<20}{'matches':>10}{'indexed':>10}{'icontains':>12}{'speedup':>10}")
+    for query, count, indexed_ms, baseline_ms in rows:
+        print(f"{query:<20}{count:>10}{indexed_ms:>10.2f}{baseline_ms:>12.2f}{baseline_ms / indexed_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+정원이 있는 수업 하나에 동시 신청이 몰릴 때 잔여석 예약 방식 비교
+- conditional: 조건부 UPDATE 한 번 (api.seats.reserve_seat, UPDATE ... WHERE remaining_seats > 0)
+- lock-and-check: SELECT ... FOR UPDATE 후 잔여석 확인, 감소 저장
+
+사용법 (DB는 현재 환경변수 설정을 사용하며 migrate 된 상태여야 함):
+    python benchmarks/bench_seats.py --buyers 300 --capacity 100
+
+구매자마다 스레드(별도 DB 연결) 하나로 동시에 시작하며, 각 구매는 잔여석 예약 + 신청 생성을 한 트랜잭션으로 처리합니다.
+측정용 수업/사용자는 커밋 후 사용하고 종료 시 삭제합니다.
+SQLite는 행 잠금이 없으므로 쓰기 트랜잭션을 BEGIN IMMEDIATE로 시작해 DB 단위로 직렬화합니다.
+(처리량은 DB 잠금 대기(busy timeout)에 좌우되므로 두 방식의 처리량 비교는 PostgreSQL에서 확인)
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--buyers", type=int, default=300)
+    parser.add_argument("--capacity", type=int, default=100)
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    from django.contrib.auth import get_user_model
+    from django.db import connection, transaction
+    from django.utils import timezone
+    from api.models import Course, CourseRegistration
+    from api.seats import reserve_seat
+
+    if connection.vendor == "sqlite":
+        connection.settings_dict.setdefault("OPTIONS", {})["transaction_mode"] = "IMMEDIATE"
+        connection.close()
+
+    def conditional(course_id, user):
+        with transaction.atomic():
+            if not reserve_seat(Course, course_id):
+                return False
+            CourseRegistration.objects.create(user=user, course_id=course_id)
+            return True
+
+    def lock_and_check(course_id, user):
+        with transaction.atomic():
+            course = Course.objects.select_for_update().get(pk=course_id)
+            if course.remaining_seats <= 0:
+                return False
+            course.remaining_seats -= 1
+            course.popularity += 1
+            course.save(update_fields=["remaining_seats", "popularity"])
+            CourseRegistration.objects.create(user=user, course_id=course_id)
+            return True
+
+    User = get_user_model()
+    now = timezone.now()
+    prefix = f"bench-seats-{os.getpid()}"
+    users = User.objects.bulk_create(
+        User(username=f"{prefix}-{i}", email=f"{prefix}-{i}@example.com") for i in range(args.buyers)
+    )
+    course = Course.objects.create(title=prefix, start_at=now - timedelta(days=1), end_at=now + timedelta(days=1),
+                                   capacity=args.capacity)
+    results = {}
+    try:
+        for name, buy in (("conditional", conditional), ("lock-and-check", lock_and_check)):
+            CourseRegistration.objects.filter(course=course).delete()
+            Course.objects.filter(pk=course.pk).update(remaining_seats=args.capacity, popularity=0)
+            barrier = threading.Barrier(args.buyers + 1)
+            latencies, outcomes, lock = [], [], threading.Lock()
+
+            def worker(user):
+                barrier.wait()
+                started = time.perf_counter()
+                try:
+                    outcome = "sold" if buy(course.pk, user) else "sold_out"
+                except Exception as e:
+                    outcome = type(e).__name__
+                finally:
+                    connection.close()
+                with lock:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    outcomes.append(outcome)
+
+            threads = [threading.Thread(target=worker, args=(user,)) for user in users]
+            for thread in threads:
+                thread.start()
+            barrier.wait()
+            started = time.perf_counter()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - started
+
+            course.refresh_from_db()
+            registered = CourseRegistration.objects.filter(course=course).count()
+            errors = len(outcomes) - outcomes.count("sold") - outcomes.count("sold_out")
+            assert outcomes.count("sold") == registered <= args.capacity, "oversold"
+            assert course.remaining_seats == args.capacity - registered
+            results[name] = (outcomes.count("sold"), outcomes.count("sold_out"), errors, args.buyers / elapsed,
+                             percentile(latencies, 50), percentile(latencies, 99))
+    finally:
+        CourseRegistration.objects.filter(course=course).delete()
+        course.delete()
+        User.objects.filter(username__startswith=prefix).delete()
+
+    print(f"{connection.vendor}: buyers={args.buyers} capacity={args.capacity}")
+    print(f"{'strategy':<16}{'sold':>6}{'sold_out':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, (sold, sold_out, errors, rps, p50, p99) in results.items():
+        print(f"{name:<16}{sold:>6}{sold_out:>10}{errors:>8}{rps:>10.0f}{p50:>10.2f}{p99:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+목록 응답 직렬화 비교: ModelSerializer vs ValuesSerializer(.values() 경로, api.values)
+
+사용법 (DB는 현재 환경변수 설정을 사용하며 migrate 된 상태여야 함):
+    python benchmarks/bench_values_serializer.py --page-size 100 --repeat 50
+
+트랜잭션 안에서 수업 --rows개를 만들어 측정한 뒤 롤백하므로 DB에 데이터가 남지 않습니다.
+각 경로의 쿼리 실행과 응답 데이터 생성 + JSON 렌더링 시간을 나누어 측정합니다.
+"""
+from __future__ import annotations
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    from django.db import transaction
+    from django.utils import timezone
+    from config.renderers import FastJSONRenderer
+    from api.models import Course
+    from api.serializers import CourseSerializer
+    from api.values import ValuesSerializer
+
+    renderer = FastJSONRenderer()
+    values_serializer = ValuesSerializer.for_serializer(CourseSerializer)
+
+    with transaction.atomic():
+        now = timezone.now()
+        Course.objects.bulk_create(
+            Course(title=f"수업 {i}", description="설명 " * 10, start_at=now + timedelta(hours=i),
+                   end_at=now + timedelta(hours=i + 2), popularity=i % 100, price=10000 + i)
+            for i in range(args.rows)
+        )
+        queryset = Course.objects.order_by("-created_at", "-id")
+
+        def model_query():
+            return list(queryset[:args.page_size])
+
+        def values_query():
+            return list(values_serializer.values(queryset)[:args.page_size])
+
+        instances, rows = model_query(), values_query()
+        assert (renderer.render(CourseSerializer(instances, many=True).data)
+                == renderer.render(values_serializer.to_representation(rows)))
+        results = {
+            "ModelSerializer": (
+                measure(model_query, args.repeat),
+                measure(lambda: renderer.render(CourseSerializer(instances, many=True).data), args.repeat),
+            ),
+            "values()": (
+                measure(values_query, args.repeat),
+                measure(lambda: renderer.render(values_serializer.to_representation(rows)), args.repeat),
+            ),
+        }
+        transaction.set_rollback(True)
+
+    print(f"page_size={args.page_size} repeat={args.repeat} (median ms)")
+    print(f"{'path':<20}{'query':>10}{'serialize':>12}{'total':>10}")
+    for name, (query_ms, serialize_ms) in results.items():
+        print(f"{name:<20}{query_ms:>10.2f}{serialize_ms:>12.2f}{query_ms + serialize_ms:>10.2f}")
+    model_ms, values_ms = (sum(results[name]) for name in ("ModelSerializer", "values()"))
+    serialize_speedup = results["ModelSerializer"][1] / results["values()"][1]
+    print(f"serialize speedup {serialize_speedup:.1f}x, total speedup {model_ms / values_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
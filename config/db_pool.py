@@ -0,0 +1,37 @@
+from __future__ import annotations
+import os
+from django.db import connections
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+def pool_stats() -> dict[str, dict]:
+    """
+    현재 워커 프로세스의 DB 연결 재사용 상태 (DB 별칭별)
+    - 커넥션 풀: psycopg_pool 통계(pool_size, pool_available, requests_waiting 등)
+    - 영구 연결: 현재 스레드의 연결 여부와 CONN_MAX_AGE
+    """
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, "pool", None)
+        if pool is not None:
+            stats[alias] = {"mode": "pool", **pool.get_stats()}
+        else:
+            stats[alias] = {
+                "mode": "persistent" if connection.settings_dict["CONN_MAX_AGE"] else "per_request",
+                "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+                "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+                "connected": connection.connection is not None,
+            }
+    return stats
+
+
+class DBPoolStatsView(APIView):
+    """워커 프로세스별 DB 연결 풀 통계 (관리자 전용)"""
+    permission_classes = [permissions.IsAdminUser]
+    throttle_classes = []
+
+    def get(self, request):
+        return Response({"pid": os.getpid(), "databases": pool_stats()})
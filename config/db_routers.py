@@ -0,0 +1,162 @@
+from __future__ import annotations
+import contextvars
+import logging
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import SimpleLazyObject
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+# 워커 프로세스마다 따로 저장되어 고정 정보를 공유할 수 없는 캐시 백엔드
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# 현재 처리 중인 요청 (ReplicaRoutingMiddleware가 설정)
+_current_request = contextvars.ContextVar("db_routing_request", default=None)
+
+
+def _pin_key(user_id) -> str:
+    return f"db_pin_primary:{user_id}"
+
+
+def _resolved_user(request):
+    """인증이 끝난 사용자만 반환 (세션 인증용 지연 객체는 평가하지 않음)"""
+    user = request.__dict__.get("user")
+    if user is None or isinstance(user, SimpleLazyObject):
+        return None
+    return user if user.is_authenticated else None
+
+
+def _pin_cache():
+    return caches[settings.REPLICA_PIN_CACHE]
+
+
+def check_pin_cache() -> None:
+    """
+    복제본 사용 시 고정 정보 캐시 확인
+    - 프로세스 로컬 캐시(LocMem)는 허용하되 경고 (같은 워커 프로세스의 읽기만 고정됨, 단일 프로세스/로컬 확인용)
+    """
+    if not getattr(settings, "REPLICA_DB_ALIAS", None):
+        return
+    alias = settings.REPLICA_PIN_CACHE
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend is None:
+        raise ImproperlyConfigured(f"REPLICA_PIN_CACHE '{alias}'가 CACHES에 없습니다.")
+    if backend in PROCESS_LOCAL_CACHES:
+        logger.warning(
+            "REPLICA_PIN_CACHE '%s'가 프로세스 로컬 캐시(%s)입니다. 다른 워커 프로세스에서는 쓰기 직후 읽기가 "
+            "복제본으로 갈 수 있으므로 여러 워커에서는 Redis(DJANGO_REDIS_URL)를 사용하세요.", alias, backend,
+        )
+
+
+def is_replica_view(request) -> bool:
+    """복제본에서 읽을 엔드포인트(REPLICA_READ_VIEWS의 URL name)인지"""
+    match = getattr(request, "resolver_match", None)
+    return match is not None and match.url_name in settings.REPLICA_READ_VIEWS
+
+
+def pin_to_primary(user_id) -> None:
+    """쓰기 직후 일정 시간 동안 해당 사용자의 읽기를 primary로 고정"""
+    _pin_cache().set(_pin_key(user_id), True, settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned(request) -> bool:
+    pinned = request.__dict__.get("_db_pinned")
+    if pinned is not None:
+        return pinned
+    user = _resolved_user(request)
+    if user is None:
+        # DRF 인증 전(사용자 조회 쿼리 등)에는 판단을 미룸
+        return False
+    pinned = bool(_pin_cache().get(_pin_key(user.pk)))
+    request._db_pinned = pinned
+    return pinned
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 복제본 라우터
+    - 요청 처리 중 REPLICA_READ_VIEWS(목록/추천 엔드포인트)에 대한 안전한 메서드(GET 등)의 읽기 쿼리는 REPLICA_DB_ALIAS로 전송
+    - 그 외 엔드포인트, 쓰기 요청 및 최근 쓰기를 한 사용자(read-your-writes 고정 기간)의 읽기는 primary(default)
+      (고정 정보 캐시는 복제본 대상 요청에서만 조회)
+    - 요청 밖(관리 명령, 테스트 등)이나 복제본 미설정 시에는 default
+    - DB 캐시(고정 정보 등)는 복제 지연과 무관하게 항상 primary에서 읽음
+    - 고정 정보 캐시가 프로세스 로컬이면 생성 시 경고
+    """
+
+    def __init__(self):
+        check_pin_cache()
+
+    def db_for_read(self, model, **hints):
+        alias = getattr(settings, "REPLICA_DB_ALIAS", None)
+        request = _current_request.get()
+        if not alias or request is None:
+            return None
+        if model._meta.app_label == "django_cache":
+            return "default"
+        if request.method not in SAFE_METHODS or not is_replica_view(request) or is_pinned(request):
+            return "default"
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return True
+
+
+def _written_user(request, response):
+    """성공한 쓰기 요청의 인증된 사용자 (읽기 고정 대상, 복제본 미설정 시 None)"""
+    if not getattr(settings, "REPLICA_DB_ALIAS", None):
+        return None
+    if request.method in SAFE_METHODS or response.status_code >= 400:
+        return None
+    return _resolved_user(request)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청을 라우터에 전달하고, 성공한 쓰기 요청 후 사용자의 읽기를 primary로 고정
+    - ASGI에서는 비동기로 동작 (contextvar는 sync_to_async 스레드로 복사되어 라우터에서도 보임)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _current_request.set(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_request.reset(token)
+
+        user = _written_user(request, response)
+        if user is not None:
+            pin_to_primary(user.pk)
+        return response
+
+    async def __acall__(self, request):
+        token = _current_request.set(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_request.reset(token)
+
+        user = _written_user(request, response)
+        if user is not None:
+            await sync_to_async(pin_to_primary)(user.pk)
+        return response
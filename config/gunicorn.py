@@ -0,0 +1,41 @@
+# gunicorn 설정 (gunicorn -c config/gunicorn.py config.wsgi:application)
+# - Prometheus 지표를 워커 간 합산하기 위해 PROMETHEUS_MULTIPROC_DIR을 워커 생성 전에 준비
+# - 조합 탐색 프로세스 풀은 워커 초기화 직후 생성 (첫 요청에서 워커 프로세스 기동 비용이 생기지 않도록)
+# - 스레드 워커(gthread): 동시 처리 제한(ConcurrencyLimitMiddleware)은 워커당 처리 중 요청 수로 세므로
+#   sync 워커(동시 1건)에서는 초과가 생기지 않음. 제한을 스레드 수보다 작게 두어 남는 스레드가 초과 요청에 바로 503 응답
+#   (전체 동시 처리 수 = 워커 수 × 워커당 제한)
+import os
+import shutil
+import tempfile
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "3"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+
+# 워커 프로세스가 상속하도록 Django 설정 전에 지정 (환경변수로 직접 지정한 값이 우선)
+os.environ.setdefault("DJANGO_MAX_IN_FLIGHT_REQUESTS", str(max(1, threads * 3 // 4)))
+# 처리 중 요청마다 DB 연결 1개 (커넥션 풀 사용 시 풀 크기를 워커당 제한에 맞춤)
+os.environ.setdefault("DJANGO_DB_POOL_MAX_SIZE", os.environ["DJANGO_MAX_IN_FLIGHT_REQUESTS"])
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "prometheus_multiproc"))
+
+
+def on_starting(server):
+    # 이전 실행의 지표 파일 정리
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    # 종료된 워커의 live gauge(처리 중인 요청 수 등) 제거
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    from api.viewsets import combination_pool
+
+    combination_pool.start()
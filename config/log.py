@@ -0,0 +1,149 @@
+from __future__ import annotations
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+
+# LogRecord 기본 속성 (JSON 출력 시 extra로 전달된 필드만 골라내기 위함)
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class _QueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # 큐가 가득 찬 상태에서도 종료 신호가 유실되지 않도록 리스너가 비울 때까지 대기
+        self.queue.put(self._sentinel)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    요청 스레드에서는 큐에 넣기만 하고, 포맷/파일 쓰기는 별도 리스너 스레드에서 수행하는 핸들러
+    - 큐가 가득 차면 INFO 이하는 기다리지 않고 버린 뒤 dropped 카운트와 log_records_dropped 지표 증가
+    - WARNING 이상은 버리지 않음 (full_timeout초 동안 기다린 뒤에도 가득 차 있으면 호출 스레드에서 직접 기록)
+    - 메시지(msg % args)는 호출 스레드에서 만들어 전달 (이후 args 변경/모델 __str__의 DB 조회가 리스너에서 일어나지 않도록)
+    - filename/console: 리스너가 기록할 대상 (handlers로 직접 지정 가능)
+    """
+
+    def __init__(self, filename: str | None = None, console: bool = True, queue_size: int = 10000,
+                 handlers: list[logging.Handler] | None = None, full_timeout: float = 0.1):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.dropped = 0
+        self.full_timeout = full_timeout
+        if handlers is None:
+            handlers = []
+            if console:
+                handlers.append(logging.StreamHandler())
+            if filename:
+                os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+                handlers.append(logging.FileHandler(filename, delay=True))
+        self.targets = handlers
+        self.listener = None
+        self.closed = False
+        self.start()
+        atexit.register(self.stop)
+        # fork 된 자식 프로세스(gunicorn 워커 등)에는 리스너 스레드가 없으므로 다시 시작
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._restart_after_fork)
+
+    def setFormatter(self, fmt):
+        # 포맷은 리스너 스레드의 대상 핸들러에서 수행
+        for handler in self.targets:
+            handler.setFormatter(fmt)
+
+    def start(self) -> None:
+        if self.listener is None:
+            self.listener = _QueueListener(self.queue, *self.targets, respect_handler_level=True)
+            self.listener.start()
+
+    def stop(self) -> None:
+        """남은 로그를 모두 기록한 뒤 리스너 종료"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def _restart_after_fork(self) -> None:
+        if self.closed:
+            return
+        self.listener = None
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self.start()
+
+    def prepare(self, record):
+        # QueueHandler 기본 구현처럼 메시지는 호출 스레드에서 만들고 args 제거, 포맷터 적용(레이아웃)만 리스너에서 수행
+        # 예외 정보(traceback)는 미리 문자열로 변환하여 프레임 참조를 오래 잡지 않도록 함
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if record.levelno >= logging.WARNING:
+            try:
+                self.queue.put(record, timeout=self.full_timeout)
+            except queue.Full:
+                # 리스너가 밀려 있어도 경고/오류는 유실하지 않도록 호출 스레드에서 직접 기록
+                listener = self.listener
+                if listener is not None:
+                    listener.handle(record)
+                    return
+            else:
+                return
+        self.dropped += 1
+        from .metrics import LOG_RECORDS_DROPPED
+
+        LOG_RECORDS_DROPPED.inc()
+
+    def close(self):
+        self.closed = True
+        self.stop()
+        super().close()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    INFO 이하 로그를 rate 비율로만 통과 (WARNING 이상은 항상 통과)
+    - names: 샘플링할 로거 이름 접두사 (비어 있으면 전체)
+    """
+
+    def __init__(self, rate: float = 1.0, names: tuple[str, ...] | list[str] = ()):
+        super().__init__()
+        self.rate = rate
+        self.names = tuple(names)
+
+    def filter(self, record) -> bool:
+        if record.levelno > logging.INFO or self.rate >= 1.0:
+            return True
+        if self.names and not record.name.startswith(self.names):
+            return True
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (extra로 전달된 필드 포함)"""
+
+    def format(self, record) -> str:
+        data = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.thread,
+        }
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
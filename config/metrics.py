@@ -0,0 +1,195 @@
+from __future__ import annotations
+import hmac
+import os
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from .db_pool import pool_stats
+
+# gunicorn 등 다중 워커 환경에서는 PROMETHEUS_MULTIPROC_DIR(워커 공용 디렉터리)에
+# 프로세스별 mmap 파일로 기록하고, /metrics 조회 시 전체 워커 값을 합산 (config/gunicorn.py 참고)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간",
+    ["view", "action", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter(
+    "http_requests", "요청 수 (상태 코드별)",
+    ["view", "action", "method", "status"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "요청당 SQL 쿼리 수",
+    ["view", "action"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_duration_seconds", "요청당 DB 시간",
+    ["view", "action"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "처리 중인 요청 수 (URL name별)",
+    ["view"],
+    multiprocess_mode="livesum",
+)
+
+REGISTRATIONS = Counter("registrations", "신청 수", ["kind", "source"])
+PAYMENTS = Counter("payments", "결제 수", ["kind"])
+PAYMENT_CANCELLATIONS = Counter("payment_cancellations", "결제 취소 수", ["kind"])
+REGISTRATIONS_AUTO_COMPLETED = Counter(
+    "registrations_auto_completed", "종료 시각이 지나 자동 완료된 신청 수 (complete_expired_registrations)", ["kind"],
+)
+COMBINATION_SEARCH_SIZE = Histogram(
+    "combination_search_activities", "조합 탐색 요청의 액티비티 수",
+    ["mode"],
+    buckets=(1, 2, 4, 8, 12, 16, 20, 24, 32),
+)
+COMBINATION_SEARCH_RESULTS = Histogram(
+    "combination_search_results", "조합 탐색 결과 수",
+    ["mode"],
+    buckets=(1, 10, 100, 1_000, 10_000, 100_000, 1_000_000),
+)
+LOG_RECORDS_DROPPED = Counter("log_records_dropped", "로그 큐가 가득 차 버린 로그 수 (INFO 이하, config.log)")
+
+DB_POOL = Gauge(
+    "db_pool_connections", "워커별 DB 연결 풀 상태",
+    ["alias", "stat"],
+    multiprocess_mode="liveall",
+)
+DB_POOL_REFRESH_SECONDS = 5.0
+
+
+def record_registration(kind: str, source: str = "single") -> None:
+    """신청/결제 카운터 (트랜잭션 커밋 후 반영)"""
+    def inc():
+        REGISTRATIONS.labels(kind, source).inc()
+        PAYMENTS.labels(kind).inc()
+    transaction.on_commit(inc)
+
+
+def record_cancellation(kind: str, count: int = 1) -> None:
+    transaction.on_commit(lambda: PAYMENT_CANCELLATIONS.labels(kind).inc(count))
+
+
+def record_auto_completed(kind: str, count: int) -> None:
+    if count:
+        REGISTRATIONS_AUTO_COMPLETED.labels(kind).inc(count)
+
+
+def record_combination_search(activities: int, results: int, mode: str) -> None:
+    COMBINATION_SEARCH_SIZE.labels(mode).observe(activities)
+    COMBINATION_SEARCH_RESULTS.labels(mode).observe(results)
+
+
+def view_labels(view_func, method: str) -> tuple[str, str]:
+    """DRF 뷰셋은 (클래스명, action), 그 외 뷰는 (클래스명/함수명, "")"""
+    cls = getattr(view_func, "cls", None)
+    name = cls.__name__ if cls is not None else getattr(view_func, "__name__", "unknown")
+    actions = getattr(view_func, "actions", None) or {}
+    return name, actions.get(method.lower(), "")
+
+
+class MetricsMiddleware:
+    """
+    요청별 처리 시간/상태 코드/DB 쿼리 수·시간 및 처리 중인 요청 수 기록
+    - DB 통계는 QueryInstrumentationMiddleware가 남긴 request.sql_stats 사용
+    - URL에 매칭되지 않은 요청은 view="unresolved"로 묶어 레이블 수 제한
+    - 처리 중인 요청 수는 URL 확인 후(process_view) URL name 레이블로 증가, 응답 후 감소
+    - ASGI에서는 비동기로 동작 (지표 기록은 메모리/mmap 갱신뿐이라 이벤트 루프에서 직접 수행)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.pool_refreshed_at = 0.0
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            self.leave(request)
+        self.observe(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.leave(request)
+        self.observe(request, response, time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def leave(request) -> None:
+        gauge = request.__dict__.pop("metrics_in_flight", None)
+        if gauge is not None:
+            gauge.dec()
+
+    def observe(self, request, response, duration: float) -> None:
+        view, action = getattr(request, "metrics_view", ("unresolved", ""))
+        REQUEST_LATENCY.labels(view, action, request.method).observe(duration)
+        REQUESTS.labels(view, action, request.method, str(response.status_code)).inc()
+        stats = getattr(request, "sql_stats", None)
+        if stats is not None:
+            REQUEST_DB_QUERIES.labels(view, action).observe(stats.count)
+            REQUEST_DB_TIME.labels(view, action).observe(stats.duration)
+        self.refresh_pool_stats()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.metrics_view = view_labels(view_func, request.method)
+        match = request.resolver_match
+        gauge = IN_FLIGHT.labels(match.view_name if match and match.view_name else "unresolved")
+        gauge.inc()
+        request.metrics_in_flight = gauge
+        return None
+
+    def refresh_pool_stats(self) -> None:
+        # 워커별 풀 상태는 일정 주기로만 갱신
+        now = time.monotonic()
+        if now - self.pool_refreshed_at < DB_POOL_REFRESH_SECONDS:
+            return
+        self.pool_refreshed_at = now
+        for alias, stats in pool_stats().items():
+            for stat, value in stats.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    DB_POOL.labels(alias, stat).set(value)
+
+
+def metrics_allowed(request) -> bool:
+    """METRICS_TOKEN 설정 시 Authorization: Bearer <token>, 미설정 시 METRICS_ALLOWED_IPS에서 온 요청만 허용"""
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token:
+        return hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}")
+    return request.META.get("REMOTE_ADDR") in getattr(settings, "METRICS_ALLOWED_IPS", ())
+
+
+def metrics_view(request):
+    """Prometheus 텍스트 형식 (다중 워커 환경에서는 전체 워커 합산)"""
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
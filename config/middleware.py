@@ -0,0 +1,178 @@
+from __future__ import annotations
+import logging
+import threading
+import time
+from contextlib import ExitStack
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import JsonResponse
+
+sql_logger = logging.getLogger("api.sql")
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    워커 프로세스의 동시 처리 요청 수를 제한하는 부하 차단(load shedding) 미들웨어
+    - 처리 중 요청이 MAX_IN_FLIGHT_REQUESTS를 넘으면 대기열에 쌓지 않고 즉시 503 + Retry-After 응답
+    - 스레드 워커(gthread)/ASGI처럼 한 프로세스가 여러 요청을 동시에 처리할 때 의미가 있음
+    - 0이면 비활성화
+    - ASGI에서는 비동기로 동작 (슬롯 획득이 non-blocking이므로 이벤트 루프를 막지 않음)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.limit = getattr(settings, "MAX_IN_FLIGHT_REQUESTS", 0)
+        self.retry_after = getattr(settings, "LOAD_SHED_RETRY_AFTER", 1)
+        self._slots = threading.BoundedSemaphore(self.limit) if self.limit > 0 else None
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if self._slots is None:
+            return self.get_response(request)
+
+        if not self._slots.acquire(blocking=False):
+            return self.busy_response()
+        try:
+            return self.get_response(request)
+        finally:
+            self._slots.release()
+
+    async def __acall__(self, request):
+        if self._slots is None:
+            return await self.get_response(request)
+
+        if not self._slots.acquire(blocking=False):
+            return self.busy_response()
+        try:
+            return await self.get_response(request)
+        finally:
+            self._slots.release()
+
+    def busy_response(self) -> JsonResponse:
+        response = JsonResponse(
+            {"detail": "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.", "code": "server_busy"},
+            status=503,
+        )
+        response["Retry-After"] = str(self.retry_after)
+        return response
+
+
+class QueryStats:
+    """요청 단위 SQL 실행 통계 (connection.execute_wrapper로 등록)"""
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        # 파라미터를 제외한 SQL 문장별 실행 횟수 (N+1 탐지용)
+        self.statements: dict[str, int] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] = self.statements.get(sql, 0) + 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(sql, n) for sql, n in self.statements.items() if n >= threshold]
+
+
+class QueryInstrumentationMiddleware:
+    """
+    요청별 SQL 쿼리 수/DB 시간을 집계하여 요청당 한 줄의 요약 로그(api.sql) 기록
+    - 뷰별 쿼리 예산(뷰 클래스의 query_budget > SQL_QUERY_BUDGETS[url name] > SQL_QUERY_BUDGET_DEFAULT) 초과 시 WARNING
+    - 같은 SQL이 SQL_REPEAT_THRESHOLD회 이상 반복되면 N+1 의심으로 WARNING
+    - 집계 결과는 request.sql_stats로 다른 미들웨어/뷰에서 사용 가능
+    - ASGI에서는 요청의 동기 스레드(sync_to_async, 비동기 ORM이 쿼리를 실행하는 스레드)의 연결에 등록
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "SQL_INSTRUMENTATION_ENABLED", True):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.default_budget = getattr(settings, "SQL_QUERY_BUDGET_DEFAULT", 20)
+        self.budgets = getattr(settings, "SQL_QUERY_BUDGETS", {})
+        self.repeat_threshold = getattr(settings, "SQL_REPEAT_THRESHOLD", 5)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = request.sql_stats = QueryStats()
+        started = time.perf_counter()
+        with self.instrument(stats):
+            response = self.get_response(request)
+        self.report(request, response, stats, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        stats = request.sql_stats = QueryStats()
+        started = time.perf_counter()
+        # 연결 객체는 스레드별이므로 등록/해제 모두 요청의 동기 스레드에서 수행
+        stack = await sync_to_async(self.instrument)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        self.report(request, response, stats, time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def instrument(stats: QueryStats) -> ExitStack:
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        return stack
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # DRF 뷰셋은 as_view() 결과의 cls 속성으로 클래스 접근
+        request.sql_query_budget = getattr(getattr(view_func, "cls", None), "query_budget", None)
+        return None
+
+    def get_budget(self, request, view_name: str) -> int:
+        budget = getattr(request, "sql_query_budget", None)
+        if budget is None:
+            budget = self.budgets.get(view_name, self.default_budget)
+        return budget
+
+    def report(self, request, response, stats: QueryStats, duration: float) -> None:
+        match = request.resolver_match
+        view_name = match.view_name if match else "unresolved"
+        budget = self.get_budget(request, view_name)
+        repeated = stats.repeated(self.repeat_threshold)
+        over_budget = stats.count > budget
+
+        summary = {
+            "view": view_name,
+            "method": request.method,
+            "status": response.status_code,
+            "queries": stats.count,
+            "db_ms": round(stats.duration * 1000, 2),
+            "total_ms": round(duration * 1000, 2),
+            "budget": budget,
+            "over_budget": over_budget,
+            "repeated": [{"sql": sql[:200], "count": n} for sql, n in repeated],
+        }
+        level = logging.WARNING if over_budget or repeated else logging.INFO
+        if not sql_logger.isEnabledFor(level):
+            return
+        sql_logger.log(
+            level,
+            "sql view=%s method=%s status=%s queries=%d db_ms=%.2f total_ms=%.2f budget=%d over_budget=%s repeated=%d",
+            view_name, request.method, response.status_code, stats.count, summary["db_ms"],
+            summary["total_ms"], budget, over_budget, len(repeated),
+            extra={"sql_summary": summary},
+        )
@@ -1,4 +1,6 @@
 from __future__ import annotations
+from django.core.paginator import InvalidPage
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 
 
@@ -8,3 +10,28 @@ class DefaultPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class AsyncPageNumberPagination(DefaultPagination):
+    """
+    비동기 뷰용 페이지네이션 (DefaultPagination과 동일한 파라미터/응답 포맷)
+    - count와 페이지 조회를 Django async ORM(acount, async for)으로 수행
+    """
+
+    async def apaginate_queryset(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count(cached_property)를 미리 채워 동기 count 쿼리를 막음
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+        self.page.object_list = [obj async for obj in self.page.object_list]
+        return self.page.object_list
+
+    def get_paginated_data(self, data) -> dict:
+        return self.get_paginated_response(data).data
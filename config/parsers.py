@@ -1,27 +1,62 @@
 from __future__ import annotations
-import json
-from typing import Any
-from rest_framework.parsers import JSONParser
 from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils import json
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 모듈 사용
+    orjson = None
+
 
+class PayloadTooLarge(APIException):
+    """요청 본문 크기 초과 예외"""
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "요청 본문이 너무 큽니다."
+    default_code = "payload_too_large"
 
-class TextPlainJSONParser(JSONParser):
+
+class FastJSONParser(JSONParser):
     """
-    text/plain Content-Type으로 전송된 JSON 데이터를 파싱하는 파서
+    본문 크기 제한(MAX_JSON_BODY_SIZE)을 먼저 확인한 뒤 bytes에서 바로 파싱하는 JSON 파서
+    - Content-Length가 제한을 넘으면 본문을 읽지 않고 413
+    - Content-Length가 없는 경우에도 제한 + 1 바이트까지만 읽음
+    - 잘못된 JSON/인코딩은 ParseError(400)
     """
-    media_type = 'text/plain'
-    
+
     def parse(self, stream, media_type=None, parser_context=None):
-        """
-        text/plain으로 전송된 JSON 데이터를 파싱
-        """
+        parser_context = parser_context or {}
+        max_size = settings.MAX_JSON_BODY_SIZE
+        request = parser_context.get("request")
+        if request is not None:
+            try:
+                content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                content_length = 0
+            if content_length > max_size:
+                raise PayloadTooLarge()
+
+        data = stream.read(max_size + 1)
+        if len(data) > max_size:
+            raise PayloadTooLarge()
+
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
         try:
-            # 스트림에서 데이터 읽기
-            data = stream.read().decode('utf-8')
-            # JSON 파싱
-            return json.loads(data)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"잘못된 JSON 형식입니다: {e}")
-        except UnicodeDecodeError as e:
-            raise ValueError(f"인코딩 오류입니다: {e}")
+            if encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+                data = data.decode(encoding)
+            if orjson is not None and self.strict:
+                return orjson.loads(data)
+            parse_constant = json.strict_constant if self.strict else None
+            return json.loads(data, parse_constant=parse_constant)
+        except (ValueError, LookupError) as exc:
+            # orjson.JSONDecodeError, UnicodeDecodeError는 ValueError의 하위 클래스
+            raise ParseError("JSON parse error - %s" % str(exc))
 
+
+class TextPlainJSONParser(FastJSONParser):
+    """
+    text/plain Content-Type으로 전송된 JSON 데이터를 파싱하는 파서
+    """
+    media_type = 'text/plain'
@@ -0,0 +1,136 @@
+from __future__ import annotations
+import cProfile
+import io
+import logging
+import pstats
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from rest_framework import permissions
+from rest_framework.views import APIView
+
+logger = logging.getLogger("api.profiling")
+
+REQUEST_ID_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def get_request_id(request) -> str:
+    """X-Request-ID 헤더(파일 이름에 안전한 문자만 사용) 또는 새 ID"""
+    request_id = REQUEST_ID_RE.sub("", request.headers.get("X-Request-ID", ""))[:64]
+    return request_id or uuid.uuid4().hex
+
+
+class ProfileStore:
+    """
+    프로파일 결과를 디렉터리에 최대 max_files개까지 보관 (가장 오래된 파일부터 삭제)
+    - 파일 이름: <시각>-<request id>.prof (python -m pstats <파일> 로 확인)
+    """
+
+    def __init__(self, directory: str | Path, max_files: int):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def save(self, request_id: str, profiler: cProfile.Profile) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{time.time_ns()}-{request_id}.prof"
+        profiler.dump_stats(path)
+        with self._lock:
+            files = sorted(self.directory.glob("*.prof"))
+            for old in files[:max(0, len(files) - self.max_files)]:
+                old.unlink(missing_ok=True)
+        return path
+
+    def find(self, request_id: str) -> Path | None:
+        matches = sorted(self.directory.glob(f"*-{REQUEST_ID_RE.sub('', request_id)}.prof"))
+        return matches[-1] if matches else None
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+
+class ProfilingMixin:
+    """
+    관리자(is_staff) 요청에 한해 X-Profile: 1 헤더 또는 ?profile=1 이 있으면 뷰 처리~응답 렌더링을 cProfile로 측정
+    - 결과는 profile_store에 요청 ID(X-Request-ID)로 저장하고 X-Profile-Id 헤더로 반환
+    - Server-Timing 헤더: db(SQL 시간), serialize(뷰 처리 중 DB 외 시간, 직렬화 포함), render(JSON 렌더링)
+    """
+
+    def profiling_requested(self, request) -> bool:
+        if not settings.PROFILING_ENABLED or not request.user.is_staff:
+            return False
+        return request.headers.get("X-Profile") == "1" or request.query_params.get("profile") == "1"
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._profiler = None
+        if not self.profiling_requested(request):
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 프로파일러가 이미 동작 중이면 측정하지 않음
+            return
+        self._profiler = profiler
+        self._sql_stats = getattr(request._request, "sql_stats", None)
+        self._db_started = self._sql_stats.duration if self._sql_stats else 0.0
+        self._view_started = time.perf_counter()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "_profiler", None) is None:
+            return response
+
+        view_duration = time.perf_counter() - self._view_started
+        db_duration = (self._sql_stats.duration - self._db_started) if self._sql_stats else None
+        profiler, self._profiler = self._profiler, None
+        request_id = get_request_id(request)
+        render_started = time.perf_counter()
+
+        def on_rendered(rendered):
+            profiler.disable()
+            timings = []
+            if db_duration is not None:
+                timings.append(("db", db_duration))
+                timings.append(("serialize", view_duration - db_duration))
+            else:
+                timings.append(("serialize", view_duration))
+            timings.append(("render", time.perf_counter() - render_started))
+            rendered["Server-Timing"] = ", ".join(f"{name};dur={duration * 1000:.2f}" for name, duration in timings)
+            try:
+                profile_store.save(request_id, profiler)
+                rendered["X-Profile-Id"] = request_id
+            except OSError as e:
+                logger.warning("프로파일 저장 실패: request_id=%s, error=%s", request_id, e)
+
+        response.add_post_render_callback(on_rendered)
+        return response
+
+    def handle_exception(self, exc):
+        try:
+            return super().handle_exception(exc)
+        except Exception:
+            # 처리되지 않은 예외로 finalize_response가 호출되지 않는 경우 프로파일러 정리
+            if getattr(self, "_profiler", None) is not None:
+                self._profiler.disable()
+                self._profiler = None
+            raise
+
+
+class ProfileView(APIView):
+    """저장된 프로파일 요약 (누적 시간 상위 함수, 관리자 전용)"""
+    permission_classes = [permissions.IsAdminUser]
+    throttle_classes = []
+
+    def get(self, request, request_id: str):
+        path = profile_store.find(request_id)
+        if path is None:
+            raise Http404()
+        out = io.StringIO()
+        pstats.Stats(str(path), stream=out).sort_stats("cumulative").print_stats(40)
+        return HttpResponse(out.getvalue(), content_type="text/plain; charset=utf-8")
@@ -0,0 +1,59 @@
+from __future__ import annotations
+import math
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 DRF 기본 렌더러로 동작
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+# orjson은 U+2028/U+2029를 UTF-8 그대로 출력하므로 DRF와 같이 이스케이프
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+def has_non_finite(obj) -> bool:
+    """NaN/Infinity 포함 여부 (dict/list/tuple만 탐색)"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(has_non_finite(value) for value in obj)
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러 (DRF JSONRenderer와 같은 JSON 값)
+    - compact 출력, UTF-8, UTC 시각은 "Z" 접미사, \\u2028/\\u2029 이스케이프
+    - 실수 표기는 다를 수 있음 (예: 1e16 vs DRF 1e+16, 파싱한 값은 같음)
+    - NaN/Infinity는 DRF(STRICT_JSON)와 같이 ValueError (orjson은 null로 출력하므로 null이 있을 때만 검사)
+    - orjson이 직접 처리하지 못하는 타입(Decimal, 지연 번역 문자열 등)은 DRF JSONEncoder 규칙 사용
+    - indent 요청, UNICODE_JSON/COMPACT_JSON/STRICT_JSON 비활성화, orjson 미설치 또는
+      orjson이 처리할 수 없는 값(64비트 초과 정수 등)은 DRF 기본 구현으로 처리
+    """
+    default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"null" in ret and has_non_finite(data):
+            raise ValueError("Out of range float values are not JSON compliant")
+        if b"\xe2\x80" in ret:
+            ret = ret.replace(LINE_SEPARATOR, b"\\u2028").replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+        return ret
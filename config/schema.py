@@ -0,0 +1,106 @@
+from __future__ import annotations
+import functools
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+
+# drf_yasg는 스키마를 실제로 생성할 때만 import (워커 시작 시간 단축)
+logger = logging.getLogger(__name__)
+
+SCHEMA_FILES = {
+    ".json": ("swagger.json", "application/json; charset=utf-8"),
+    ".yaml": ("swagger.yaml", "application/yaml; charset=utf-8"),
+}
+
+
+def get_api_info():
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="Exam/Course API",
+        default_version="v1",
+        description="시험/수업 신청 및 결제 API",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_dynamic_schema_view():
+    """요청마다 스키마를 생성하는 drf_yasg 뷰 (SCHEMA_MODE=dynamic)"""
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+
+    schema_view = get_schema_view(get_api_info(), public=True, permission_classes=[permissions.AllowAny])
+    return schema_view.without_ui(cache_timeout=0)
+
+
+def generate_schema(format: str) -> bytes:
+    """전체 API 스키마를 JSON(.json) 또는 YAML(.yaml) 바이트로 생성"""
+    from django.contrib.auth.models import AnonymousUser
+    from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+    from drf_yasg.generators import OpenAPISchemaGenerator
+    from rest_framework.test import APIRequestFactory
+    from rest_framework.views import APIView
+
+    # 뷰의 get_queryset 등이 request를 참조하므로 요청 시와 같은 형태의 가짜 요청으로 생성
+    request = APIView().initialize_request(APIRequestFactory().get(f"/swagger{format}"))
+    request.user = AnonymousUser()
+    # url="" : host/scheme를 넣지 않아 스키마를 제공하는 서버 기준으로 해석 (SCHEMA_URL로 지정 가능)
+    generator = OpenAPISchemaGenerator(get_api_info(), url=settings.SCHEMA_URL)
+    schema = generator.get_schema(request=request, public=True)
+    codec = OpenAPICodecJson if format == ".json" else OpenAPICodecYaml
+    return codec(validators=[]).encode(schema)
+
+
+class PrebuiltSchema:
+    """
+    generate_schema 명령으로 미리 만든 스키마 파일을 메모리에 올려 ETag와 함께 제공
+    - 파일이 없으면 첫 요청 때 한 번 생성하여 재사용 (경고 로그)
+    """
+
+    def __init__(self):
+        self._cache: dict[str, tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, format: str) -> tuple[bytes, str]:
+        cached = self._cache.get(format)
+        if cached is None:
+            with self._lock:
+                cached = self._cache.get(format)
+                if cached is None:
+                    cached = self._cache[format] = self.load(format)
+        return cached
+
+    def load(self, format: str) -> tuple[bytes, str]:
+        path = Path(settings.SCHEMA_DIR) / SCHEMA_FILES[format][0]
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            logger.warning("미리 생성된 스키마 파일이 없어 실행 중 생성합니다: %s (python manage.py generate_schema)", path)
+            content = generate_schema(format)
+        return content, '"%s"' % hashlib.sha256(content).hexdigest()[:32]
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+prebuilt_schema = PrebuiltSchema()
+
+
+def schema_file_view(request, format: str):
+    """/swagger.json, /swagger.yaml"""
+    if settings.SCHEMA_MODE == "dynamic":
+        return get_dynamic_schema_view()(request, format=format)
+    if request.method not in ("GET", "HEAD") or format not in SCHEMA_FILES:
+        raise Http404()
+
+    content, etag = prebuilt_schema.get(format)
+    if etag in request.headers.get("If-None-Match", ""):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type=SCHEMA_FILES[format][1])
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={settings.SCHEMA_CACHE_SECONDS}"
+    return response
@@ -24,6 +24,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 요청별 처리 시간/상태 코드/DB 쿼리 지표 (Prometheus, /metrics)
+    "config.metrics.MetricsMiddleware",
+    # 동시 처리 요청 수 초과 시 503으로 즉시 차단
+    "config.middleware.ConcurrencyLimitMiddleware",
+    # 읽기 전용 복제본 라우팅 (config.db_routers.ReplicaRouter)
+    "config.db_routers.ReplicaRoutingMiddleware",
+    # 요청별 SQL 쿼리 수/DB 시간 요약 로그 (api.sql)
+    "config.middleware.QueryInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -47,8 +55,83 @@ DATABASES = {
         }
     }
 
+# DB 연결 재사용
+# - DJANGO_DB_POOL=true (PostgreSQL + psycopg 3): 워커 프로세스별 커넥션 풀, 대여 시 상태 점검
+# - 그 외: 영구 연결(CONN_MAX_AGE초 동안 재사용) + 재사용 전 상태 점검(CONN_HEALTH_CHECKS)
+DB_POOL_ENABLED = os.getenv("DJANGO_DB_POOL", "false").lower() == "true"
+DB_POOL_OPTIONS = {
+    "min_size": int(os.getenv("DJANGO_DB_POOL_MIN_SIZE", "2")),
+    "max_size": int(os.getenv("DJANGO_DB_POOL_MAX_SIZE", "10")),
+    "timeout": float(os.getenv("DJANGO_DB_POOL_TIMEOUT", "10")),
+    "max_idle": float(os.getenv("DJANGO_DB_POOL_MAX_IDLE", "300")),
+}
+
+
+def connection_reuse_settings(engine: str) -> dict:
+    """DATABASES 항목별 연결 재사용 설정"""
+    if DB_POOL_ENABLED and engine == "django.db.backends.postgresql":
+        # 풀 사용 시 CONN_MAX_AGE는 0이어야 함 (연결 수명은 풀이 관리)
+        return {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": True, "OPTIONS": {"pool": dict(DB_POOL_OPTIONS)}}
+    return {
+        "CONN_MAX_AGE": int(os.getenv("DJANGO_DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": os.getenv("DJANGO_DB_CONN_HEALTH_CHECKS", "true").lower() == "true",
+    }
+
+
+DATABASES["default"].update(connection_reuse_settings(DATABASES["default"]["ENGINE"]))
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    # 쓰기 트랜잭션이 시작 시점에 잠금을 잡도록(IMMEDIATE) 하여 동시 쓰기가 잠금 해제를 기다린 뒤 순서대로 처리되도록
+    # (기본 DEFERRED는 읽기 후 쓰기 잠금으로 올릴 때 기다리지 않고 database is locked 오류)
+    DATABASES["default"]["OPTIONS"] = {"transaction_mode": "IMMEDIATE", "timeout": 20}
+    # 테스트 DB를 파일로 지정하면 스레드별 연결을 쓰는 동시성 테스트도 실행 (기본: 공유 메모리 DB, run_tests.sh 참고)
+    if os.getenv("DJANGO_DB_TEST_NAME"):
+        DATABASES["default"]["TEST"] = {"NAME": os.getenv("DJANGO_DB_TEST_NAME")}
+
+# 읽기 전용 복제본 (DJANGO_DB_REPLICA_NAME 지정 시 활성화, 나머지 접속 정보는 기본값으로 primary 설정 사용)
+if os.getenv("DJANGO_DB_REPLICA_NAME"):
+    DATABASES["replica"] = {
+        "ENGINE": os.getenv("DJANGO_DB_REPLICA_ENGINE", DATABASES["default"]["ENGINE"]),
+        "NAME": os.getenv("DJANGO_DB_REPLICA_NAME"),
+        "USER": os.getenv("DJANGO_DB_REPLICA_USER", DATABASES["default"]["USER"]),
+        "PASSWORD": os.getenv("DJANGO_DB_REPLICA_PASSWORD", DATABASES["default"]["PASSWORD"]),
+        "HOST": os.getenv("DJANGO_DB_REPLICA_HOST", DATABASES["default"]["HOST"]),
+        "PORT": os.getenv("DJANGO_DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+    }
+    DATABASES["replica"].update(connection_reuse_settings(DATABASES["replica"]["ENGINE"]))
+    REPLICA_DB_ALIAS = "replica"
+else:
+    REPLICA_DB_ALIAS = None
+DATABASE_ROUTERS = ["config.db_routers.ReplicaRouter"]
+# 쓰기 후 해당 사용자의 읽기를 primary로 고정하는 시간(초)
+REPLICA_PIN_SECONDS = int(os.getenv("DJANGO_DB_REPLICA_PIN_SECONDS", "5"))
+# 고정 정보를 저장하는 캐시 별칭 (여러 워커에서는 Redis 등 공유 캐시 필요, 프로세스 로컬 캐시면 시작 시 경고)
+REPLICA_PIN_CACHE = os.getenv("DJANGO_DB_REPLICA_PIN_CACHE", "shared")
+# 복제본에서 읽는 엔드포인트 (URL name, 쉼표 구분), 그 외 요청은 GET도 primary
+REPLICA_READ_VIEWS = frozenset(filter(None, os.getenv(
+    "DJANGO_DB_REPLICA_READ_VIEWS",
+    "tests-list,courses-list,activities,recommend_course,me_payments,"
+    "async_tests,async_courses,async_recommend_course,async_me_payments",
+).split(",")))
+
 AUTH_USER_MODEL = "api.User"
 
+# 로컬 메모리 캐시 (로그인 시도 제한 등)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "default",
+    },
+    # 워커/서버 간 공유 캐시 (read-your-writes 고정 등)
+    # DJANGO_REDIS_URL 지정 시 Redis(redis 패키지 필요), 그 외 로컬 메모리 (워커 프로세스별, 요청마다 DB 조회가 생기지 않도록)
+    "shared": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("DJANGO_REDIS_URL"),
+    } if os.getenv("DJANGO_REDIS_URL") else {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "shared",
+    },
+}
+
 LANGUAGE_CODE = "ko-kr"
 TIME_ZONE = "Asia/Seoul"
 USE_I18N = True
@@ -59,7 +142,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 토큰 → 사용자 조회 결과를 캐시 (기본 구현: rest_framework_simplejwt.authentication.JWTAuthentication)
+        "api.jwt_auth.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -70,13 +154,28 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
     ],
     # Browsable API 비활성화, JSON 전용
+    # orjson 기반 렌더러/파서 (DRF 기본 구현과 같은 출력, 본문 크기 제한: MAX_JSON_BODY_SIZE)
     "DEFAULT_RENDERER_CLASSES": (
-        "rest_framework.renderers.JSONRenderer",
+        "config.renderers.FastJSONRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
-        "rest_framework.parsers.JSONParser",
+        "config.parsers.FastJSONParser",
         "config.parsers.TextPlainJSONParser",
     ),
+    # 사용자 × 엔드포인트 단위 비용 가중 토큰 버킷 (뷰의 throttle_scope / throttle_cost 사용)
+    "DEFAULT_THROTTLE_CLASSES": (
+        "config.throttling.TokenBucketThrottle",
+    ),
+    "DEFAULT_THROTTLE_RATES": {
+        # 로그인 시도 제한 (api.authentication.LoginIPRateThrottle / LoginEmailRateThrottle)
+        "login_ip": os.getenv("DJANGO_LOGIN_RATE_IP", "30/min"),
+        "login_email": os.getenv("DJANGO_LOGIN_RATE_EMAIL", "10/min"),
+        # 토큰 버킷: "용량/기간" (기간 동안 용량만큼 충전)
+        "login": os.getenv("DJANGO_THROTTLE_LOGIN", "30/min"),
+        "registrations": os.getenv("DJANGO_THROTTLE_REGISTRATIONS", "60/min"),
+        "recommend": os.getenv("DJANGO_THROTTLE_RECOMMEND", "120/min"),
+        "combination": os.getenv("DJANGO_THROTTLE_COMBINATION", "200/min"),
+    },
     "DEFAULT_PAGINATION_CLASS": "config.pagination.DefaultPagination",
     "PAGE_SIZE": 20,
     # 전역 예외 처리 핸들러 설정
@@ -88,6 +187,84 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
 }
 
+# 워커 프로세스당 동시 처리 요청 수 제한 (0: 비활성화), 초과 시 503 Retry-After(초)
+# - gunicorn(config/gunicorn.py)은 스레드 수에 맞춰 기본값을 정함 (GUNICORN_THREADS × 3/4)
+MAX_IN_FLIGHT_REQUESTS = int(os.getenv("DJANGO_MAX_IN_FLIGHT_REQUESTS", "64"))
+LOAD_SHED_RETRY_AFTER = int(os.getenv("DJANGO_LOAD_SHED_RETRY_AFTER", "1"))
+
+# 조합 추천 요청의 최대 액티비티 수 (조합 수 최대 2^N - 1)
+COMBINATION_MAX_ACTIVITIES = int(os.getenv("DJANGO_COMBINATION_MAX_ACTIVITIES", "20"))
+# 조합 추천 프로세스 풀 (액티비티 수 임계값 이상일 때 사용, 탐색 전체 제한 시간(초), 동시 탐색 수 제한)
+COMBINATION_POOL_THRESHOLD = int(os.getenv("DJANGO_COMBINATION_POOL_THRESHOLD", "12"))
+COMBINATION_POOL_WORKERS = int(os.getenv("DJANGO_COMBINATION_POOL_WORKERS", "2"))
+COMBINATION_TASK_TIMEOUT = float(os.getenv("DJANGO_COMBINATION_TASK_TIMEOUT", "10"))
+COMBINATION_POOL_MAX_PENDING = int(os.getenv("DJANGO_COMBINATION_POOL_MAX_PENDING", "4"))
+
+# 신청 일괄 완료 요청의 종류(시험/수업)별 최대 ID 수
+BATCH_COMPLETE_MAX_IDS = int(os.getenv("DJANGO_BATCH_COMPLETE_MAX_IDS", "1000"))
+# 결제 일괄 취소 요청의 최대 결제 ID 수
+BATCH_CANCEL_MAX_IDS = int(os.getenv("DJANGO_BATCH_CANCEL_MAX_IDS", "100"))
+
+# 요청별 SQL 계측 (config.middleware.QueryInstrumentationMiddleware)
+SQL_INSTRUMENTATION_ENABLED = os.getenv("DJANGO_SQL_INSTRUMENTATION", "true").lower() == "true"
+SQL_QUERY_BUDGET_DEFAULT = int(os.getenv("DJANGO_SQL_QUERY_BUDGET", "20"))
+# URL name별 쿼리 예산 (뷰 클래스의 query_budget 속성이 우선)
+SQL_QUERY_BUDGETS = {
+    "tests-list": 4,
+    "courses-list": 4,
+    "recommend_course": 6,
+    "me_payments": 6,
+    "activities": 2,
+    "bulk_complete_registrations": 6,
+    "cancel_payment": 6,
+    "bulk_cancel_payments": 10,
+}
+# 같은 SQL이 이 횟수 이상 반복되면 N+1 의심
+SQL_REPEAT_THRESHOLD = int(os.getenv("DJANGO_SQL_REPEAT_THRESHOLD", "5"))
+
+# JSON 요청 본문 최대 크기 (바이트, 초과 시 413)
+MAX_JSON_BODY_SIZE = int(os.getenv("DJANGO_MAX_JSON_BODY_SIZE", str(2_621_440)))
+
+# API 스키마 (/swagger.json, /swagger.yaml)
+# file: python manage.py generate_schema 로 미리 생성한 파일 제공, dynamic: 요청마다 생성
+SCHEMA_MODE = os.getenv("DJANGO_SCHEMA_MODE", "file")
+SCHEMA_DIR = os.getenv("DJANGO_SCHEMA_DIR", str(BASE_DIR / "schema"))
+SCHEMA_CACHE_SECONDS = int(os.getenv("DJANGO_SCHEMA_CACHE_SECONDS", "300"))
+# 미리 생성하는 스키마의 scheme/host (예: https://api.example.com, 비어 있으면 생략)
+SCHEMA_URL = os.getenv("DJANGO_SCHEMA_URL", "")
+
+# /metrics 접근 토큰 (비어 있으면 METRICS_ALLOWED_IPS에서 온 요청만 허용, 그 외 403)
+METRICS_TOKEN = os.getenv("DJANGO_METRICS_TOKEN", "")
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv("DJANGO_METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",")
+                       if ip.strip()]
+
+# 관리자 요청 프로파일링 (X-Profile: 1 또는 ?profile=1, config.profiling)
+PROFILING_ENABLED = os.getenv("DJANGO_PROFILING", "true").lower() == "true"
+PROFILING_DIR = os.getenv("DJANGO_PROFILING_DIR", str(BASE_DIR / "logs" / "profiles"))
+PROFILING_MAX_FILES = int(os.getenv("DJANGO_PROFILING_MAX_FILES", "50"))
+
+# 로그인 비밀번호 검증 풀 (워커 스레드 수, 대기열 크기, 대기 시간(초))
+LOGIN_HASH_WORKERS = int(os.getenv("DJANGO_LOGIN_HASH_WORKERS", "2"))
+LOGIN_HASH_QUEUE = int(os.getenv("DJANGO_LOGIN_HASH_QUEUE", "8"))
+LOGIN_HASH_TIMEOUT = float(os.getenv("DJANGO_LOGIN_HASH_TIMEOUT", "5"))
+
+# CachedJWTAuthentication 사용자 캐시 설정 (TTL: 초)
+JWT_USER_CACHE = {
+    "MAX_SIZE": int(os.getenv("DJANGO_JWT_USER_CACHE_SIZE", "1024")),
+    "TTL": int(os.getenv("DJANGO_JWT_USER_CACHE_TTL", "30")),
+}
+
+# 태그 사전(api.tags) 프로세스 내 캐시 (TTL: 초, 다른 워커의 태그 변경 반영 주기)
+TAG_CACHE = {
+    "TTL": int(os.getenv("DJANGO_TAG_CACHE_TTL", "300")),
+}
+
+# 로그 (요청 스레드는 큐에 넣기만 하고 콘솔/파일 기록은 리스너 스레드에서 수행: config.log)
+LOG_FORMAT = os.getenv("DJANGO_LOG_FORMAT", "verbose")  # verbose | json
+LOG_QUEUE_SIZE = int(os.getenv("DJANGO_LOG_QUEUE_SIZE", "10000"))
+# 대량으로 발생하는 INFO 로그(요청별 SQL 요약 등) 샘플링 비율 (WARNING 이상은 항상 기록)
+LOG_INFO_SAMPLE_RATE = float(os.getenv("DJANGO_LOG_INFO_SAMPLE_RATE", "1.0"))
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -100,38 +277,47 @@ LOGGING = {
             'format': '{levelname} {message}',
             'style': '{',
         },
+        'json': {
+            '()': 'config.log.JsonFormatter',
+        },
     },
-    'handlers': {
-        'console': {
-            'level': 'INFO',
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
+    'filters': {
+        'sampled': {
+            '()': 'config.log.SamplingFilter',
+            'rate': LOG_INFO_SAMPLE_RATE,
+            'names': ['api.sql', 'django.db.backends'],
         },
-        'file': {
-            'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': 'logs/django.log',
-            'formatter': 'verbose',
+    },
+    'handlers': {
+        'queue': {
+            '()': 'config.log.NonBlockingQueueHandler',
+            'level': 'DEBUG',
+            'filename': str(BASE_DIR / 'logs' / 'django.log'),
+            'queue_size': LOG_QUEUE_SIZE,
+            'formatter': LOG_FORMAT,
+            'filters': ['sampled'],
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
+        # SQL 문장 로그는 비용이 크므로 필요할 때만 DJANGO_DB_LOG_LEVEL=DEBUG로 활성화
+        # (요청별 요약은 api.sql 로그로 기록)
         'django.db.backends': {
-            'handlers': ['console'],
-            'level': 'DEBUG',
-            # 'propagate': False,
+            'handlers': ['queue'],
+            'level': os.getenv("DJANGO_DB_LOG_LEVEL", "INFO"),
+            'propagate': False,
         },
         'api': {
-            'handlers': ['console', 'file'],
-            'level': 'INFO',
+            'handlers': ['queue'],
+            'level': os.getenv("DJANGO_API_LOG_LEVEL", "INFO"),
             'propagate': False,
         },
     },
@@ -0,0 +1,67 @@
+from __future__ import annotations
+import time
+from django.core.cache import cache as default_cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    비용 가중 토큰 버킷 제한 (사용자 × 엔드포인트 단위)
+    - 뷰의 throttle_scope로 버킷을 구분하고, 요청 비용은 get_throttle_cost(request) 또는 throttle_cost로 결정
+    - rate "N/period": 버킷 용량 N, period 동안 N개 충전
+    - 버킷 상태는 Django 캐시에 저장 (워커 간 공유하려면 공유 캐시 백엔드 사용)
+    - get/set 사이의 경합은 허용 (엄격한 원자성 대신 요청 경로 비용을 최소화)
+    """
+    cache = default_cache
+    cache_format = "throttle_bucket_%(scope)s_%(ident)s"
+    THROTTLE_RATES = api_settings.DEFAULT_THROTTLE_RATES
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    @staticmethod
+    def parse_rate(rate: str) -> tuple[float, float]:
+        """'60/min' -> (용량 60, 초당 충전량 1.0)"""
+        num, period = rate.split("/")
+        capacity = float(num)
+        duration = {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+        return capacity, capacity / duration
+
+    def get_cost(self, request, view) -> float:
+        if hasattr(view, "get_throttle_cost"):
+            return view.get_throttle_cost(request)
+        return getattr(view, "throttle_cost", 1)
+
+    def get_cache_key(self, request, view, scope: str) -> str:
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": scope, "ident": ident}
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope or scope not in self.THROTTLE_RATES:
+            return True
+
+        capacity, refill_rate = self.parse_rate(self.THROTTLE_RATES[scope])
+        cost = min(self.get_cost(request, view), capacity)
+        key = self.get_cache_key(request, view, scope)
+        now = time.time()
+
+        tokens, updated_at = self.cache.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+        # 버킷이 가득 찰 때까지 걸리는 시간만큼만 보관
+        timeout = int(capacity / refill_rate) + 1
+
+        if tokens < cost:
+            self.wait_seconds = (cost - tokens) / refill_rate
+            self.cache.set(key, (tokens, now), timeout)
+            return False
+
+        self.cache.set(key, (tokens - cost, now), timeout)
+        return True
+
+    def wait(self):
+        return self.wait_seconds
@@ -1,24 +1,21 @@
 from django.urls import path, include, re_path
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Exam/Course API",
-        default_version="v1",
-        description="시험/수업 신청 및 결제 API",
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
+from .db_pool import DBPoolStatsView
+from .metrics import metrics_view
+from .profiling import ProfileView
+from .schema import schema_file_view
 
 urlpatterns = [
     path("api/", include("api.urls")),
-    # 문서 스키마(JSON/YAML)만 제공
+    # Prometheus 지표 (전체 워커 합산)
+    path("metrics", metrics_view, name="metrics"),
+    # 워커 프로세스별 DB 연결 풀 통계 (관리자 전용)
+    path("metrics/db-pool", DBPoolStatsView.as_view(), name="db_pool_stats"),
+    # 저장된 요청 프로파일 요약 (관리자 전용)
+    path("metrics/profiles/<str:request_id>", ProfileView.as_view(), name="profile_detail"),
+    # 문서 스키마(JSON/YAML)만 제공 (generate_schema 명령으로 미리 생성한 파일, config.schema)
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
-        schema_view.without_ui(cache_timeout=0),
+        schema_file_view,
         name="schema-json",
     ),
 ]
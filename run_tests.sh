@@ -21,5 +21,9 @@ echo ""
 echo "2. API 기능 테스트 실행..."
 python manage.py test api.tests.test_api -v 2
 
+echo ""
+echo "3. 잔여석 동시성 테스트 실행 (파일 SQLite 테스트 DB)..."
+DJANGO_DB_TEST_NAME=test_seats.sqlite3 python manage.py test api.tests.test_seats -v 2
+
 echo ""
 echo "=== 모든 테스트 완료 ==="